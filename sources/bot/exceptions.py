@@ -11,5 +11,27 @@ class SpreadsheetHandlerException(ProctoringBotException):
     """Base exception type for spreadsheet handlers."""
 
 
+class SpreadsheetRequestException(SpreadsheetHandlerException):
+    """Raised when spreadsheet service responds with error status."""
+
+    def __init__(self, status: int, reason: str, retry_after: str = None):
+        super().__init__(f"Spreadsheet request failed with status {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class UnpublishableTestException(SpreadsheetHandlerException):
+    """Raised when loaded test can't be sent to students."""
+
+
 class InvalidSpreadsheetAttributeException(ProctoringBotException):
     """Raised when passed invalid attributes to spreadsheet handler method"""
+
+
+class SpreadsheetUnavailableException(SpreadsheetHandlerException):
+    """Raised when spreadsheet calls are rejected because spreadsheet service is considered unavailable."""
+
+
+class SpreadsheetRequestCancelledException(SpreadsheetHandlerException):
+    """Raised when spreadsheet request isn't made because call which makes it is timed out."""
@@ -0,0 +1,161 @@
+"""
+Messages broadcaster implementation module.
+"""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from aiogram import Bot
+from aiogram.utils.exceptions import NetworkError, RetryAfter, TelegramAPIError
+
+from ..loggers import LogInstaller
+from ..util.token_bucket import TokenBucket
+
+ChatId = Union[int, str]
+
+
+class BroadcastResult:
+    """
+    Broadcast delivery results class implementation.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.delivered: List[ChatId] = []
+        self.failed: Dict[ChatId, str] = {}
+
+    @property
+    def done(self) -> int:
+        return len(self.delivered) + len(self.failed)
+
+
+class Broadcaster:
+    """
+    Messages broadcaster class implementation sends message to many chats concurrently.
+
+    Note: Messages of all broadcasts are sent under one token bucket by Telegram limit of messages per second. If
+    Telegram asks to retry after flood control timeout, then all broadcasts are paused for it. Network errors are
+    retried with exponential backoff and full jitter, other errors fail delivery to chat at once.
+    """
+
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    messages_per_second = 25
+    _bucket = TokenBucket(messages_per_second, 1)
+    _paused_until = 0.0
+
+    def __init__(
+        self,
+        bot: Bot,
+        concurrency: int = 10,
+        max_retries: int = 3,
+        base_delay: float = 1,
+        max_delay: float = 30,
+        progress_interval: float = 2,
+    ):
+        self._bot = bot
+        self._concurrency = concurrency
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._progress_interval = progress_interval
+
+    @classmethod
+    async def _acquire(cls) -> None:
+        while True:
+            delay = max(cls._paused_until - time.monotonic(), cls._bucket.take())
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    @classmethod
+    def _pause(cls, timeout: float) -> None:
+        cls._paused_until = max(cls._paused_until, time.monotonic() + timeout)
+        cls._bucket.drain()
+
+    async def _send(self, chat_id: ChatId, result: BroadcastResult, message: dict) -> None:
+        error = None
+        for attempt in range(self._max_retries + 1):
+            await self._acquire()
+            try:
+                await self._bot.send_message(chat_id=chat_id, **message)
+                result.delivered.append(chat_id)
+                return
+            except RetryAfter as retry_error:
+                error = retry_error
+                self._pause(retry_error.timeout)
+            except (NetworkError, asyncio.TimeoutError) as network_error:
+                error = network_error
+                await asyncio.sleep(random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt)))
+            except TelegramAPIError as api_error:
+                error = api_error
+                break
+
+        self._logger.warning(f"Unable to send message to {chat_id}: {error}")
+        result.failed[chat_id] = str(error)
+
+    async def _work(self, chats: asyncio.Queue, result: BroadcastResult, message: dict) -> None:
+        while not chats.empty():
+            chat_id = chats.get_nowait()
+            try:
+                await self._send(chat_id, result, message)
+            except Exception as error:
+                self._logger.error(f"Unable to send message to {chat_id}: {error}")
+                result.failed[chat_id] = str(error)
+
+    async def _report(self, result: BroadcastResult, on_progress: Callable[[BroadcastResult], Awaitable]) -> None:
+        try:
+            await on_progress(result)
+        except TelegramAPIError as error:
+            self._logger.warning(f"Unable to report broadcast progress: {error}")
+
+    async def _report_periodically(self, result: BroadcastResult, on_progress: Callable[[BroadcastResult], Awaitable]):
+        reported = -1
+        while True:
+            await asyncio.sleep(self._progress_interval)
+            if result.done != reported:
+                reported = result.done
+                await self._report(result, on_progress)
+
+    async def broadcast(
+        self,
+        chat_ids: Iterable[ChatId],
+        on_progress: Optional[Callable[[BroadcastResult], Awaitable]] = None,
+        **message,
+    ) -> BroadcastResult:
+        """
+        Sends message to chats.
+
+        :param chat_ids: Chats ids or usernames
+        :type chat_ids: :obj:`Iterable[Union[int, str]]`
+
+        :param on_progress: Coroutine function, which is given results in progress interval and when broadcast ends
+        :type on_progress: :obj:`Optional[Callable[[BroadcastResult], Awaitable]]`
+
+        :param message: Send message arguments, for example text and reply markup
+        :type message: :obj:`dict`
+
+        :return: Returns delivery results.
+        :rtype: :obj:`BroadcastResult`
+        """
+        chats = asyncio.Queue()
+        for chat_id in dict.fromkeys(chat_ids):
+            chats.put_nowait(chat_id)
+        result = BroadcastResult(chats.qsize())
+
+        reporter = None
+        if on_progress is not None:
+            reporter = asyncio.ensure_future(self._report_periodically(result, on_progress))
+
+        try:
+            workers = [self._work(chats, result, message) for _ in range(min(self._concurrency, result.total))]
+            await asyncio.gather(*workers)
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+                await asyncio.gather(reporter, return_exceptions=True)
+
+        if on_progress is not None:
+            await self._report(result, on_progress)
+        return result
@@ -93,8 +93,8 @@ class AuthHandlersChain(HandlersChain):
         await AuthStates.next()
 
         data = await state.get_data()
-        data["auth"]["group"] = message.text
-        await state.update_data(auth=data["auth"])
+        auth_data = dict(data["auth"], group=message.text)
+        await state.update_data(auth=auth_data)
 
         await message.answer("Укажите номер подгруппы.")
 
@@ -116,8 +116,7 @@ class AuthHandlersChain(HandlersChain):
         await AuthStates.next()
 
         data = await state.get_data()
-        auth_data = data["auth"]
-        auth_data["subgroup"] = message.text
+        auth_data = dict(data["auth"], subgroup=message.text)
         await state.update_data(auth=auth_data)
 
-        await message.answer(f"Спасибо за регистрацию.\n\n{MainHandlersChain.get_info(data)}")
+        await message.answer(f"Спасибо за регистрацию.\n\n{MainHandlersChain.get_info(dict(data, auth=auth_data))}")
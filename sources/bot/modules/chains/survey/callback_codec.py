@@ -0,0 +1,167 @@
+"""
+Survey callback data codec implementation module.
+"""
+import hashlib
+import threading
+from typing import Dict, NamedTuple, Optional
+
+from ....storage.spreadsheet.util.test_to_json_file import JsonTestFileUtil
+
+
+class SurveyCallback(NamedTuple):
+    """
+    Decoded survey callback data.
+    """
+
+    kind: str
+    test_name: str
+    question_number: int
+    answer_index: int
+
+
+class SurveyCallbackCodec:
+    """
+    Survey callback data codec class implementation.
+
+    Note: Tests names are given short ids, so callback data doesn't depend on test name length. Callback data has
+    fixed format: kind letter, 6 hexadecimal digits of test id, 3 of question number and 2 of answer index, for
+    example `Q00000c00102`. Test id is taken from hash of test name, so it is the same after restart. Saved tests are
+    registered once on first use, so ids of tests loaded before restart are resolved without reading tests directory
+    again, and tests loaded later are registered by their checks. Test, which id collides with id of another test,
+    isn't encoded.
+    """
+
+    start = "S"
+    answer = "Q"
+
+    _length = 12
+    _digits = frozenset("0123456789abcdef")
+    _max_values = (16**6, 16**3, 16**2)
+    _names: Optional[Dict[int, str]] = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def _hash(cls, test_name: str) -> int:
+        digest = hashlib.sha1(test_name.encode("utf-8")).digest()
+        return int.from_bytes(digest, "big") % cls._max_values[0]
+
+    @classmethod
+    def _get_names(cls) -> Dict[int, str]:
+        with cls._lock:
+            if cls._names is None:
+                names = {}
+                for test_name in sorted(JsonTestFileUtil.get_test_names()):
+                    names.setdefault(cls._hash(test_name), test_name)
+                cls._names = names
+            return cls._names
+
+    @classmethod
+    def _register(cls, test_name: str) -> str:
+        test_id = cls._hash(test_name)
+        with cls._lock:
+            return cls._get_names().setdefault(test_id, test_name)
+
+    @classmethod
+    def get_test_id(cls, test_name: str) -> int:
+        """
+        Gets test id, test is registered if it isn't registered yet.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :return: Returns test id.
+        :rtype: :obj:`int`
+
+        :raises ValueError: If test id collides with id of another registered test.
+        """
+        registered_name = cls._register(test_name)
+        if registered_name != test_name:
+            raise ValueError(f"Survey callback id of test {test_name} collides with test {registered_name}")
+        return cls._hash(test_name)
+
+    @classmethod
+    def check_test(cls, test_name: str, questions_count: int) -> None:
+        """
+        Checks whether callbacks of test questions can be encoded, test is registered if they can.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :param questions_count: Test questions count
+        :type questions_count: :obj:`int`
+
+        :raises ValueError: If test has too many questions or its id collides with id of another registered test.
+        """
+        if questions_count >= cls._max_values[1]:
+            raise ValueError(f"Test {test_name} has more than {cls._max_values[1] - 1} questions")
+        cls.get_test_id(test_name)
+
+    @classmethod
+    def _get_test_name(cls, test_id: int) -> Optional[str]:
+        with cls._lock:
+            return cls._get_names().get(test_id)
+
+    @classmethod
+    def encode(cls, kind: str, test_name: str, question_number: int = 0, answer_index: int = 0) -> str:
+        """
+        Encodes survey callback data.
+
+        :param kind: Callback kind, start of test or answer to question
+        :type kind: :obj:`str`
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :param question_number: Number of question to send
+        :type question_number: :obj:`int`
+
+        :param answer_index: Index of answer to previous question
+        :type answer_index: :obj:`int`
+
+        :return: Returns callback data.
+        :rtype: :obj:`str`
+
+        :raises ValueError: If kind is unknown, values don't fit callback data or test id collides.
+        """
+        values = (cls.get_test_id(test_name), question_number, answer_index)
+        if kind not in (cls.start, cls.answer) or any(not 0 <= v < m for v, m in zip(values, cls._max_values)):
+            raise ValueError(f"Unable to encode survey callback: {kind}, {test_name}, {question_number}")
+
+        return f"{kind}{values[0]:06x}{question_number:03x}{answer_index:02x}"
+
+    @classmethod
+    def is_survey_callback(cls, data: Optional[str]) -> bool:
+        """
+        Checks whether callback data has survey callback format.
+
+        :param data: Callback data
+        :type data: :obj:`Optional[str]`
+
+        :return: Returns whether callback data is survey one.
+        :rtype: :obj:`bool`
+        """
+        return (
+            data is not None
+            and len(data) == cls._length
+            and data[0] in (cls.start, cls.answer)
+            and cls._digits.issuperset(data[1:])
+        )
+
+    @classmethod
+    def decode(cls, data: Optional[str]) -> Optional[SurveyCallback]:
+        """
+        Decodes survey callback data.
+
+        :param data: Callback data
+        :type data: :obj:`Optional[str]`
+
+        :return: Returns decoded callback or None if callback data has wrong format or unknown test.
+        :rtype: :obj:`Optional[SurveyCallback]`
+        """
+        if not cls.is_survey_callback(data):
+            return None
+
+        test_name = cls._get_test_name(int(data[1:7], 16))
+        if test_name is None:
+            return None
+        return SurveyCallback(data[0], test_name, int(data[7:10], 16), int(data[10:], 16))
@@ -0,0 +1,121 @@
+"""
+Compiled survey implementation module.
+"""
+import threading
+from collections import OrderedDict
+from typing import Mapping, Sequence, Tuple
+
+from aiogram.types import InlineKeyboardMarkup
+
+from ....modules.chains.survey.callback_codec import SurveyCallbackCodec
+from ....modules.keyboard.keyboard import KeyboardBuilder
+from ....storage.spreadsheet.util.test_to_json_file import JsonTestFileUtil
+
+
+class CompiledQuestion:
+    """
+    Compiled survey question class implementation.
+
+    Note: Keyboard is built once and shared by all students, so it must not be changed.
+    """
+
+    __slots__ = ("text", "answers", "correct_index", "keyboard")
+
+    def __init__(self, text: str, answers: Tuple[str, ...], correct_index: int, keyboard: InlineKeyboardMarkup):
+        self.text = text
+        self.answers = answers
+        self.correct_index = correct_index
+        self.keyboard = keyboard
+
+
+class CompiledSurvey:
+    """
+    Compiled survey class implementation keeps survey questions with their answers keyboards.
+
+    Note: Answer callback data has next question number and answer index. Compiled surveys are cached by tests names
+    and versions of their files with bounded size, so changed test is compiled again.
+    """
+
+    __slots__ = ("name", "questions")
+
+    answer_prefix = "ответ"
+    _max_size = 64
+    _cache: OrderedDict = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, name: str, questions: Tuple[CompiledQuestion, ...]):
+        self.name = name
+        self.questions = questions
+
+    @classmethod
+    def compile(cls, name: str, survey: Sequence[Mapping[str, str]]) -> "CompiledSurvey":
+        """
+        Compiles survey questions.
+
+        :param name: Test name
+        :type name: :obj:`str`
+
+        :param survey: Survey questions with text, answers and correct answer column name
+        :type survey: :obj:`Sequence[Mapping[str, str]]`
+
+        :return: Returns compiled survey.
+        :rtype: :obj:`CompiledSurvey`
+        """
+        questions = []
+        for number, question in enumerate(survey):
+            keys = tuple(key for key in question if key.startswith(cls.answer_prefix))
+            answers = tuple(str(question[key]) for key in keys)
+            correct_index = keys.index(question["правильный"]) if question.get("правильный") in keys else -1
+            keyboard = KeyboardBuilder.get_inline_keyboard_markup(
+                [
+                    {answer: SurveyCallbackCodec.encode(SurveyCallbackCodec.answer, name, number + 1, index)}
+                    for index, answer in enumerate(answers)
+                ]
+            )
+            questions.append(CompiledQuestion(str(question["Вопрос"]), answers, correct_index, keyboard))
+
+        return cls(name, tuple(questions))
+
+    @classmethod
+    def get(cls, name: str) -> "CompiledSurvey":
+        """
+        Gets cached compiled survey of saved test, survey is compiled if its version isn't cached yet.
+
+        :param name: Test name
+        :type name: :obj:`str`
+
+        :return: Returns compiled survey.
+        :rtype: :obj:`CompiledSurvey`
+        """
+        version, survey = JsonTestFileUtil.get_versioned_test_from_file(name)
+        key = (name, version)
+        with cls._lock:
+            compiled = cls._cache.get(key)
+            if compiled is not None:
+                cls._cache.move_to_end(key)
+                return compiled
+
+        compiled = cls.compile(name, survey)
+        with cls._lock:
+            cls._cache[key] = compiled
+            cls._cache.move_to_end(key)
+
+            while len(cls._cache) > cls._max_size:
+                cls._cache.popitem(last=False)
+
+        return compiled
+
+    def is_correct(self, question_number: int, answer_index: int) -> bool:
+        """
+        Checks answer of question.
+
+        :param question_number: Question number from zero
+        :type question_number: :obj:`int`
+
+        :param answer_index: Answer index from zero
+        :type answer_index: :obj:`int`
+
+        :return: Returns whether answer is correct.
+        :rtype: :obj:`bool`
+        """
+        return self.questions[question_number].correct_index == answer_index
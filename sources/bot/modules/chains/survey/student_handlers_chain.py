@@ -3,7 +3,8 @@ from aiogram.dispatcher import FSMContext
 from aiogram.dispatcher.filters.state import StatesGroup, State
 
 from ....loggers import LogInstaller
-from ....modules.chains.survey.teacher_handlers_chain import SurveyTeacherKeyboardBuilder
+from ....modules.chains.survey.callback_codec import SurveyCallback, SurveyCallbackCodec
+from ....modules.chains.survey.compiled_survey import CompiledSurvey
 from ....modules.handlers_chain import HandlersChain
 from ....modules.handlers_registrar import HandlersRegistrar as Registrar
 from ....modules.keyboard.keyboard import KeyboardBuilder
@@ -47,29 +48,41 @@ class StudentHandlersChain(HandlersChain):
         await SurveyStudentStates.student_ready_to_pass_test.set()
 
     @staticmethod
-    @Registrar.callback_query_handler(lambda c: c.data, state=SurveyStudentStates.student_ready_to_pass_test)
+    @Registrar.callback_query_handler(
+        lambda c: SurveyCallbackCodec.is_survey_callback(c.data), state=SurveyStudentStates.student_ready_to_pass_test
+    )
     async def passing_test_handler(callback_query: types.CallbackQuery, state: FSMContext):
-        separated_data = callback_query.data.split(";")
-        survey_sheet_name = separated_data[1]
+        callback = SurveyCallbackCodec.decode(callback_query.data)
+        if callback is None:
+            await callback_query.answer("Тест больше недоступен")
+            return
+
+        survey_sheet_name = callback.test_name
         data = await state.get_data()
         tests = data.get("tests")
-        survey = JsonTestFileUtil.get_test_from_file(survey_sheet_name)
+        survey = CompiledSurvey.get(survey_sheet_name)
         if tests is None:
-            await state.update_data(tests={"is_finished": False, "answers": {}, "test_name": survey_sheet_name})
-        question_number = int(separated_data[2])
+            # Test spreadsheet is kept with answers, so result is written to it even after restart.
+            tests = {
+                "is_finished": False,
+                "answers": {},
+                "test_name": survey_sheet_name,
+                "spreadsheet_id": JsonTestFileUtil.get_test_spreadsheet_id(survey_sheet_name),
+            }
+            await state.update_data(tests=tests)
+        question_number = callback.question_number
         # Getting valid answers
-        await state.update_data(
-            tests=StudentHandlersChain._get_valid_answers(
-                separated_data,
-                survey,
-                question_number,
-                tests,
-            )
+        tests = StudentHandlersChain._get_valid_answers(
+            callback,
+            survey,
+            question_number,
+            tests,
         )
+        await state.update_data(tests=tests)
         # Message with Q&A generation
-        if question_number < len(survey):
-            current_question, answers_kb = StudentHandlersChain._get_message(separated_data, survey, question_number)
-            await callback_query.message.edit_text(text=f"{current_question['Вопрос']}", reply_markup=answers_kb)
+        if question_number < len(survey.questions):
+            current_question = survey.questions[question_number]
+            await callback_query.message.edit_text(text=current_question.text, reply_markup=current_question.keyboard)
         # Test is over
         else:
             tests, correct_answers = StudentHandlersChain._get_result(tests)
@@ -79,33 +92,21 @@ class StudentHandlersChain(HandlersChain):
             await callback_query.answer()
 
     @staticmethod
-    def _get_valid_answers(separated_data, survey, question_number, tests):
-        if separated_data[0] == "question":
-            current_question = survey[question_number - 1]
+    def _get_valid_answers(callback: SurveyCallback, survey: CompiledSurvey, question_number, tests):
+        if callback.kind == SurveyCallbackCodec.answer:
             answers = list(tests.get("answers"))
-            is_correct = False
-            if current_question["правильный"] == separated_data[3]:
-                is_correct = True
-            answer = {"Вопрос": str(survey[question_number - 1]["Вопрос"]), "is_correct": is_correct}
+            is_correct = survey.is_correct(question_number - 1, callback.answer_index)
+            answer = {"Вопрос": survey.questions[question_number - 1].text, "is_correct": is_correct}
             answers.append(answer)
-            tests["answers"] = answers
+            tests = dict(tests, answers=answers)
         return tests
 
-    @staticmethod
-    def _get_message(separated_data, survey, question_number):
-        current_question = survey[question_number]
-        answers_kb = SurveyTeacherKeyboardBuilder.get_answers_keyboard(
-            current_question, question_number, separated_data[1]
-        )
-        return current_question, answers_kb
-
     @staticmethod
     def _get_result(tests):
-        tests["is_finished"] = True
+        tests = dict(tests, is_finished=True)
         answers = tests.get("answers")
         correct_answers = 0
         for answer in answers:
             if answer["is_correct"]:
                 correct_answers += 1
-        tests["answers"] = answers
         return tests, correct_answers
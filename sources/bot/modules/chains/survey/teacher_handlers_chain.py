@@ -7,6 +7,9 @@ from aiogram.dispatcher.filters.state import StatesGroup, State
 from aiogram.types import InlineKeyboardMarkup
 
 from ....loggers import LogInstaller
+from ....modules.broadcaster import Broadcaster, BroadcastResult
+from ....modules.chains.survey.callback_codec import SurveyCallbackCodec
+from ....modules.chains.survey.compiled_survey import CompiledSurvey
 from ....modules.handlers_chain import HandlersChain
 from ....modules.handlers_registrar import HandlersRegistrar as Registrar
 from ....modules.keyboard.keyboard import KeyboardBuilder
@@ -33,22 +36,11 @@ class SurveyTeacherKeyboardBuilder:
         return KeyboardBuilder.get_inline_keyboard_markup(
             [
                 {
-                    "Начать тест": f"start;{survey_sheet_name};0",
+                    "Начать тест": SurveyCallbackCodec.encode(SurveyCallbackCodec.start, survey_sheet_name),
                 }
             ]
         )
 
-    @staticmethod
-    def get_answers_keyboard(question: dict, question_number: int, survey_sheet_name: str):
-        answers = []
-        keys = list(question.keys())
-        next_question_number = question_number + 1
-        for answer in keys:
-            if answer.startswith("ответ"):
-                answers.append({f"{question[answer]}": f"question;{survey_sheet_name};{next_question_number};{answer}"})
-
-        return KeyboardBuilder.get_inline_keyboard_markup(answers)
-
     @staticmethod
     def get_start_survey_keyboard():
         return KeyboardBuilder.get_inline_keyboard_markup(
@@ -82,7 +74,17 @@ class SurveyTeacherHandlersChain(HandlersChain):
             await SurveyTeacherStates.starting_survey.set()
             await state.update_data(tests={"test_link": message.text})
             data = await state.get_data()
-            await SurveyTeacherHandlersChain._check_test(data, message)
+            if data["tests"].get("error"):
+                # Test, which can't be sent to students, isn't saved, so another link is waited.
+                SurveyTeacherHandlersChain._logger.warning(data["tests"]["error"])
+                await SurveyTeacherStates.waiting_for_link.set()
+                await message.answer(
+                    "Тест нельзя отправить студентам: в нем больше 4095 вопросов или его не удается отличить "
+                    "от другого теста. Сократите тест или переименуйте его лист и отправьте ссылку еще раз",
+                    reply_markup=SurveyTeacherKeyboardBuilder.get_cancel_survey_keyboard(),
+                )
+            else:
+                await SurveyTeacherHandlersChain._check_test(data, message)
         else:
             await message.answer(
                 "Неправильная ссылка, попробуйте еще раз",
@@ -106,12 +108,11 @@ class SurveyTeacherHandlersChain(HandlersChain):
     @staticmethod
     async def _check_test(data, message):
         _, tests_data, test_name = SurveyTeacherHandlersChain._parse_data(data)
-        test = tests_data.get("test")
+        test = CompiledSurvey.compile(test_name, tests_data.get("test"))
         question_number = 0
-        for question in test:
-            answers_kb = SurveyTeacherKeyboardBuilder.get_answers_keyboard(question, question_number, test_name)
+        for question in test.questions:
             question_number += 1
-            await message.answer(f"{question['Вопрос']}", reply_markup=answers_kb)
+            await message.answer(question.text, reply_markup=question.keyboard)
         await message.answer(
             f"Выведено {question_number} вопросов\n" f"Отправить студентам?",
             reply_markup=SurveyTeacherKeyboardBuilder.get_start_survey_keyboard(),
@@ -120,19 +121,28 @@ class SurveyTeacherHandlersChain(HandlersChain):
     @staticmethod
     async def _send_test(data, message):
         students, _, test_name = SurveyTeacherHandlersChain._parse_data(data)
-        student_count = 0
-        for student in students:
-            await message.bot.send_message(
-                text="Доступен новый тест.\n" "Чтобы приступить, нажмите кнопку ниже",
-                reply_markup=SurveyTeacherKeyboardBuilder.get_student_start_keyboard(test_name),
-                chat_id=student,
-            )
-            student_count += 1
-        await message.edit_text(f"Опрос отправлен {student_count} студентам")
+
+        async def report_progress(result: BroadcastResult):
+            if result.done < result.total:
+                await message.edit_text(f"Опрос отправляется: {result.done} из {result.total}")
+            elif result.failed:
+                await message.edit_text(
+                    f"Опрос отправлен {len(result.delivered)} студентам, не доставлен {len(result.failed)}"
+                )
+            else:
+                await message.edit_text(f"Опрос отправлен {len(result.delivered)} студентам")
+
+        await Broadcaster(message.bot).broadcast(
+            students,
+            report_progress,
+            text="Доступен новый тест.\n" "Чтобы приступить, нажмите кнопку ниже",
+            reply_markup=SurveyTeacherKeyboardBuilder.get_student_start_keyboard(test_name),
+        )
 
     @staticmethod
     def _parse_data(data):
-        students = data.get("students")
         tests = data.get("tests")
+        # Students usernames are received with test, see SpreadsheetStorage._receive_test.
+        students = tests.get("students")
         test_name = tests.get("test_name")
         return students, tests, test_name
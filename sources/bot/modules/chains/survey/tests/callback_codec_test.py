@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .....storage.spreadsheet.util.test_to_json_file import JsonTestFileUtil
+from ..callback_codec import SurveyCallback, SurveyCallbackCodec
+
+
+class TestSurveyCallbackCodec(unittest.TestCase):
+    def setUp(self):
+        # Saved tests are kept in surveys directory of working directory.
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs("surveys")
+
+        names = mock.patch.object(SurveyCallbackCodec, "_names", None)
+        names.start()
+        self.addCleanup(names.stop)
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+
+    def test_encode_and_decode(self):
+        data = SurveyCallbackCodec.encode(SurveyCallbackCodec.answer, "test1", 2, 1)
+
+        self.assertEqual(len(data), 12)
+        self.assertEqual(SurveyCallbackCodec.decode(data), SurveyCallback(SurveyCallbackCodec.answer, "test1", 2, 1))
+
+    def test_decode_after_restart(self):
+        JsonTestFileUtil.save_test("test1", [{"Вопрос": "question"}], "spreadsheet1")
+        data = SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test1")
+        unknown_data = SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test2")
+
+        with mock.patch.object(SurveyCallbackCodec, "_names", None):
+            self.assertEqual(SurveyCallbackCodec.decode(data).test_name, "test1")
+            with mock.patch.object(JsonTestFileUtil, "get_test_names") as get_test_names:
+                self.assertIsNone(SurveyCallbackCodec.decode(unknown_data))
+                self.assertIsNone(SurveyCallbackCodec.decode(unknown_data))
+            get_test_names.assert_not_called()
+
+    def test_keep_id_after_restart(self):
+        data = SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test1")
+
+        with mock.patch.object(SurveyCallbackCodec, "_names", None):
+            self.assertEqual(SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test1"), data)
+
+    def test_reject_colliding_test(self):
+        SurveyCallbackCodec.get_test_id("test2")
+        SurveyCallbackCodec._names[SurveyCallbackCodec._hash("test1")] = "test2"
+
+        with self.assertRaises(ValueError):
+            SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test1")
+        with self.assertRaises(ValueError):
+            SurveyCallbackCodec.check_test("test1", 1)
+
+    def test_reject_too_long_test(self):
+        with self.assertRaises(ValueError):
+            SurveyCallbackCodec.check_test("test1", 4096)
+        SurveyCallbackCodec.check_test("test1", 4095)
+
+    def test_decode_saved_test_with_spreadsheet_like_name(self):
+        JsonTestFileUtil.save_test("test1.spreadsheet", [{"Вопрос": "question"}], "spreadsheet1")
+        data = SurveyCallbackCodec.encode(SurveyCallbackCodec.start, "test1.spreadsheet")
+
+        with mock.patch.object(SurveyCallbackCodec, "_names", None):
+            self.assertEqual(SurveyCallbackCodec.decode(data).test_name, "test1.spreadsheet")
+        self.assertEqual(JsonTestFileUtil.get_test_spreadsheet_id("test1.spreadsheet"), "spreadsheet1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+from .....storage.spreadsheet.util.survey_cache import SurveyCache
+from .....storage.spreadsheet.util.test_to_json_file import JsonTestFileUtil
+from ..callback_codec import SurveyCallbackCodec
+from ..compiled_survey import CompiledSurvey
+
+
+class TestCompiledSurvey(unittest.TestCase):
+    def setUp(self):
+        # Saved tests are kept in surveys directory of working directory.
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs("surveys")
+
+        for patch in (
+            mock.patch.object(SurveyCallbackCodec, "_names", None),
+            mock.patch.object(JsonTestFileUtil, "_cache", SurveyCache()),
+            mock.patch.object(CompiledSurvey, "_cache", OrderedDict()),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+
+    def test_get_cached_survey(self):
+        JsonTestFileUtil.save_test("test1", [{"Вопрос": "question", "ответ1": "answer", "правильный": "ответ1"}])
+        survey = CompiledSurvey.get("test1")
+
+        with mock.patch.object(CompiledSurvey, "compile") as compile_survey:
+            self.assertIs(CompiledSurvey.get("test1"), survey)
+        compile_survey.assert_not_called()
+        self.assertTrue(survey.is_correct(0, 0))
+
+    def test_compile_changed_survey(self):
+        JsonTestFileUtil.save_test("test1", [{"Вопрос": "question", "ответ1": "answer", "правильный": "ответ1"}])
+        survey = CompiledSurvey.get("test1")
+        version, _ = JsonTestFileUtil.get_versioned_test_from_file("test1")
+        JsonTestFileUtil._cache.put("test1", [{"Вопрос": "question2", "ответ1": "answer"}], version + 1)
+
+        changed_survey = CompiledSurvey.get("test1")
+        self.assertIsNot(changed_survey, survey)
+        self.assertEqual(changed_survey.questions[0].text, "question2")
+
+
+if __name__ == "__main__":
+    unittest.main()
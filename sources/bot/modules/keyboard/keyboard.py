@@ -1,14 +1,30 @@
 """
 Keyboard builder implementation module.
 """
-from typing import List, Dict
+import functools
+from typing import Any, Dict, List, Tuple
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
+class SharedInlineKeyboardMarkup(InlineKeyboardMarkup):
+    """
+    Shared inline keyboard markup class implementation, which is converted for request once.
+
+    Note: Markup is shared by all chats, so it must not be changed.
+    """
+
+    def to_python(self) -> Dict[str, Any]:
+        if getattr(self, "_python", None) is None:
+            self._python = super().to_python()
+        return self._python
+
+
 class KeyboardBuilder:
     """
     Keyboard builder class implementation.
+
+    Note: Keyboards are cached by their buttons with bounded size, so every distinct keyboard is built once.
     """
 
     @staticmethod
@@ -22,12 +38,21 @@ class KeyboardBuilder:
         :return: Returns inline keyboard markup instance.
         :rtype: :obj:`InlineKeyboardMarkup`
         """
+        return KeyboardBuilder._build_inline_keyboard_markup(
+            tuple(tuple((key, str(group.get(key))) for key in group) for group in buttons)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _build_inline_keyboard_markup(buttons: Tuple[Tuple[Tuple[str, str], ...], ...]) -> InlineKeyboardMarkup:
         keyboards = []
         keyboard_group = []
         for group in buttons:
-            for key in group:
-                keyboard_group.append(InlineKeyboardButton(text=key, callback_data=str(group.get(key))))
+            for key, callback_data in group:
+                keyboard_group.append(InlineKeyboardButton(text=key, callback_data=callback_data))
             keyboards.append(keyboard_group)
             keyboard_group = []
 
-        return InlineKeyboardMarkup(inline_keyboard=keyboards)
+        markup = SharedInlineKeyboardMarkup(inline_keyboard=keyboards)
+        markup.to_python()
+        return markup
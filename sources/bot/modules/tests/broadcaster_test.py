@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from aiogram.utils.exceptions import BotBlocked, NetworkError, RetryAfter
+
+from ...util.token_bucket import TokenBucket
+from ..broadcaster import Broadcaster
+
+
+class Bot:
+    def __init__(self, errors: dict = None):
+        self.errors = errors or {}
+        self.sent = []
+        self.sent_at = {}
+        self.sending_count = 0
+        self.max_sending_count = 0
+
+    async def send_message(self, chat_id, **message):
+        self.sending_count += 1
+        self.max_sending_count = max(self.max_sending_count, self.sending_count)
+        try:
+            await asyncio.sleep(0.01)
+            errors = self.errors.get(chat_id)
+            if errors:
+                raise errors.pop(0)
+            self.sent.append((chat_id, message["text"]))
+            self.sent_at[chat_id] = asyncio.get_event_loop().time()
+        finally:
+            self.sending_count -= 1
+
+
+class TestBroadcaster(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Broadcasts share bucket and pause, so every test starts with its own ones.
+        for attribute, value in (("_bucket", TokenBucket(1000, 1)), ("_paused_until", 0.0)):
+            patcher = mock.patch.object(Broadcaster, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_send_concurrently(self):
+        bot = Bot()
+        result = await Broadcaster(bot, concurrency=5).broadcast(range(20), text="text")
+
+        self.assertEqual(sorted(result.delivered), list(range(20)))
+        self.assertEqual(len(bot.sent), 20)
+        self.assertEqual(bot.max_sending_count, 5)
+
+    async def test_pause_on_retry_after(self):
+        bot = Bot({0: [RetryAfter(1)]})
+        loop = asyncio.get_event_loop()
+        started_at = loop.time()
+        result = await Broadcaster(bot, concurrency=2).broadcast(range(4), text="text")
+
+        self.assertEqual(sorted(result.delivered), list(range(4)))
+        self.assertEqual(result.failed, {})
+        # Chat sent together with the throttled one is delivered before flood control, others after its timeout.
+        self.assertLess(bot.sent_at[1] - started_at, 1)
+        self.assertTrue(all(bot.sent_at[chat_id] - started_at >= 1 for chat_id in (0, 2, 3)))
+
+    async def test_report_failed_chats(self):
+        bot = Bot({1: [BotBlocked("Forbidden: bot was blocked by the user")], 2: [NetworkError("error")] * 5})
+        reports = []
+
+        async def on_progress(result):
+            reports.append(result.done)
+
+        result = await Broadcaster(bot, max_retries=1, base_delay=0.01).broadcast(
+            [0, 1, 2, 0], on_progress, text="text"
+        )
+
+        self.assertEqual(result.total, 3)
+        self.assertEqual(result.delivered, [0])
+        self.assertEqual(sorted(result.failed), [1, 2])
+        self.assertEqual(reports, [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
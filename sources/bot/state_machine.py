@@ -23,13 +23,17 @@ class StateMachine(Dispatcher):
             self.middleware.setup(LoggingMiddleware())
 
     async def _shutdown(self):
-        await self.storage.close()
-        await self.storage.wait_closed()
+        # Executor closes storage and waits for its closing after shutdown callbacks.
+        await self.storage.flush()
+
+    @staticmethod
+    async def _on_shutdown(machine: "StateMachine"):
+        await machine._shutdown()
 
     def run(self):
         """
         Run bot state machine with chosen handlers set.
         """
         self._logger.info("State machine initialize...")
-        executor.start_polling(self)
+        executor.start_polling(self, on_shutdown=StateMachine._on_shutdown)
         self._logger.info("State machine shutdown...")
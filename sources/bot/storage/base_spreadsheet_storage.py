@@ -17,6 +17,13 @@ class BaseSpreadsheetStorage(MemoryStorage):
 
     __metaclass__ = ABCMeta
 
+    @abstractmethod
+    async def flush(self):
+        """
+        Writes pending spreadsheet handlers changes.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def visit_auth_handler(self, auth_handler: BaseAuthSpreadsheetHandler):
         """
@@ -0,0 +1,80 @@
+"""
+Storage data getting microbenchmark module.
+
+Compares memory allocated by one student test answer update, which gets user data, adds answer and stores it,
+with deep copies and with read-only snapshots. Run it by `python3 -m sources.bot.storage.benchmarks.snapshot_benchmark`.
+"""
+import copy
+import timeit
+import tracemalloc
+from typing import Tuple
+
+from ..snapshot import Snapshot
+
+
+class SnapshotBenchmark:
+    """
+    Storage data getting microbenchmark class implementation.
+    """
+
+    def __init__(self, questions_count: int = 30, answers_count: int = 30, repeats: int = 1000):
+        self._questions_count = questions_count
+        self._answers_count = answers_count
+        self._repeats = repeats
+
+    def _get_user_data(self) -> dict:
+        test = [
+            {"Вопрос": f"Вопрос {number}", "правильный": "1", "1": "Да", "2": "Нет", "3": "Не знаю"}
+            for number in range(self._questions_count)
+        ]
+        answers = [{"Вопрос": f"Вопрос {number}", "is_correct": True} for number in range(self._answers_count)]
+
+        return {
+            "type": "student",
+            "username": "student",
+            "auth": {"name": "Иванов Иван Иванович", "group": "921701", "subgroup": "1"},
+            "tests": {"is_finished": False, "test_name": "test", "test": test, "answers": answers},
+        }
+
+    @staticmethod
+    def _update_with_copy(user_data: dict) -> None:
+        data = copy.deepcopy(user_data)
+        tests = data["tests"]
+        tests["answers"] = list(tests["answers"]) + [{"Вопрос": "Вопрос", "is_correct": False}]
+        user_data.update(tests=tests)
+
+    @staticmethod
+    def _update_with_snapshot(user_data: dict) -> None:
+        data = {key: Snapshot.freeze(value) for key, value in user_data.items()}
+        tests = dict(
+            data["tests"], answers=list(data["tests"]["answers"]) + [{"Вопрос": "Вопрос", "is_correct": False}]
+        )
+        user_data.update(tests={key: Snapshot.unwrap(value) for key, value in tests.items()})
+
+    def _measure(self, update) -> Tuple[float, float]:
+        allocated_size = 0
+        for _ in range(self._repeats):
+            user_data = self._get_user_data()
+
+            tracemalloc.start()
+            update(user_data)
+            _, peak_size = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            allocated_size += peak_size
+
+        update_time = timeit.timeit(lambda: update(self._get_user_data()), number=self._repeats) / self._repeats
+        update_time -= timeit.timeit(self._get_user_data, number=self._repeats) / self._repeats
+        return allocated_size / self._repeats, update_time
+
+    def run(self) -> None:
+        """
+        Measures both updates and prints allocated bytes and time per update.
+        """
+        for title, update in (("deepcopy", self._update_with_copy), ("snapshot", self._update_with_snapshot)):
+            allocated_size, update_time = self._measure(update)
+            print(f"{title}: {allocated_size:.0f} bytes allocated, {update_time * 1e6:.1f} us per update")
+
+
+if __name__ == "__main__":
+    SnapshotBenchmark().run()
@@ -0,0 +1,76 @@
+"""
+Spreadsheet handler microbenchmark module.
+
+Registers students and looks them up through spreadsheet handler pointed at offline spreadsheet emulator with fixed
+latency, so results don't depend on network. Run it by
+`python3 -m sources.bot.storage.benchmarks.spreadsheet_handler_benchmark`.
+"""
+import time
+from typing import List, Tuple
+
+from ..spreadsheet.emulator.fake_sheets_service import FakeSheetsService
+from ..spreadsheet.request_scheduler import RequestScheduler
+from ..spreadsheet.spreadsheet_handler import SpreadsheetHandler
+from ..spreadsheet.write_behind_queue import WriteBehindQueue
+
+
+class SpreadsheetHandlerBenchmark:
+    """
+    Spreadsheet handler microbenchmark class implementation.
+    """
+
+    _sheet_title = "Студенты"
+
+    def __init__(self, students_count: int = 200, latency: float = 0.005):
+        self._students_count = students_count
+        self._latency = latency
+
+    def _get_handler(self) -> Tuple[FakeSheetsService, SpreadsheetHandler]:
+        service = FakeSheetsService(latency=self._latency)
+        spreadsheet_id = service.add_spreadsheet({self._sheet_title: [["username", "ФИО", "Группа", "Подгруппа"]]})
+        # Emulator has no quotas, so scheduler doesn't limit requests rate.
+        scheduler = RequestScheduler(read_quota=10**6, write_quota=10**6)
+        return service, SpreadsheetHandler("", spreadsheet_id, service=service, scheduler=scheduler)
+
+    def _get_rows(self) -> List[List[str]]:
+        return [[f"student{number}", f"name{number}", "921701", "1"] for number in range(self._students_count)]
+
+    def _add_rows(self, handler: SpreadsheetHandler) -> None:
+        for row in self._get_rows():
+            handler.add_row(self._sheet_title, row)
+
+    def _add_rows_by_queue(self, handler: SpreadsheetHandler) -> None:
+        writer = WriteBehindQueue(handler)
+        for row in self._get_rows():
+            writer.add_row(self._sheet_title, row)
+        writer.close()
+
+    def _get_rows_by_first_element(self, handler: SpreadsheetHandler) -> None:
+        for number in range(0, self._students_count, 10):
+            handler.get_row_by_first_element(self._sheet_title, f"student{number}")
+
+    def run(self) -> None:
+        """
+        Runs every scenario and prints its time and requests count.
+        """
+        scenarios = (
+            ("add rows", self._add_rows),
+            ("add rows by queue", self._add_rows_by_queue),
+            ("get rows by first element", self._get_rows_by_first_element),
+        )
+
+        for title, scenario in scenarios:
+            service, handler = self._get_handler()
+            self._add_rows_by_queue(handler)
+            service.requests_count.clear()
+
+            started_at = time.perf_counter()
+            scenario(handler)
+            duration = time.perf_counter() - started_at
+
+            requests_count = sum(service.requests_count.values())
+            print(f"{title}: {duration * 1000:.0f} ms, {requests_count} requests {dict(service.requests_count)}")
+
+
+if __name__ == "__main__":
+    SpreadsheetHandlerBenchmark().run()
@@ -0,0 +1,84 @@
+"""
+Circuit breaker implementation module.
+"""
+import time
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker class implementation tracks spreadsheet service health by calls results.
+
+    Note: Breaker opens after failure threshold consecutive failed or slower than latency threshold calls and rejects
+    calls for reset timeout seconds. Then it lets one trial call pass: its success closes breaker, its failure opens
+    breaker again. Cancelled trial call lets another trial call pass.
+    """
+
+    closed = "closed"
+    open = "open"
+    half_open = "half-open"
+
+    def __init__(self, failure_threshold: int = 3, latency_threshold: float = 10, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures_count = 0
+        self._opened_at = None
+        self._trial_started = False
+
+    @property
+    def state(self) -> str:
+        """
+        Gets breaker state.
+
+        :return: Returns :attr:`closed`, :attr:`open` or :attr:`half_open`.
+        :rtype: :obj:`str`
+        """
+        if self._opened_at is None:
+            return self.closed
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.open
+        return self.half_open
+
+    def allow(self) -> bool:
+        """
+        Checks whether call may be made now.
+
+        :return: Returns False if breaker is open or trial call is already made.
+        :rtype: :obj:`bool`
+        """
+        state = self.state
+        if state == self.half_open and not self._trial_started:
+            self._trial_started = True
+            return True
+        return state == self.closed
+
+    def record_success(self, duration: float) -> None:
+        """
+        Records successful call.
+
+        :param duration: Call duration in seconds
+        :type duration: :obj:`float`
+        """
+        if duration > self.latency_threshold:
+            self.record_failure()
+            return
+
+        self._failures_count = 0
+        self._opened_at = None
+        self._trial_started = False
+
+    def record_cancelled(self) -> None:
+        """
+        Records call cancelled before its result, so next trial call may be made.
+        """
+        self._trial_started = False
+
+    def record_failure(self) -> None:
+        """
+        Records failed call.
+        """
+        self._failures_count += 1
+        if self._opened_at is not None or self._failures_count >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._trial_started = False
@@ -0,0 +1,33 @@
+"""
+Asynchronous spreadsheet storage factory implementation module.
+"""
+from ..spreadsheet.auth.async_auth_spreadsheet_handler import AsyncAuthSpreadsheetHandler
+from ..spreadsheet.auth.base_async_auth_spreadsheet_handler import BaseAsyncAuthSpreadsheetHandler
+from ..spreadsheet.tests.async_tests_spreadsheet_handler import AsyncTestsSpreadsheetHandler
+from ..spreadsheet.tests.base_async_tests_spreadsheet_handler import BaseAsyncTestsSpreadsheetHandler
+from ..spreadsheet.works.async_works_spreadsheet_handler import AsyncWorksSpreadsheetHandler
+from ..spreadsheet.works.base_async_works_spreadsheet_handler import BaseAsyncWorksSpreadsheetHandler
+from ..factory.spreadsheet_storage_factory import SpreadsheetStorageFactory
+
+
+class AsyncSpreadsheetStorageFactory(SpreadsheetStorageFactory):
+    """
+    Spreadsheet storage factory class implementation with asynchronous spreadsheet handlers.
+
+    Note: Local spreadsheet mirror is kept only by synchronous handlers, so mirror path is ignored.
+    """
+
+    @staticmethod
+    def init_auth_handler(spreadsheet_id, token_file_name, mirror_path=None) -> BaseAsyncAuthSpreadsheetHandler:
+        auth_handler = AsyncAuthSpreadsheetHandler(spreadsheet_id, token_file_name)
+        return auth_handler
+
+    @staticmethod
+    def init_works_handler(spreadsheet_id, token_file_name, mirror_path=None) -> BaseAsyncWorksSpreadsheetHandler:
+        works_handler = AsyncWorksSpreadsheetHandler(spreadsheet_id, token_file_name)
+        return works_handler
+
+    @staticmethod
+    def init_tests_handler(token_file_name) -> BaseAsyncTestsSpreadsheetHandler:
+        tests_handler = AsyncTestsSpreadsheetHandler(token_file_name)
+        return tests_handler
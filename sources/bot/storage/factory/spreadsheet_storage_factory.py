@@ -9,6 +9,7 @@ from ..spreadsheet.tests.tests_spreadsheet_handler import TestsSpreadsheetHandle
 from ..spreadsheet.works.base_works_spreadsheet_handler import BaseWorksSpreadsheetHandler
 from ..spreadsheet.works.works_spreadsheet_handler import WorksSpreadsheetHandler
 from ..spreadsheet_storage import SpreadsheetStorage
+from ..sqlite_spreadsheet_storage import SqliteSpreadsheetStorage
 from ..factory.storage_factory import StorageFactory
 
 
@@ -18,17 +19,19 @@ class SpreadsheetStorageFactory(StorageFactory):
     """
 
     @staticmethod
-    def create_storage() -> BaseSpreadsheetStorage:
-        return SpreadsheetStorage()
+    def create_storage(database_path: str = None, outbox_path: str = None) -> BaseSpreadsheetStorage:
+        if database_path:
+            return SqliteSpreadsheetStorage(database_path, outbox_path=outbox_path)
+        return SpreadsheetStorage(outbox_path=outbox_path)
 
     @staticmethod
-    def init_auth_handler(spreadsheet_id, token_file_name) -> BaseAuthSpreadsheetHandler:
-        auth_handler = AuthSpreadsheetHandler(spreadsheet_id, token_file_name)
+    def init_auth_handler(spreadsheet_id, token_file_name, mirror_path=None) -> BaseAuthSpreadsheetHandler:
+        auth_handler = AuthSpreadsheetHandler(spreadsheet_id, token_file_name, mirror_path)
         return auth_handler
 
     @staticmethod
-    def init_works_handler(spreadsheet_id, token_file_name) -> BaseWorksSpreadsheetHandler:
-        works_handler = WorksSpreadsheetHandler(spreadsheet_id, token_file_name)
+    def init_works_handler(spreadsheet_id, token_file_name, mirror_path=None) -> BaseWorksSpreadsheetHandler:
+        works_handler = WorksSpreadsheetHandler(spreadsheet_id, token_file_name, mirror_path)
         return works_handler
 
     @staticmethod
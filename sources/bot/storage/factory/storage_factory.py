@@ -18,9 +18,18 @@ class StorageFactory:
 
     @staticmethod
     @abstractmethod
-    def create_storage() -> BaseSpreadsheetStorage:
+    def create_storage(database_path: str = None, outbox_path: str = None) -> BaseSpreadsheetStorage:
         """
         Creates concrete spreadsheet storage.
+
+        :param database_path: Database file path to keep storage data between restarts. If it isn't defined then
+            data is kept in memory only.
+        :type database_path: :obj:`str`
+
+        :param outbox_path: Journal file path to keep spreadsheet writes not made yet between restarts. If it isn't
+            defined then they are kept in memory only.
+        :type outbox_path: :obj:`str`
+
         :return: Returns created spreadsheet storage
         :rtype: :obj:`BaseSpreadsheetStorage`
         """
@@ -28,7 +37,9 @@ class StorageFactory:
 
     @staticmethod
     @abstractmethod
-    def init_auth_handler(spreadsheet_id: str, token_file_name: str) -> BaseAuthSpreadsheetHandler:
+    def init_auth_handler(
+        spreadsheet_id: str, token_file_name: str, mirror_path: str = None
+    ) -> BaseAuthSpreadsheetHandler:
         """
         Creates concrete students' authorization spreadsheet handler.
 
@@ -38,6 +49,9 @@ class StorageFactory:
         :param token_file_name: Spreadsheet token file name
         :type token_file_name: :obj:`str`
 
+        :param mirror_path: Local spreadsheet mirror database file path. If it isn't defined then mirror isn't used.
+        :type mirror_path: :obj:`str`
+
         :return: Returns students' authorization spreadsheet handler
         :rtype: :obj:`BaseAuthSpreadsheetHandler`
         """
@@ -45,7 +59,9 @@ class StorageFactory:
 
     @staticmethod
     @abstractmethod
-    def init_works_handler(spreadsheet_id: str, token_file_name: str) -> BaseWorksSpreadsheetHandler:
+    def init_works_handler(
+        spreadsheet_id: str, token_file_name: str, mirror_path: str = None
+    ) -> BaseWorksSpreadsheetHandler:
         """
         Creates concrete student works sending spreadsheet handler.
 
@@ -55,6 +71,9 @@ class StorageFactory:
         :param token_file_name: Spreadsheet token file name
         :type token_file_name: :obj:`str`
 
+        :param mirror_path: Local spreadsheet mirror database file path. If it isn't defined then mirror isn't used.
+        :type mirror_path: :obj:`str`
+
         :return: Returns student works sending spreadsheet handler
         :rtype: :obj:`BaseWorksSpreadsheetHandler`
         """
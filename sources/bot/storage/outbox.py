@@ -0,0 +1,206 @@
+"""
+Spreadsheet writes outbox implementation module.
+"""
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import List, Tuple
+
+from .snapshot import Snapshot
+
+
+class Outbox:
+    """
+    Outbox class implementation is append-only journal of pending spreadsheet writes.
+
+    Note: Every write gets unique idempotency key and is appended to JSON lines file, made writes are acknowledged by
+    their keys in the same file. Writes are synchronized to disk before :meth:`put` returns, and concurrent writers
+    are covered by one synchronization. Journal is truncated as soon as all its writes are acknowledged, so after
+    restart only not acknowledged writes are pending. If file path isn't defined then writes are kept in memory only.
+
+    Writes which can't be made are moved to dead letters by :meth:`bury`. Dead letters are kept in their own file
+    next to journal, which is never truncated, so they are kept until they are examined.
+    """
+
+    def __init__(self, path: str = None):
+        self._path = path
+        self._entries: OrderedDict[str, Tuple[str, list]] = OrderedDict()
+        self._dead_letters: List[Tuple[str, str, list, str]] = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._written_count = 0
+        self._synced_count = 0
+        self._file = None
+
+        if path is not None:
+            if os.path.exists(path):
+                self._load()
+            if os.path.exists(self._get_dead_letters_path()):
+                self._load_dead_letters()
+            self._file = open(path, "a", encoding="utf-8")
+
+    def _get_dead_letters_path(self) -> str:
+        return self._path + ".dead"
+
+    def _load(self) -> None:
+        with open(self._path, encoding="utf-8") as outbox_file:
+            for line in outbox_file:
+                # The last line may be torn by crash during its writing.
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                if "done" in record:
+                    for key in record["done"]:
+                        self._entries.pop(key, None)
+                else:
+                    self._entries[record["key"]] = (record["operation"], record["args"])
+
+    def _load_dead_letters(self) -> None:
+        with open(self._get_dead_letters_path(), encoding="utf-8") as dead_letters_file:
+            for line in dead_letters_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                self._dead_letters.append((record["key"], record["operation"], record["args"], record["error"]))
+                # Write may be buried, but not acknowledged before crash.
+                self._entries.pop(record["key"], None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _append(self, line: str) -> int:
+        self._file.write(line)
+        self._written_count += 1
+        return self._written_count
+
+    def _sync(self, written_count: int) -> None:
+        # Writers waiting for synchronization are covered by synchronization of the first of them.
+        with self._sync_lock:
+            if self._synced_count >= written_count:
+                return
+
+            with self._lock:
+                self._file.flush()
+                written_count = self._written_count
+            os.fsync(self._file.fileno())
+            self._synced_count = written_count
+
+    def put(self, operation: str, args: list) -> str:
+        """
+        Appends write to outbox.
+
+        :param operation: Write operation name
+        :type operation: :obj:`str`
+
+        :param args: Write operation arguments
+        :type args: :obj:`list`
+
+        :return: Returns write idempotency key.
+        :rtype: :obj:`str`
+        """
+        key = uuid.uuid4().hex
+        line = json.dumps(
+            {"key": key, "operation": operation, "args": args}, ensure_ascii=False, default=Snapshot.unwrap
+        )
+        # Writes are kept as they are read after restart, without snapshots and tuples.
+        record = json.loads(line)
+
+        with self._lock:
+            self._entries[key] = (operation, record["args"])
+            if self._file is None:
+                return key
+            written_count = self._append(line + "\n")
+
+        self._sync(written_count)
+        return key
+
+    def get_pending(self, count: int) -> List[Tuple[str, str, list]]:
+        """
+        Gets the oldest not acknowledged writes.
+
+        :param count: Max writes count
+        :type count: :obj:`int`
+
+        :return: Returns writes keys, operation names and arguments.
+        :rtype: :obj:`List[Tuple[str, str, list]]`
+        """
+        with self._lock:
+            entries = []
+            for key, (operation, args) in self._entries.items():
+                if len(entries) >= count:
+                    break
+                entries.append((key, operation, args))
+            return entries
+
+    def ack(self, keys: List[str]) -> None:
+        """
+        Acknowledges made writes.
+
+        :param keys: Writes idempotency keys
+        :type keys: :obj:`List[str]`
+        """
+        with self._sync_lock, self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            if self._file is None:
+                return
+
+            if not self._entries:
+                self._file.truncate(0)
+                os.fsync(self._file.fileno())
+                self._written_count = self._synced_count = 0
+                return
+
+            written_count = self._append(json.dumps({"done": keys}) + "\n")
+
+        self._sync(written_count)
+
+    def bury(self, key: str, error: str) -> None:
+        """
+        Moves write, which can't be made, from pending writes to dead letters.
+
+        :param key: Write idempotency key
+        :type key: :obj:`str`
+
+        :param error: Write error description
+        :type error: :obj:`str`
+        """
+        with self._lock:
+            if key not in self._entries:
+                return
+            operation, args = self._entries[key]
+            self._dead_letters.append((key, operation, args, error))
+
+        if self._path is not None:
+            line = json.dumps({"key": key, "operation": operation, "args": args, "error": error}, ensure_ascii=False)
+            with open(self._get_dead_letters_path(), "a", encoding="utf-8") as dead_letters_file:
+                dead_letters_file.write(line + "\n")
+                dead_letters_file.flush()
+                os.fsync(dead_letters_file.fileno())
+
+        self.ack([key])
+
+    def get_dead_letters(self) -> List[Tuple[str, str, list, str]]:
+        """
+        Gets writes moved to dead letters.
+
+        :return: Returns writes keys, operation names, arguments and errors.
+        :rtype: :obj:`List[Tuple[str, str, list, str]]`
+        """
+        with self._lock:
+            return list(self._dead_letters)
+
+    def close(self) -> None:
+        """
+        Closes journal file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,107 @@
+"""
+Storage data read-only snapshots implementation module.
+"""
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+class Snapshot:
+    """
+    Snapshot util class gives read-only views of storage data without copying it.
+
+    Note: Storage data is copy-on-write: its nested values are never changed in place, they are replaced by changed
+    copies. So views stay consistent snapshots, and writers copy only subtrees they change, for example
+    `auth = dict(data["auth"])`.
+    """
+
+    @staticmethod
+    def freeze(value: Any) -> Any:
+        """
+        Gets read-only view of value.
+
+        :param value: Storage value
+        :type value: :obj:`Any`
+
+        :return: Returns view for dictionaries and lists or value itself for others.
+        :rtype: :obj:`Any`
+        """
+        if isinstance(value, dict):
+            return SnapshotDict(value)
+        if isinstance(value, list):
+            return SnapshotList(value)
+        return value
+
+    @staticmethod
+    def unwrap(value: Any) -> Any:
+        """
+        Gets value behind read-only view to store it again without copying.
+
+        Note: Views nested in dictionaries and lists, for example in `dict(data["tests"])` copy, are unwrapped too.
+        Containers without nested views are given as they are, others are copied with unwrapped values.
+
+        :param value: Storage value or its view
+        :type value: :obj:`Any`
+
+        :return: Returns viewed value.
+        :rtype: :obj:`Any`
+        """
+        if isinstance(value, (SnapshotDict, SnapshotList)):
+            return value._value
+        if isinstance(value, dict):
+            items = {key: Snapshot.unwrap(item) for key, item in value.items()}
+            return value if all(items[key] is item for key, item in value.items()) else items
+        if isinstance(value, list):
+            items = [Snapshot.unwrap(item) for item in value]
+            return value if all(unwrapped is item for unwrapped, item in zip(items, value)) else items
+        return value
+
+
+class SnapshotDict(Mapping):
+    """
+    Read-only dictionary view class implementation, which gives nested values as views too.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: dict):
+        self._value = value
+
+    def __getitem__(self, key):
+        return Snapshot.freeze(self._value[key])
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __len__(self):
+        return len(self._value)
+
+    def __eq__(self, other):
+        return self._value == Snapshot.unwrap(other)
+
+    def __repr__(self):
+        return repr(self._value)
+
+
+class SnapshotList(Sequence):
+    """
+    Read-only list view class implementation, which gives nested values as views too.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: list):
+        self._value = value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SnapshotList(self._value[index])
+        return Snapshot.freeze(self._value[index])
+
+    def __len__(self):
+        return len(self._value)
+
+    def __eq__(self, other):
+        return self._value == Snapshot.unwrap(other)
+
+    def __repr__(self):
+        return repr(self._value)
@@ -0,0 +1,502 @@
+"""
+Asynchronous row spreadsheet handler implementation module.
+"""
+import asyncio
+import functools
+import time
+from typing import List, Dict, Tuple
+from urllib.parse import quote
+
+import aiohttp
+from oauth2client.service_account import ServiceAccountCredentials
+
+from ...exceptions import SpreadsheetRequestException
+from .request_scheduler import RequestScheduler
+from .service_registry import ServiceRegistry
+from .spreadsheet_handler import SpreadsheetHandler
+from .util.a1_notation import A1Notation
+from .util.ttl_cache import TtlCache
+
+
+class AsyncSpreadsheetHandler:
+    """
+    Asynchronous row spreadsheet handler class implementation over Sheets REST API and aiohttp.
+
+    Note: Handlers created by :meth:`with_spreadsheet` share credentials and HTTP session, and one handler is kept
+    per spreadsheet, so its cached sheets titles and rows positions are reused. Requests pass through
+    :class:`RequestScheduler` of token file, so they share quotas with synchronous handlers of the same token file.
+
+    Emulator may be passed instead of credentials, then its REST session is used instead of HTTP session.
+
+    Rows positions are cached by first columns like :class:`SpreadsheetHandler` does, so existing rows are changed
+    without reading and new rows are appended after the last sheet row.
+    """
+
+    _sheets_url = "https://sheets.googleapis.com/v4/spreadsheets"
+    _drive_url = "https://www.googleapis.com/drive/v3/files"
+
+    def __init__(
+        self,
+        file_name: str,
+        spreadsheet_id: str,
+        credentials: ServiceAccountCredentials = None,
+        session: aiohttp.ClientSession = None,
+        metadata_ttl: float = 300,
+        scheduler: RequestScheduler = None,
+        service=None,
+    ):
+        self._spreadsheet_id = spreadsheet_id
+        self._credentials_file = file_name
+        self._service = service
+        self._metadata_ttl = metadata_ttl
+        self._metadata_cache = TtlCache(metadata_ttl)
+        self._spreadsheet_handlers: Dict[str, AsyncSpreadsheetHandler] = {}
+
+        # First column values to row numbers map, next free row number pointer and loading time of sheets.
+        self._row_numbers: Dict[str, Dict[str, int]] = {}
+        self._next_row_numbers: Dict[str, int] = {}
+        self._row_numbers_loaded_at: Dict[str, float] = {}
+        self._row_numbers_lock = None
+
+        if service is None:
+            self._credentials = credentials or ServiceRegistry.get_credentials(file_name)
+            self._session = session
+            self._scheduler = scheduler or ServiceRegistry.get_scheduler(file_name)
+        else:
+            self._credentials = None
+            self._session = session or service.session()
+            self._scheduler = scheduler or RequestScheduler()
+        self._owns_session = session is None
+
+    def with_spreadsheet(self, spreadsheet_id: str) -> "AsyncSpreadsheetHandler":
+        """
+        Gets handler for another spreadsheet sharing credentials and HTTP session with this one.
+
+        Note: Handler is created once per spreadsheet.
+
+        :param spreadsheet_id: Spreadsheet unique id
+        :type spreadsheet_id: :obj:`str`
+
+        :return: Returns spreadsheet handler.
+        :rtype: :obj:`AsyncSpreadsheetHandler`
+        """
+        handler = self._spreadsheet_handlers.get(spreadsheet_id)
+        if handler is None:
+            handler = AsyncSpreadsheetHandler(
+                self._credentials_file,
+                spreadsheet_id,
+                self._credentials,
+                self._get_session(),
+                self._metadata_ttl,
+                self._scheduler,
+                self._service,
+            )
+            self._spreadsheet_handlers[spreadsheet_id] = handler
+        return handler
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    def _get_row_numbers_lock(self) -> asyncio.Lock:
+        if self._row_numbers_lock is None:
+            self._row_numbers_lock = asyncio.Lock()
+        return self._row_numbers_lock
+
+    async def _get_access_token(self) -> str:
+        if self._credentials is None:
+            return ""
+
+        if self._credentials.access_token is None or self._credentials.access_token_expired:
+            # Token refreshing is made by blocking oauth2client call, so it is moved out of event loop.
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._credentials.get_access_token)
+        return self._credentials.access_token
+
+    async def _send(self, method: str, url: str, params=None, body: dict = None) -> dict:
+        headers = {"Authorization": f"Bearer {await self._get_access_token()}"}
+        async with self._get_session().request(method, url, params=params, json=body, headers=headers) as response:
+            if response.status >= 400:
+                text = await response.text()
+                raise SpreadsheetRequestException(response.status, text, response.headers.get("Retry-After"))
+            return await response.json()
+
+    async def _request(self, method: str, url: str, params=None, body: dict = None, idempotent: bool = True) -> dict:
+        kind = RequestScheduler.read if method == "GET" else RequestScheduler.write
+        return await self._scheduler.execute_async(
+            functools.partial(self._send, method, url, params, body), kind, idempotent
+        )
+
+    async def close(self):
+        """
+        Closes HTTP session if it is owned by handler.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def create_sheet(self, sheet_title: str, header: List[str] = None) -> None:
+        """
+        Creates sheet with ability to write its first row.
+
+        Note: Created sheet is known to be empty, so its first row is written without reading sheet.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param header: Sheet first row
+        :type header: :obj:`List[str]`
+        """
+        await self._request(
+            "POST",
+            f"{self._sheets_url}/{self._spreadsheet_id}:batchUpdate",
+            body={"requests": [{"addSheet": {"properties": {"title": sheet_title}}}]},
+            idempotent=False,
+        )
+
+        page_names = self._metadata_cache.get("page_names")
+        if page_names is not None:
+            self._metadata_cache.put("page_names", page_names + [sheet_title])
+
+        if header is not None:
+            async with self._get_row_numbers_lock():
+                self._set_row_numbers(sheet_title, [])
+                await self._add_rows({sheet_title: [header]})
+
+    async def create_spreadsheet(self, spreadsheet_title: str, default_sheet_title=None):
+        """
+        Creates spreadsheet with title with ability to define first sheet title.
+
+        :param spreadsheet_title: Spreadsheet title
+        :type spreadsheet_title: :obj:`str`
+
+        :param default_sheet_title: First spreadsheet page title
+        :type default_sheet_title: :obj:`str`
+        """
+        spreadsheet = await self._request(
+            "POST",
+            self._sheets_url,
+            body={
+                "properties": {"title": spreadsheet_title, "locale": "ru_RU"},
+                "sheets": [{"properties": {"sheetType": "GRID", "sheetId": 0, "title": default_sheet_title}}],
+            },
+            idempotent=False,
+        )
+        self._spreadsheet_id = spreadsheet["spreadsheetId"]
+        self.invalidate_metadata()
+        self.invalidate_row_numbers()
+
+        print(f"Created new spreadsheet at https://docs.google.com/spreadsheets/d/{self._spreadsheet_id}/edit#gid=0")
+
+        await self._request(
+            "POST",
+            f"{self._drive_url}/{self._spreadsheet_id}/permissions",
+            params={"fields": "id"},
+            body={"type": "anyone", "role": "reader"},
+            idempotent=False,
+        )
+
+    def invalidate_metadata(self) -> None:
+        """
+        Drops cached sheets titles, so they will be read from spreadsheet again.
+        """
+        self._metadata_cache.clear()
+
+    async def batch_get_sheet_values(self, ranges: List[str]) -> dict:
+        """
+        Gets values of several ranges by one request.
+
+        :param ranges: Ranges in A1 notation
+        :type ranges: :obj:`List[str]`
+
+        :return: Returns response with value ranges in the same order.
+        :rtype: :obj:`dict`
+        """
+        params = [("ranges", sheet_range) for sheet_range in ranges]
+        params.append(("valueRenderOption", "FORMATTED_VALUE"))
+        params.append(("dateTimeRenderOption", "FORMATTED_STRING"))
+        return await self._request("GET", f"{self._sheets_url}/{self._spreadsheet_id}/values:batchGet", params=params)
+
+    async def get_sheet_values(self, sheet_title: str, corner_from: str, corner_to: str) -> dict:
+        return await self.batch_get_sheet_values(
+            [f"{A1Notation.get_sheet_reference(sheet_title)}!{corner_from}:{corner_to}"]
+        )
+
+    async def _get_first_column_range_values(self, spreadsheet_title: str) -> dict:
+        return await self.batch_get_sheet_values([A1Notation.get_column_range(spreadsheet_title)])
+
+    async def _update_spreadsheet_rows(self, sheet_rows: Dict[str, Dict[int, List[str]]]) -> None:
+        data = []
+        for sheet_title, rows in sheet_rows.items():
+            for first_row_number, values in SpreadsheetHandler._get_row_blocks(rows):
+                data.append(
+                    {
+                        "range": A1Notation.get_range(
+                            sheet_title,
+                            first_row_number,
+                            first_row_number + len(values) - 1,
+                            max(max(len(row_values) for row_values in values), 1),
+                        ),
+                        "majorDimension": "ROWS",
+                        "values": values,
+                    }
+                )
+
+        await self._request(
+            "POST",
+            f"{self._sheets_url}/{self._spreadsheet_id}/values:batchUpdate",
+            body={"valueInputOption": "USER_ENTERED", "data": data},
+        )
+
+    async def _update_spreadsheet_row(self, sheet_title: str, row_number: int, values: List[str]) -> None:
+        await self._update_spreadsheet_rows({sheet_title: {row_number: values}})
+
+    async def _clear_spreadsheet_row(self, sheet_title: str, row_number: int) -> None:
+        await self._request(
+            "POST",
+            f"{self._sheets_url}/{self._spreadsheet_id}/values:batchClear",
+            body={"ranges": [A1Notation.get_rows_range(sheet_title, row_number, row_number)]},
+        )
+
+    async def _append_spreadsheet_rows(self, sheet_title: str, rows: List[List[str]]) -> Tuple[int, int]:
+        sheet_reference = quote(A1Notation.get_sheet_reference(sheet_title), safe="")
+        response = await self._request(
+            "POST",
+            f"{self._sheets_url}/{self._spreadsheet_id}/values/{sheet_reference}:append",
+            params={"valueInputOption": "USER_ENTERED", "insertDataOption": "INSERT_ROWS"},
+            body={"majorDimension": "ROWS", "values": rows},
+            idempotent=False,
+        )
+
+        _, first_row_number, last_row_number, _, _ = A1Notation.parse_range(response["updates"]["updatedRange"])
+        return first_row_number, last_row_number
+
+    def _set_row_numbers(self, sheet_title: str, first_column: List[List[str]]) -> None:
+        self._row_numbers[sheet_title] = {column[0]: number for number, column in enumerate(first_column, 1) if column}
+        self._next_row_numbers[sheet_title] = len(first_column) + 1
+        self._row_numbers_loaded_at[sheet_title] = time.monotonic()
+
+    def _is_row_numbers_loaded(self, sheet_title: str) -> bool:
+        loaded_at = self._row_numbers_loaded_at.get(sheet_title)
+        return (
+            sheet_title in self._row_numbers
+            and loaded_at is not None
+            and time.monotonic() - loaded_at < self._metadata_ttl
+        )
+
+    async def _load_row_numbers(self, sheet_titles: List[str]) -> None:
+        not_loaded_sheet_titles = [
+            sheet_title for sheet_title in sheet_titles if not self._is_row_numbers_loaded(sheet_title)
+        ]
+        if not not_loaded_sheet_titles:
+            return
+
+        ranges = [A1Notation.get_column_range(sheet_title) for sheet_title in not_loaded_sheet_titles]
+        results = await self.batch_get_sheet_values(ranges)
+        for sheet_title, value_range in zip(not_loaded_sheet_titles, results["valueRanges"]):
+            self._set_row_numbers(sheet_title, value_range.get("values", []))
+
+    def invalidate_row_numbers(self, sheet_title: str = None) -> None:
+        """
+        Drops cached rows positions, so they will be read from spreadsheet before next writing.
+
+        :param sheet_title: Sheet title. If it isn't defined then all sheets positions will be dropped.
+        :type sheet_title: :obj:`str`
+        """
+        sheet_titles = [sheet_title] if sheet_title else list(self._row_numbers.keys())
+        for title in sheet_titles:
+            self._row_numbers.pop(title, None)
+            self._next_row_numbers.pop(title, None)
+            self._row_numbers_loaded_at.pop(title, None)
+
+    def _split_rows(self, sheet_title: str, rows: List[List[str]]) -> Tuple[Dict[int, List[str]], List[List[str]]]:
+        row_numbers = self._row_numbers[sheet_title]
+
+        numbered_rows = {}
+        new_rows = {}
+        for row in rows:
+            row_number = row_numbers.get(row[0])
+            if row_number is None:
+                # The last of new rows with equal first fields wins like for existing rows.
+                new_rows[row[0]] = row
+            else:
+                numbered_rows[row_number] = row
+
+        return numbered_rows, list(new_rows.values())
+
+    async def _add_new_rows(self, sheet_title: str, rows: List[List[str]]) -> None:
+        first_row_number, _ = await self._append_spreadsheet_rows(sheet_title, rows)
+
+        if first_row_number != self._next_row_numbers.get(sheet_title):
+            # Rows are added by other spreadsheet client, so cached positions are outdated.
+            self.invalidate_row_numbers(sheet_title)
+            return
+
+        for row_number, row in enumerate(rows, first_row_number):
+            self._row_numbers[sheet_title][row[0]] = row_number
+        self._next_row_numbers[sheet_title] = first_row_number + len(rows)
+
+    async def _add_rows(self, sheet_rows: Dict[str, List[List[str]]]) -> None:
+        await self._load_row_numbers(list(sheet_rows.keys()))
+
+        numbered_rows = {}
+        new_rows = {}
+        for sheet_title, rows in sheet_rows.items():
+            numbered_rows[sheet_title], new_rows[sheet_title] = self._split_rows(sheet_title, rows)
+
+        try:
+            numbered_rows = {sheet_title: rows for sheet_title, rows in numbered_rows.items() if rows}
+            if numbered_rows:
+                await self._update_spreadsheet_rows(numbered_rows)
+
+            for sheet_title, rows in new_rows.items():
+                if rows:
+                    await self._add_new_rows(sheet_title, rows)
+        except BaseException:
+            for sheet_title in sheet_rows.keys():
+                self.invalidate_row_numbers(sheet_title)
+            raise
+
+    async def add_rows(self, sheet_rows: Dict[str, List[List[str]]]):
+        """
+        Adds rows with fields in several sheets by one writing request and one appending request per sheet.
+
+        Note: If such rows exist then they will change. Existing rows positions are computed by cached first columns,
+        which are read once in metadata ttl seconds, new rows are appended after the last sheet row. If writing
+        fails or is cancelled then cached positions are dropped, so retried rows aren't appended twice.
+
+        :param sheet_rows: Sheet titles and their appendable rows
+        :type sheet_rows: :obj:`dict[str, List[List[str]]]`
+        """
+        async with self._get_row_numbers_lock():
+            await self._add_rows(sheet_rows)
+
+    async def append_rows(self, sheet_title: str, rows: List[List[str]]) -> None:
+        """
+        Appends rows after the last sheet row by one request without reading sheet.
+
+        Note: Rows are always added, so appending isn't retried after server errors.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param rows: Appendable rows
+        :type rows: :obj:`List[List[str]]`
+        """
+        await self._append_spreadsheet_rows(sheet_title, rows)
+
+        # Appended rows take positions which cached rows positions don't know.
+        self.invalidate_row_numbers(sheet_title)
+
+    async def add_row(self, sheet_title: str, row: List[str]):
+        """
+        Adds one single row with fields in spreadsheet.
+
+        Note: If such row exists then it will change.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param row: Spreadsheet appendable row
+        :type row: :obj:`List[str]`
+        """
+        await self.add_rows({sheet_title: [row]})
+
+    async def remove_row(self, sheet_title: str, first_row_element: str) -> bool:
+        """
+        Removes one single row with fields from spreadsheet.
+
+        Note: If such row doesn't exist then it won't be removed.
+
+        :param sheet_title: Spreadsheet title
+        :type sheet_title: :obj:`str`
+
+        :param first_row_element: First field in removable row
+        :type first_row_element: :obj:`str`
+
+        :return: Returns True on success.
+        :rtype: :obj:`bool`
+        """
+        async with self._get_row_numbers_lock():
+            loaded = self._is_row_numbers_loaded(sheet_title)
+            await self._load_row_numbers([sheet_title])
+
+            if first_row_element not in self._row_numbers[sheet_title] and loaded:
+                # Row may be added by another spreadsheet client, so cached positions are reconciled.
+                self.invalidate_row_numbers(sheet_title)
+                await self._load_row_numbers([sheet_title])
+
+            row_number = self._row_numbers[sheet_title].get(first_row_element)
+            if row_number is None:
+                return False
+
+            try:
+                await self._clear_spreadsheet_row(sheet_title, row_number)
+            except BaseException:
+                self.invalidate_row_numbers(sheet_title)
+                raise
+
+            del self._row_numbers[sheet_title][first_row_element]
+            return True
+
+    async def get_first_column_values(self, sheet_title: str) -> List[str]:
+        """
+        Gets first column in spreadsheet except its first field.
+
+        :param sheet_title: Spreadsheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns first column with fields in spreadsheet.
+        :rtype: :obj:`list[str]`
+        """
+        results = await self._get_first_column_range_values(sheet_title)
+        sheet_values = results["valueRanges"][0].get("values", [])
+        return [sheet_row[0] for sheet_row in sheet_values[1:] if sheet_row]
+
+    async def get_sheet_records(self, sheet_title: str) -> List[Dict[str, str]]:
+        """
+        Gets all sheet rows except first one as dictionaries with first row fields as keys.
+
+        :param sheet_title: Spreadsheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns rows with fields.
+        :rtype: :obj:`List[dict[str, str]]`
+        """
+        return (await self.get_sheets_records([sheet_title]))[sheet_title]
+
+    async def get_sheets_records(self, sheet_titles: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Gets all rows except first ones of several sheets by one request.
+
+        :param sheet_titles: Sheet titles
+        :type sheet_titles: :obj:`List[str]`
+
+        :return: Returns sheet titles and their rows with fields.
+        :rtype: :obj:`dict[str, List[dict[str, str]]]`
+        """
+        results = await self.batch_get_sheet_values([A1Notation.get_sheet_reference(title) for title in sheet_titles])
+
+        sheets_records = {}
+        for sheet_title, value_range in zip(sheet_titles, results["valueRanges"]):
+            sheet_values = value_range.get("values", [])
+            attributes = sheet_values[0] if sheet_values else []
+            sheets_records[sheet_title] = [
+                dict(zip(attributes, sheet_row + [""] * (len(attributes) - len(sheet_row))))
+                for sheet_row in sheet_values[1:]
+                if sheet_row
+            ]
+
+        return sheets_records
+
+    async def get_spreadsheet_page_names(self) -> List[str]:
+        page_names = self._metadata_cache.get("page_names")
+        if page_names is None:
+            sheet_metadata = await self._request(
+                "GET", f"{self._sheets_url}/{self._spreadsheet_id}", params={"fields": "sheets.properties.title"}
+            )
+            page_names = [sheet["properties"]["title"] for sheet in sheet_metadata.get("sheets", [])]
+            self._metadata_cache.put("page_names", page_names)
+
+        return list(page_names)
@@ -0,0 +1,130 @@
+"""
+Asynchronous students authorization spreadsheet handler implementation module.
+"""
+from typing import List, Dict, Tuple
+
+from ....exceptions import InvalidSpreadsheetAttributeException
+from ...base_spreadsheet_storage import BaseSpreadsheetStorage
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from ..auth.async_roster_index import AsyncRosterIndex
+from ..auth.base_async_auth_spreadsheet_handler import BaseAsyncAuthSpreadsheetHandler
+
+
+class AsyncAuthSpreadsheetHandler(BaseAsyncAuthSpreadsheetHandler):
+    """
+    Asynchronous students authorization spreadsheet handler class implementation.
+    """
+
+    def __init__(self, spreadsheet_id: str, file_name: str, service=None):
+        self._attributes = {
+            "Студенты": ["username", "ФИО", "Группа", "Подгруппа"],
+            "Преподаватели": ["username", "ФИО"],
+        }
+        self._handler = AsyncSpreadsheetHandler(file_name, spreadsheet_id, service=service)
+        self._student_sheet_title = list(self._attributes.keys())[0]
+        self._teacher_sheet_title = list(self._attributes.keys())[1]
+        self._roster = AsyncRosterIndex(self._handler, [self._student_sheet_title, self._teacher_sheet_title])
+
+    async def create_spreadsheet(self, spreadsheet_title="Информация о людях"):
+        await self._handler.create_spreadsheet(spreadsheet_title, self._student_sheet_title)
+        await self._handler.add_row(self._student_sheet_title, self._attributes.get(self._student_sheet_title))
+        await self._handler.create_sheet(self._teacher_sheet_title, self._attributes.get(self._teacher_sheet_title))
+        self._roster.invalidate()
+
+    async def _add_row(self, sheet_title: str, row: List[str]):
+        await self._handler.add_row(sheet_title, row)
+        self._roster.put(sheet_title, dict(zip(self._attributes.get(sheet_title), row)))
+
+    async def _remove_row(self, sheet_title: str, username: str) -> bool:
+        removed = await self._handler.remove_row(sheet_title, username)
+        self._roster.remove(sheet_title, username)
+        return removed
+
+    async def add_student(self, username: str, **kwargs):
+        name = kwargs.get("name")
+        group = kwargs.get("group")
+        subgroup = kwargs.get("subgroup")
+
+        if not name:
+            raise InvalidSpreadsheetAttributeException("Invalid name value")
+        elif not group:
+            raise InvalidSpreadsheetAttributeException("Invalid group value")
+        elif not subgroup:
+            raise InvalidSpreadsheetAttributeException("Invalid subgroup value")
+        else:
+            await self._add_row(self._student_sheet_title, [username, name, group, subgroup])
+
+    async def remove_student(self, username: str) -> bool:
+        return await self._remove_row(self._student_sheet_title, username)
+
+    async def get_student_usernames(self) -> List[str]:
+        return await self._roster.keys(self._student_sheet_title)
+
+    async def get_student_by_username(self, username: str) -> dict:
+        return self._get_student(await self._roster.get(self._student_sheet_title, username))
+
+    @staticmethod
+    def _get_student(data: dict) -> dict:
+        student = {}
+        name = data.get("ФИО")
+        group = data.get("Группа")
+        subgroup = data.get("Подгруппа")
+
+        if name and group and subgroup:
+            student.update(name=name, group=group, subgroup=subgroup)
+
+        return student
+
+    async def add_teacher(self, username: str, **kwargs) -> None:
+        name = kwargs.get("name")
+
+        if not name:
+            raise InvalidSpreadsheetAttributeException("Invalid name value")
+        else:
+            await self._add_row(self._teacher_sheet_title, [username, name])
+
+    async def remove_teacher(self, username: str) -> bool:
+        return await self._remove_row(self._teacher_sheet_title, username)
+
+    async def get_teacher_usernames(self) -> List[str]:
+        return await self._roster.keys(self._teacher_sheet_title)
+
+    async def get_teacher_by_username(self, username: str) -> dict:
+        return self._get_teacher(await self._roster.get(self._teacher_sheet_title, username))
+
+    @staticmethod
+    def _get_teacher(data: dict) -> dict:
+        teacher = {}
+        name = data.get("ФИО")
+
+        if name:
+            teacher.update(name=name)
+
+        return teacher
+
+    async def find_user(self, username: str) -> Tuple[str, dict]:
+        return (await self.find_users([username]))[username]
+
+    async def find_users(self, usernames: List[str]) -> Dict[str, Tuple[str, dict]]:
+        rows = await self._roster.get_many(usernames)
+
+        users = {}
+        for username in usernames:
+            student = self._get_student(rows[self._student_sheet_title].get(username, {}))
+            teacher = self._get_teacher(rows[self._teacher_sheet_title].get(username, {}))
+
+            if student:
+                users[username] = ("student", student)
+            elif teacher:
+                users[username] = ("teacher", teacher)
+            else:
+                users[username] = (None, {})
+
+        return users
+
+    async def close(self):
+        self._roster.stop()
+        await self._handler.close()
+
+    def accept_storage(self, storage: BaseSpreadsheetStorage):
+        storage.visit_auth_handler(self)
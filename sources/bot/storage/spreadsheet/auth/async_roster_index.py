@@ -0,0 +1,80 @@
+"""
+Asynchronous students and teachers roster index implementation module.
+"""
+import asyncio
+import time
+from typing import Dict, List
+
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from ..auth.roster_index import RosterIndex
+
+
+class AsyncRosterIndex(RosterIndex):
+    """
+    Asynchronous roster index class implementation refreshes sheets in event loop task.
+    """
+
+    def __init__(self, handler: AsyncSpreadsheetHandler, sheet_titles: List[str], refresh_interval: float = 60):
+        super().__init__(handler, sheet_titles, refresh_interval)
+        self._start_lock = None
+
+    async def refresh(self):
+        """
+        Reloads all sheets by one request and applies only changed rows to index.
+        """
+        loaded_at = time.monotonic()
+        sheets_records = await self._handler.get_sheets_records(self._sheet_titles)
+
+        for sheet_title in self._sheet_titles:
+            self._apply(sheet_title, self._get_rows(sheets_records.get(sheet_title, [])), loaded_at)
+
+        with self._lock:
+            self._loaded = True
+
+    async def _refresh_loop(self):
+        while not self._stopped.is_set():
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as error:
+                self._logger.error(f"Unable to refresh roster index: {error}")
+
+    async def start(self):
+        """
+        Loads index if it isn't loaded and launches background refreshing task.
+        """
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if not self._loaded:
+                await self.refresh()
+
+            if self._refresher is None:
+                self._stopped.clear()
+                self._refresher = asyncio.ensure_future(self._refresh_loop())
+
+    def stop(self):
+        """
+        Stops background refreshing task.
+        """
+        self._stopped.set()
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    async def get(self, sheet_title: str, key: str) -> Dict[str, str]:
+        await self.start()
+        return self._get_row(sheet_title, key)
+
+    async def keys(self, sheet_title: str) -> List[str]:
+        await self.start()
+        return self._get_keys(sheet_title)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        await self.start()
+        return self._get_many(keys)
+
+    async def find(self, sheet_title: str, attributes: Dict[str, str]) -> List[Dict[str, str]]:
+        await self.start()
+        return self._find(sheet_title, attributes)
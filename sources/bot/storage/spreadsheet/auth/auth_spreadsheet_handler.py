@@ -1,12 +1,17 @@
 """
 Students authorization spreadsheet handler implementation module.
 """
-from typing import List
+import itertools
+from typing import List, Dict, Tuple, Iterable, Iterator
 
 from ....exceptions import InvalidSpreadsheetAttributeException
+from ....loggers import LogInstaller
 from ...base_spreadsheet_storage import BaseSpreadsheetStorage
 from ..spreadsheet_handler import SpreadsheetHandler
+from ..write_behind_queue import WriteBehindQueue
 from ..auth.base_auth_spreadsheet_handler import BaseAuthSpreadsheetHandler
+from ..auth.roster_index import RosterIndex
+from ..spreadsheet_mirror import SpreadsheetMirror
 
 
 class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
@@ -14,20 +19,39 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
     Students authorization spreadsheet handler class implementation.
     """
 
-    def __init__(self, spreadsheet_id: str, file_name: str):
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    def __init__(self, spreadsheet_id: str, file_name: str, mirror_path: str = None, service=None):
         self._attributes = {
             "Студенты": ["username", "ФИО", "Группа", "Подгруппа"],
             "Преподаватели": ["username", "ФИО"],
         }
-        self._handler = SpreadsheetHandler(file_name, spreadsheet_id)
+        self._handler = SpreadsheetHandler(file_name, spreadsheet_id, service=service)
         self._student_sheet_title = list(self._attributes.keys())[0]
         self._teacher_sheet_title = list(self._attributes.keys())[1]
+        sheet_titles = [self._student_sheet_title, self._teacher_sheet_title]
+        if mirror_path:
+            self._roster = SpreadsheetMirror(self._handler, spreadsheet_id, sheet_titles, mirror_path)
+        else:
+            self._roster = RosterIndex(self._handler, sheet_titles)
+        self._writer = WriteBehindQueue(self._handler, on_written=self._roster.mark_written)
 
     def create_spreadsheet(self, spreadsheet_title="Информация о людях"):
         self._handler.create_spreadsheet(spreadsheet_title, self._student_sheet_title)
         self._handler.add_row(self._student_sheet_title, self._attributes.get(self._student_sheet_title))
         self._handler.create_sheet(self._teacher_sheet_title)
         self._handler.add_row(self._teacher_sheet_title, self._attributes.get(self._teacher_sheet_title))
+        self._roster.invalidate()
+
+    def _add_row(self, sheet_title: str, row: List[str]):
+        # Row is put before enqueueing, so it may be marked written by queue flush.
+        self._roster.put(sheet_title, dict(zip(self._attributes.get(sheet_title), row)), pending=True)
+        self._writer.add_row(sheet_title, row)
+
+    def _remove_row(self, sheet_title: str, username: str) -> bool:
+        removed = self._writer.remove_row(sheet_title, username)
+        self._roster.remove(sheet_title, username)
+        return removed
 
     def add_student(self, username: str, **kwargs):
         name = kwargs.get("name")
@@ -41,17 +65,20 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
         elif not subgroup:
             raise InvalidSpreadsheetAttributeException("Invalid subgroup value")
         else:
-            self._handler.add_row(self._student_sheet_title, [username, name, group, subgroup])
+            self._add_row(self._student_sheet_title, [username, name, group, subgroup])
 
     def remove_student(self, username: str) -> bool:
-        return self._handler.remove_row(self._student_sheet_title, username)
+        return self._remove_row(self._student_sheet_title, username)
 
     def get_student_usernames(self) -> List[str]:
-        return self._handler.get_first_column_values(self._student_sheet_title)
+        return self._roster.keys(self._student_sheet_title)
 
     def get_student_by_username(self, username: str) -> dict:
+        return self._get_student(self._roster.get(self._student_sheet_title, username))
+
+    @staticmethod
+    def _get_student(data: dict) -> dict:
         student = {}
-        data = self._handler.get_row_by_first_element(self._student_sheet_title, username)
         name = data.get("ФИО")
         group = data.get("Группа")
         subgroup = data.get("Подгруппа")
@@ -67,17 +94,20 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
         if not name:
             raise InvalidSpreadsheetAttributeException("Invalid name value")
         else:
-            self._handler.add_row(self._teacher_sheet_title, [username, name])
+            self._add_row(self._teacher_sheet_title, [username, name])
 
     def remove_teacher(self, username: str) -> bool:
-        return self._handler.remove_row(self._teacher_sheet_title, username)
+        return self._remove_row(self._teacher_sheet_title, username)
 
     def get_teacher_usernames(self) -> List[str]:
-        return self._handler.get_first_column_values(self._teacher_sheet_title)
+        return self._roster.keys(self._teacher_sheet_title)
 
     def get_teacher_by_username(self, username: str) -> dict:
+        return self._get_teacher(self._roster.get(self._teacher_sheet_title, username))
+
+    @staticmethod
+    def _get_teacher(data: dict) -> dict:
         teacher = {}
-        data = self._handler.get_row_by_first_element(self._teacher_sheet_title, username)
         name = data.get("ФИО")
 
         if name:
@@ -85,5 +115,140 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
 
         return teacher
 
+    def import_students(self, students: Iterable[Dict[str, str]], batch_size: int = 500) -> Tuple[int, int, int]:
+        """
+        Adds or changes students by batches.
+
+        Note: Students are consumed lazily, so they may be streamed from file. Students equal to roster ones are
+        skipped, and students of every batch are written by one request.
+
+        :param students: Students with sheet fields: username, ФИО, Группа and Подгруппа
+        :type students: :obj:`Iterable[Dict[str, str]]`
+
+        :param batch_size: Students count written by one request
+        :type batch_size: :obj:`int`
+
+        :return: Returns written, unchanged and invalid students counts.
+        :rtype: :obj:`Tuple[int, int, int]`
+        """
+        return self._import_rows(self._student_sheet_title, students, batch_size)
+
+    def import_teachers(self, teachers: Iterable[Dict[str, str]], batch_size: int = 500) -> Tuple[int, int, int]:
+        """
+        Adds or changes teachers by batches like :meth:`import_students`.
+
+        :param teachers: Teachers with sheet fields: username and ФИО
+        :type teachers: :obj:`Iterable[Dict[str, str]]`
+
+        :param batch_size: Teachers count written by one request
+        :type batch_size: :obj:`int`
+
+        :return: Returns written, unchanged and invalid teachers counts.
+        :rtype: :obj:`Tuple[int, int, int]`
+        """
+        return self._import_rows(self._teacher_sheet_title, teachers, batch_size)
+
+    def _import_rows(self, sheet_title: str, records: Iterable[Dict[str, str]], batch_size: int):
+        attributes = self._attributes.get(sheet_title)
+        written_count = unchanged_count = invalid_count = 0
+
+        # Pending single rows may be older than imported ones.
+        self._writer.flush()
+
+        records = iter(records)
+        while True:
+            batch = {}
+            for record in itertools.islice(records, batch_size):
+                row = [str(record.get(attribute) or "").strip() for attribute in attributes]
+                if not all(row):
+                    invalid_count += 1
+                    self._logger.warning(f"Invalid {sheet_title} row is skipped: {record}")
+                    continue
+
+                # The last duplicate in batch wins like in write-behind queue.
+                batch[row[0]] = row
+            if not batch:
+                break
+
+            # Sheet may have other columns, so only roster ones are compared.
+            roster_rows = self._roster.get_many(list(batch.keys()))[sheet_title]
+            rows = [
+                row
+                for key, row in batch.items()
+                if [roster_rows.get(key, {}).get(attribute, "") for attribute in attributes] != row
+            ]
+            unchanged_count += len(batch) - len(rows)
+
+            if rows:
+                self._handler.add_rows({sheet_title: rows})
+                for row in rows:
+                    self._roster.put(sheet_title, dict(zip(attributes, row)))
+                written_count += len(rows)
+
+        return written_count, unchanged_count, invalid_count
+
+    def get_student_fields(self) -> List[str]:
+        """
+        Gets students sheet fields, which are imported and exported.
+
+        :return: Returns students fields.
+        :rtype: :obj:`List[str]`
+        """
+        return list(self._attributes.get(self._student_sheet_title))
+
+    def get_teacher_fields(self) -> List[str]:
+        """
+        Gets teachers sheet fields, which are imported and exported.
+
+        :return: Returns teachers fields.
+        :rtype: :obj:`List[str]`
+        """
+        return list(self._attributes.get(self._teacher_sheet_title))
+
+    def export_students(self) -> Iterator[Dict[str, str]]:
+        """
+        Streams students from spreadsheet by pages.
+
+        :return: Returns students with sheet fields iterator.
+        :rtype: :obj:`Iterator[Dict[str, str]]`
+        """
+        return self._handler.iter_sheet_records(self._student_sheet_title)
+
+    def export_teachers(self) -> Iterator[Dict[str, str]]:
+        """
+        Streams teachers from spreadsheet by pages.
+
+        :return: Returns teachers with sheet fields iterator.
+        :rtype: :obj:`Iterator[Dict[str, str]]`
+        """
+        return self._handler.iter_sheet_records(self._teacher_sheet_title)
+
+    def find_user(self, username: str) -> Tuple[str, dict]:
+        return self.find_users([username])[username]
+
+    def find_users(self, usernames: List[str]) -> Dict[str, Tuple[str, dict]]:
+        rows = self._roster.get_many(usernames)
+
+        users = {}
+        for username in usernames:
+            student = self._get_student(rows[self._student_sheet_title].get(username, {}))
+            teacher = self._get_teacher(rows[self._teacher_sheet_title].get(username, {}))
+
+            if student:
+                users[username] = ("student", student)
+            elif teacher:
+                users[username] = ("teacher", teacher)
+            else:
+                users[username] = (None, {})
+
+        return users
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        self._roster.close()
+        self._writer.close()
+
     def accept_storage(self, storage: BaseSpreadsheetStorage):
         storage.visit_auth_handler(self)
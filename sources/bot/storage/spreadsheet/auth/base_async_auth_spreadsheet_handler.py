@@ -0,0 +1,157 @@
+"""
+Asynchronous students authorization spreadsheet handler interface module.
+"""
+from abc import ABCMeta, abstractmethod
+from typing import List, Dict, Tuple
+
+from ..base_spreadsheet_handler import BaseSpreadsheetHandler
+
+
+class BaseAsyncAuthSpreadsheetHandler(BaseSpreadsheetHandler):
+    """
+    Asynchronous students authorization spreadsheet handler interface.
+
+    Note: Handler methods are coroutines, so several requests may be awaited concurrently.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    async def add_student(self, username: str, **kwargs):
+        """
+        Adds student data in spreadsheet.
+
+        :param username: Student username
+        :type username: :obj:`str`
+
+        :param kwargs: Student data
+        :type kwargs: :obj:`dict`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_student(self, username: str) -> bool:
+        """
+        Removes student with fields from spreadsheet by his username.
+
+        Note: If such student doesn't exist then it won't be removed.
+
+        :param username: Student username
+        :type username: :obj:`str`
+
+        :return: Returns True on success.
+        :rtype: :obj:`bool`
+        """
+        return False
+
+    @abstractmethod
+    async def get_student_usernames(self) -> List[str]:
+        """
+        Gets all student usernames from spreadsheet.
+
+        Note: If such students don't exist then [] will be returned.
+
+        :return: Returns usernames list.
+        :rtype: :obj:`List[str]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_student_by_username(self, username: str) -> dict:
+        """
+        Gets student with fields from spreadsheet by his username.
+
+        Note: If such student doesn't exist then {} will be returned.
+
+        :param username: Student username
+        :type username: :obj:`str`
+
+        :return: Returns student data.
+        :rtype: :obj:`dict`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_teacher(self, username: str, **kwargs):
+        """
+        Adds teacher data in spreadsheet.
+
+        :param username: Teacher username
+        :type username: :obj:`str`
+
+        :param kwargs: Teacher data
+        :type kwargs: :obj:`dict`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_teacher(self, username: str) -> bool:
+        """
+        Removes teacher with fields from spreadsheet by his username.
+
+        Note: If such teacher doesn't exist then it won't be removed.
+
+        :param username: Teacher username
+        :type username: :obj:`str`
+
+        :return: Returns True on success.
+        :rtype: :obj:`bool`
+        """
+        return False
+
+    @abstractmethod
+    async def get_teacher_usernames(self) -> List[str]:
+        """
+        Gets all teacher usernames from spreadsheet.
+
+        Note: If such teachers don't exist then [] will be returned.
+
+        :return: Returns usernames list.
+        :rtype: :obj:`List[str]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_teacher_by_username(self, username: str) -> dict:
+        """
+        Gets teacher with fields from spreadsheet by his username.
+
+        Note: If such teacher doesn't exist then {} will be returned.
+
+        :param username: Teacher username
+        :type username: :obj:`str`
+
+        :return: Returns teacher data.
+        :rtype: :obj:`dict`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_user(self, username: str) -> Tuple[str, dict]:
+        """
+        Finds student or teacher with fields from spreadsheet by his username.
+
+        Note: If such user doesn't exist then (None, {}) will be returned.
+
+        :param username: User username
+        :type username: :obj:`str`
+
+        :return: Returns user type, which is "student" or "teacher", and user data.
+        :rtype: :obj:`Tuple[str, dict]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_users(self, usernames: List[str]) -> Dict[str, Tuple[str, dict]]:
+        """
+        Finds students and teachers with fields from spreadsheet by their usernames.
+
+        Note: Users are found by one spreadsheet request at most. Unknown users are returned as (None, {}).
+
+        :param usernames: Users usernames
+        :type usernames: :obj:`List[str]`
+
+        :return: Returns usernames and their types and data.
+        :rtype: :obj:`dict[str, Tuple[str, dict]]`
+        """
+        raise NotImplementedError
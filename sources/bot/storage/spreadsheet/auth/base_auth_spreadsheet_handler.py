@@ -2,7 +2,7 @@
 Students authorization spreadsheet handler interface module.
 """
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import List, Dict, Tuple
 
 from ..base_spreadsheet_handler import BaseSpreadsheetHandler
 
@@ -123,3 +123,33 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         :rtype: :obj:`dict`
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def find_user(self, username: str) -> Tuple[str, dict]:
+        """
+        Finds student or teacher with fields from spreadsheet by his username.
+
+        Note: If such user doesn't exist then (None, {}) will be returned.
+
+        :param username: User username
+        :type username: :obj:`str`
+
+        :return: Returns user type, which is "student" or "teacher", and user data.
+        :rtype: :obj:`Tuple[str, dict]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_users(self, usernames: List[str]) -> Dict[str, Tuple[str, dict]]:
+        """
+        Finds students and teachers with fields from spreadsheet by their usernames.
+
+        Note: Users are found by one spreadsheet request at most. Unknown users are returned as (None, {}).
+
+        :param usernames: Users usernames
+        :type usernames: :obj:`List[str]`
+
+        :return: Returns usernames and their types and data.
+        :rtype: :obj:`dict[str, Tuple[str, dict]]`
+        """
+        raise NotImplementedError
@@ -0,0 +1,265 @@
+"""
+Students and teachers roster index implementation module.
+"""
+import threading
+import time
+from typing import Dict, List
+
+from ....loggers import LogInstaller
+from ..request_scheduler import RequestScheduler
+from ..spreadsheet_handler import SpreadsheetHandler
+
+
+class RosterIndex:
+    """
+    Roster index class implementation keeps sheets rows in memory by their first field.
+
+    Note: Index is loaded on first access and then refreshed in background thread. Sheets are loaded without index
+    lock, so readers aren't stalled by loading. Rows put with pending writes aren't changed or removed by refreshes
+    until their writes reach spreadsheet.
+    """
+
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    def __init__(self, handler: SpreadsheetHandler, sheet_titles: List[str], refresh_interval: float = 60):
+        self._handler = handler
+        self._sheet_titles = sheet_titles
+        self._refresh_interval = refresh_interval
+        self._rows: Dict[str, Dict[str, Dict[str, str]]] = {title: {} for title in sheet_titles}
+        # Rows changes times, rows with pending writes are changed at infinity until writes are done.
+        self._changed_at: Dict[str, Dict[str, float]] = {title: {} for title in sheet_titles}
+
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        self._stopped = threading.Event()
+        self._refresher = None
+
+    @staticmethod
+    def _get_key(row: Dict[str, str]) -> str:
+        return next(iter(row.values()), "")
+
+    @staticmethod
+    def _get_rows(records: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        rows = {}
+        for row in records:
+            key = RosterIndex._get_key(row)
+            if key:
+                rows[key] = row
+
+        return rows
+
+    def _apply(self, sheet_title: str, rows: Dict[str, Dict[str, str]], loaded_at: float):
+        with self._lock:
+            index = self._rows[sheet_title]
+            changed_at = self._changed_at[sheet_title]
+
+            # Rows changed by this process after sheet loading are newer than loaded ones.
+            for key in list(index.keys()):
+                if key not in rows and changed_at.get(key, 0) < loaded_at:
+                    del index[key]
+
+            for key, row in rows.items():
+                if index.get(key) != row and changed_at.get(key, 0) < loaded_at:
+                    index[key] = row
+
+            for key in [key for key, timestamp in changed_at.items() if timestamp < loaded_at]:
+                del changed_at[key]
+
+    def refresh(self):
+        """
+        Reloads all sheets by one request and applies only changed rows to index.
+        """
+        loaded_at = time.monotonic()
+        sheets_records = self._handler.get_sheets_records(self._sheet_titles)
+
+        for sheet_title in self._sheet_titles:
+            self._apply(sheet_title, self._get_rows(sheets_records.get(sheet_title, [])), loaded_at)
+
+        with self._lock:
+            self._loaded = True
+
+    def _refresh_loop(self):
+        while not self._stopped.wait(self._refresh_interval):
+            self._refresh_in_background()
+
+    def _refresh_in_background(self):
+        try:
+            with RequestScheduler.lane(RequestScheduler.bulk_lane):
+                self.refresh()
+        except Exception as error:
+            self._logger.error(f"Unable to refresh roster index: {error}")
+
+    def start(self):
+        """
+        Loads index if it isn't loaded and launches background refreshing.
+        """
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self.refresh()
+
+        with self._lock:
+            if self._refresher is None:
+                self._stopped.clear()
+                self._refresher = threading.Thread(target=self._refresh_loop, name="roster-index", daemon=True)
+                self._refresher.start()
+
+    def stop(self):
+        """
+        Stops background refreshing.
+        """
+        self._stopped.set()
+        with self._lock:
+            self._refresher = None
+
+    def close(self):
+        """
+        Stops background refreshing and releases index resources.
+        """
+        self.stop()
+
+    def invalidate(self):
+        """
+        Drops index content, so it will be loaded again on next access.
+        """
+        with self._lock:
+            for rows in self._rows.values():
+                rows.clear()
+            for changed_at in self._changed_at.values():
+                changed_at.clear()
+            self._loaded = False
+
+    def get(self, sheet_title: str, key: str) -> Dict[str, str]:
+        """
+        Gets row by its first field.
+
+        Note: If such row doesn't exist then {} will be returned.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param key: First field in row
+        :type key: :obj:`str`
+
+        :return: Returns row with fields.
+        :rtype: :obj:`dict[str, str]`
+        """
+        self.start()
+        return self._get_row(sheet_title, key)
+
+    def _get_row(self, sheet_title: str, key: str) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._rows[sheet_title].get(key, {}))
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """
+        Gets rows of all sheets by their first fields.
+
+        :param keys: First fields in rows
+        :type keys: :obj:`List[str]`
+
+        :return: Returns sheet titles and their found rows by first fields.
+        :rtype: :obj:`dict[str, dict[str, dict[str, str]]]`
+        """
+        self.start()
+        return self._get_many(keys)
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        with self._lock:
+            return {
+                sheet_title: {key: dict(rows[key]) for key in keys if key in rows}
+                for sheet_title, rows in self._rows.items()
+            }
+
+    def keys(self, sheet_title: str) -> List[str]:
+        """
+        Gets all rows first fields.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns first fields list.
+        :rtype: :obj:`List[str]`
+        """
+        self.start()
+        return self._get_keys(sheet_title)
+
+    def _get_keys(self, sheet_title: str) -> List[str]:
+        with self._lock:
+            return list(self._rows[sheet_title].keys())
+
+    def find(self, sheet_title: str, attributes: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Finds rows with such attributes values.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param attributes: Sheet attributes and their values
+        :type attributes: :obj:`dict[str, str]`
+
+        :return: Returns found rows with fields.
+        :rtype: :obj:`List[dict[str, str]]`
+        """
+        self.start()
+        return self._find(sheet_title, attributes)
+
+    def _find(self, sheet_title: str, attributes: Dict[str, str]) -> List[Dict[str, str]]:
+        with self._lock:
+            return [
+                dict(row)
+                for row in self._rows[sheet_title].values()
+                if all(row.get(attribute) == value for attribute, value in attributes.items())
+            ]
+
+    def _get_changed_at(self, pending: bool) -> float:
+        return float("inf") if pending else time.monotonic()
+
+    def put(self, sheet_title: str, row: Dict[str, str], pending: bool = False):
+        """
+        Adds or changes row in index.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param row: Row with fields
+        :type row: :obj:`dict[str, str]`
+
+        :param pending: Row write is pending, so refreshes keep row until it is marked written
+        :type pending: :obj:`bool`
+        """
+        key = RosterIndex._get_key(row)
+        if key:
+            with self._lock:
+                self._rows[sheet_title][key] = dict(row)
+                self._changed_at[sheet_title][key] = self._get_changed_at(pending)
+
+    def mark_written(self, sheet_keys: Dict[str, List[str]]):
+        """
+        Marks pending rows writes as done, so next refreshes apply sheets changes to them.
+
+        :param sheet_keys: Sheet titles and first fields of written rows
+        :type sheet_keys: :obj:`dict[str, List[str]]`
+        """
+        written_at = time.monotonic()
+        with self._lock:
+            for sheet_title, keys in sheet_keys.items():
+                changed_at = self._changed_at.get(sheet_title, {})
+                for key in keys:
+                    if changed_at.get(key) == float("inf"):
+                        changed_at[key] = written_at
+
+    def remove(self, sheet_title: str, key: str):
+        """
+        Removes row from index by its first field.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param key: First field in row
+        :type key: :obj:`str`
+        """
+        with self._lock:
+            self._rows[sheet_title].pop(key, None)
+            self._changed_at[sheet_title][key] = time.monotonic()
@@ -0,0 +1,68 @@
+import unittest
+
+from ...emulator.fake_sheets_service import FakeSheetsService
+from ..auth_spreadsheet_handler import AuthSpreadsheetHandler
+
+
+class TestEmulatedAuthSpreadsheetHandler(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [
+                    ["username", "ФИО", "Группа", "Подгруппа"],
+                    ["student1", "name1", "group1", "1"],
+                ],
+                "Преподаватели": [["username", "ФИО"]],
+            }
+        )
+        self.handler = AuthSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+
+    def tearDown(self):
+        self.handler.close()
+
+    def test_import_students(self):
+        students = [
+            {"username": f"student{number}", "ФИО": f"name{number}", "Группа": "group1", "Подгруппа": "1"}
+            for number in range(600)
+        ]
+        students.append({"username": "student600", "ФИО": "name600", "Группа": "", "Подгруппа": "1"})
+
+        counts = self.handler.import_students(iter(students), batch_size=200)
+
+        self.assertEqual(counts, (599, 1, 1))
+        self.assertEqual(self.service.requests_count["values.append"], 3)
+        self.assertEqual(len(self.service.get_values(self.spreadsheet_id, "Студенты")), 601)
+        self.assertEqual(self.handler.get_student_by_username("student599")["name"], "name599")
+
+    def test_skip_unchanged_students_with_other_columns(self):
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [
+                    ["username", "ФИО", "Группа", "Подгруппа", "Почта"],
+                    ["student1", "name1", "group1", "1", "student1@example.com"],
+                ],
+                "Преподаватели": [["username", "ФИО"]],
+            }
+        )
+        self.handler.close()
+        self.handler = AuthSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+
+        counts = self.handler.import_students(
+            [{"username": "student1", "ФИО": "name1", "Группа": "group1", "Подгруппа": "1"}]
+        )
+
+        self.assertEqual(counts, (0, 1, 0))
+        self.assertEqual(self.service.requests_count["values.append"], 0)
+
+    def test_export_teachers(self):
+        self.handler.import_teachers([{"username": "teacher1", "ФИО": "name1"}, {"username": "teacher2", "ФИО": "2"}])
+
+        self.assertEqual(
+            list(self.handler.export_teachers()),
+            [{"username": "teacher1", "ФИО": "name1"}, {"username": "teacher2", "ФИО": "2"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
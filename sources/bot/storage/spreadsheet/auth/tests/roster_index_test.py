@@ -0,0 +1,51 @@
+import threading
+import time
+import unittest
+
+from ...emulator.fake_sheets_service import FakeSheetsService
+from ...request_scheduler import RequestScheduler
+from ...spreadsheet_handler import SpreadsheetHandler
+from ..roster_index import RosterIndex
+
+
+class TestRosterIndex(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {"Студенты": [["username", "ФИО"], ["student1", "name1"]], "Преподаватели": [["username", "ФИО"]]}
+        )
+        handler = SpreadsheetHandler("", self.spreadsheet_id, service=self.service, scheduler=RequestScheduler())
+        self.index = RosterIndex(handler, ["Студенты", "Преподаватели"])
+
+    def tearDown(self):
+        self.index.close()
+
+    def test_keep_pending_rows_on_refresh(self):
+        self.index.start()
+        self.index.put("Студенты", {"username": "student2", "ФИО": "name2"}, pending=True)
+        self.index.refresh()
+
+        self.assertEqual(self.index.get("Студенты", "student2"), {"username": "student2", "ФИО": "name2"})
+
+        self.index.mark_written({"Студенты": ["student2"]})
+        self.index.refresh()
+
+        self.assertEqual(self.index.get("Студенты", "student2"), {})
+        self.assertEqual(self.index.keys("Студенты"), ["student1"])
+
+    def test_read_while_loading(self):
+        self.service.latency = 0.5
+        loader = threading.Thread(target=self.index.start)
+        loader.start()
+        time.sleep(0.1)
+
+        started_at = time.monotonic()
+        self.index.put("Преподаватели", {"username": "teacher1", "ФИО": "name1"})
+        self.assertLess(time.monotonic() - started_at, 0.2)
+
+        loader.join()
+        self.assertEqual(self.index.get("Преподаватели", "teacher1"), {"username": "teacher1", "ФИО": "name1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
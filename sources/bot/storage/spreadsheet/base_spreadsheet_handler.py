@@ -22,6 +22,16 @@ class BaseSpreadsheetHandler:
         """
         raise NotImplementedError
 
+    def flush(self):
+        """
+        Writes pending changes to spreadsheet.
+        """
+
+    def close(self):
+        """
+        Releases handler resources.
+        """
+
     @abstractmethod
     def accept_storage(self, storage):
         """
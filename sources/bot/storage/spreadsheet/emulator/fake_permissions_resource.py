@@ -0,0 +1,16 @@
+"""
+Fake Google Drive permissions resource implementation module.
+"""
+from .fake_request import FakeRequest
+
+
+class FakePermissionsResource:
+    """
+    Fake Google Drive v3 permissions resource class implementation.
+    """
+
+    def __init__(self, service):
+        self._service = service
+
+    def create(self, fileId: str, body: dict, fields: str = None) -> FakeRequest:
+        return FakeRequest(self._service, "permissions.create", lambda: self._service.create_permission(fileId, body))
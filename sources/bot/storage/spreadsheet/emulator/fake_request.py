@@ -0,0 +1,26 @@
+"""
+Fake Google API request implementation module.
+"""
+from typing import Callable
+
+
+class FakeRequest:
+    """
+    Fake Google API request class implementation, which is run by emulator on execution like real HTTP request.
+    """
+
+    def __init__(self, service, method_name: str, call: Callable[[], dict]):
+        self._service = service
+        self._method_name = method_name
+        self._call = call
+
+    def execute(self, http=None, num_retries: int = 0) -> dict:
+        """
+        Executes request in emulator.
+
+        Note: Emulator latency and errors are applied to every execution.
+
+        :return: Returns response body.
+        :rtype: :obj:`dict`
+        """
+        return self._service.execute(self._method_name, self._call)
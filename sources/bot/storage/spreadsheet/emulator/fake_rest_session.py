@@ -0,0 +1,109 @@
+"""
+Fake Google Sheets REST API session implementation module.
+"""
+import asyncio
+import contextlib
+import json
+import re
+from typing import List, Tuple
+from urllib.parse import unquote
+
+from googleapiclient.errors import HttpError
+
+from .fake_request import FakeRequest
+
+
+class FakeResponse:
+    """
+    Fake aiohttp response class implementation.
+    """
+
+    def __init__(self, status: int, body: dict):
+        self.status = status
+        self.headers = {}
+        self._body = body
+
+    async def text(self) -> str:
+        return json.dumps(self._body)
+
+    async def json(self) -> dict:
+        return self._body
+
+
+class FakeRestSession:
+    """
+    Fake aiohttp client session class implementation, which routes Sheets v4 and Drive v3 REST requests to emulator.
+
+    Note: Requests are executed by emulator resources in default executor, so emulated latency doesn't block event
+    loop, and they are counted by the same API method names as requests of synchronous handlers.
+    """
+
+    _sheets_url = "https://sheets.googleapis.com/v4/spreadsheets"
+    _drive_url = "https://www.googleapis.com/drive/v3/files"
+
+    def __init__(self, service):
+        self._service = service
+        self.closed = False
+
+    @contextlib.asynccontextmanager
+    async def request(self, method: str, url: str, params=None, json: dict = None, headers: dict = None):
+        params = list(params.items()) if isinstance(params, dict) else list(params or [])
+        yield await self.send(method, url, params, json)
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def _get_request(self, method: str, url: str, params: List[Tuple[str, str]], body: dict) -> FakeRequest:
+        spreadsheets = self._service.spreadsheets()
+
+        if url.startswith(self._drive_url):
+            file_id = url[len(self._drive_url) + 1 :].split("/")[0]
+            return self._service.permissions().create(fileId=file_id, body=body)
+
+        path = url[len(self._sheets_url) :]
+        if method == "POST" and not path:
+            return spreadsheets.create(body=body)
+
+        match = re.fullmatch(r"/([^/:]+)(.*)", path)
+        spreadsheet_id, action = match.group(1), match.group(2)
+        if action == "":
+            return spreadsheets.get(spreadsheetId=spreadsheet_id)
+        if action == ":batchUpdate":
+            return spreadsheets.batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+        if action == "/values:batchGet":
+            ranges = [value for name, value in params if name == "ranges"]
+            return spreadsheets.values().batchGet(spreadsheetId=spreadsheet_id, ranges=ranges)
+        if action == "/values:batchUpdate":
+            return spreadsheets.values().batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+        if action == "/values:batchClear":
+            return spreadsheets.values().batchClear(spreadsheetId=spreadsheet_id, body=body)
+        if action.startswith("/values/") and action.endswith(":append"):
+            sheet_range = unquote(action[len("/values/") : -len(":append")])
+            return spreadsheets.values().append(spreadsheetId=spreadsheet_id, range=sheet_range, body=body)
+
+        raise ValueError(f"Unsupported request: {method} {url}")
+
+    async def send(self, method: str, url: str, params: List[Tuple[str, str]], body: dict) -> FakeResponse:
+        """
+        Executes REST request in emulator.
+
+        :param method: HTTP method
+        :type method: :obj:`str`
+
+        :param url: Request URL
+        :type url: :obj:`str`
+
+        :param params: Query parameters
+        :type params: :obj:`List[Tuple[str, str]]`
+
+        :param body: JSON request body
+        :type body: :obj:`dict`
+
+        :return: Returns response with emulator status and body.
+        :rtype: :obj:`FakeResponse`
+        """
+        request = self._get_request(method, url, params, body)
+        try:
+            return FakeResponse(200, await asyncio.get_event_loop().run_in_executor(None, request.execute))
+        except HttpError as error:
+            return FakeResponse(error.resp.status, json.loads(error.content))
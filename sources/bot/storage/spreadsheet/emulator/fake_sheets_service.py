@@ -0,0 +1,311 @@
+"""
+Offline Google Sheets API emulator implementation module.
+"""
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from ..util.a1_notation import A1Notation
+from .fake_permissions_resource import FakePermissionsResource
+from .fake_rest_session import FakeRestSession
+from .fake_spreadsheets_resource import FakeSpreadsheetsResource
+
+
+class FakeSheetsService:
+    """
+    Offline Google Sheets v4 and Drive v3 service emulator class implementation.
+
+    Note: Emulator is passed to spreadsheet handler instead of discovery service. It supports values batchGet,
+    batchUpdate, batchClear and append, spreadsheets create, get and batchUpdate with addSheet requests and
+    permissions create. REST session over the same spreadsheets is passed to asynchronous spreadsheet handler instead
+    of HTTP session. Every request execution waits latency seconds and fails with error status by error rate
+    probability, so tests and benchmarks are deterministic for the same seed.
+    """
+
+    _default_row_count = 1000
+    _default_column_count = 26
+
+    def __init__(self, latency: float = 0, error_rate: float = 0, error_status: int = 503, seed: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_count = Counter()
+
+        self._random = random.Random(seed)
+        self._failures: List[int] = []
+        self._spreadsheets: Dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def spreadsheets(self) -> FakeSpreadsheetsResource:
+        return FakeSpreadsheetsResource(self)
+
+    def permissions(self) -> FakePermissionsResource:
+        return FakePermissionsResource(self)
+
+    def session(self) -> FakeRestSession:
+        return FakeRestSession(self)
+
+    def fail_next(self, count: int = 1, status: int = 503) -> None:
+        """
+        Makes next requests fail.
+
+        :param count: Failed requests count
+        :type count: :obj:`int`
+
+        :param status: HTTP error status
+        :type status: :obj:`int`
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def execute(self, method_name: str, call: Callable[[], dict]) -> dict:
+        """
+        Executes request with emulated latency and errors.
+
+        :param method_name: API method name
+        :type method_name: :obj:`str`
+
+        :param call: Request handler
+        :type call: :obj:`Callable[[], dict]`
+
+        :return: Returns response body.
+        :rtype: :obj:`dict`
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.requests_count[method_name] += 1
+
+            if self._failures:
+                raise self._get_error(self._failures.pop(0), "Injected error")
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise self._get_error(self.error_status, "Injected error")
+
+            return call()
+
+    @staticmethod
+    def _get_error(status: int, message: str) -> HttpError:
+        response = httplib2.Response({"status": status})
+        response.reason = message
+        content = json.dumps({"error": {"code": status, "message": message}}).encode()
+        return HttpError(response, content)
+
+    def add_spreadsheet(self, sheets: Dict[str, List[List[str]]], spreadsheet_id: str = None, title: str = "") -> str:
+        """
+        Adds spreadsheet with filled sheets.
+
+        :param sheets: Sheet titles and their rows
+        :type sheets: :obj:`dict[str, List[List[str]]]`
+
+        :param spreadsheet_id: Spreadsheet unique id. If it isn't defined then it will be generated.
+        :type spreadsheet_id: :obj:`str`
+
+        :param title: Spreadsheet title
+        :type title: :obj:`str`
+
+        :return: Returns spreadsheet id.
+        :rtype: :obj:`str`
+        """
+        with self._lock:
+            spreadsheet_id = spreadsheet_id or f"fake-spreadsheet-{next(self._ids)}"
+            self._spreadsheets[spreadsheet_id] = {"title": title, "sheets": {}}
+
+            for sheet_title, rows in sheets.items():
+                sheet = self._add_sheet(spreadsheet_id, sheet_title)
+                sheet["rows"] = [[str(value) for value in row] for row in rows]
+                sheet["rowCount"] = max(sheet["rowCount"], len(rows))
+                sheet["columnCount"] = max([sheet["columnCount"]] + [len(row) for row in rows])
+
+            return spreadsheet_id
+
+    def get_values(self, spreadsheet_id: str, sheet_title: str) -> List[List[str]]:
+        """
+        Gets sheet rows without trailing blank rows and cells like spreadsheet gives them.
+
+        :param spreadsheet_id: Spreadsheet unique id
+        :type spreadsheet_id: :obj:`str`
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns sheet rows.
+        :rtype: :obj:`List[List[str]]`
+        """
+        with self._lock:
+            return self._trim(self._get_sheet(spreadsheet_id, sheet_title)["rows"])
+
+    def _get_spreadsheet(self, spreadsheet_id: str) -> dict:
+        spreadsheet = self._spreadsheets.get(spreadsheet_id)
+        if spreadsheet is None:
+            raise self._get_error(404, f"Requested entity was not found: {spreadsheet_id}")
+        return spreadsheet
+
+    def _get_sheet(self, spreadsheet_id: str, sheet_title: str) -> dict:
+        sheet = self._get_spreadsheet(spreadsheet_id)["sheets"].get(sheet_title)
+        if sheet is None:
+            raise self._get_error(400, f"Unable to parse range: {sheet_title}")
+        return sheet
+
+    def _add_sheet(self, spreadsheet_id: str, sheet_title: str, sheet_id: int = None) -> dict:
+        sheets = self._get_spreadsheet(spreadsheet_id)["sheets"]
+        if sheet_title in sheets:
+            raise self._get_error(400, f'A sheet with the name "{sheet_title}" already exists')
+
+        sheet = {
+            "sheetId": sheet_id if sheet_id is not None else next(self._ids),
+            "index": len(sheets),
+            "rowCount": self._default_row_count,
+            "columnCount": self._default_column_count,
+            "rows": [],
+        }
+        sheets[sheet_title] = sheet
+        return sheet
+
+    @staticmethod
+    def _trim(rows: List[List[str]]) -> List[List[str]]:
+        trimmed_rows = []
+        for row in rows:
+            row = list(row)
+            while row and row[-1] == "":
+                row.pop()
+            trimmed_rows.append(row)
+
+        while trimmed_rows and not trimmed_rows[-1]:
+            trimmed_rows.pop()
+
+        return trimmed_rows
+
+    def _get_bounds(self, spreadsheet_id: str, sheet_range: str, check_grid: bool = True):
+        try:
+            sheet_title, first_row, last_row, first_column, last_column = A1Notation.parse_range(sheet_range)
+        except ValueError:
+            raise self._get_error(400, f"Unable to parse range: {sheet_range}")
+
+        sheet = self._get_sheet(spreadsheet_id, sheet_title)
+        first_row, last_row = first_row or 1, last_row or sheet["rowCount"]
+        first_column, last_column = first_column or 1, last_column or sheet["columnCount"]
+
+        if check_grid and (last_row > sheet["rowCount"] or last_column > sheet["columnCount"]):
+            raise self._get_error(
+                400,
+                f"Range ({sheet_range}) exceeds grid limits. Max rows: {sheet['rowCount']}, "
+                f"max columns: {sheet['columnCount']}",
+            )
+
+        return sheet, first_row, last_row, first_column, last_column
+
+    def batch_get_values(self, spreadsheet_id: str, ranges: List[str]) -> dict:
+        value_ranges = []
+        for sheet_range in ranges:
+            sheet, first_row, last_row, first_column, last_column = self._get_bounds(spreadsheet_id, sheet_range)
+            rows = [row[first_column - 1 : last_column] for row in sheet["rows"][first_row - 1 : last_row]]
+
+            value_range = {"range": sheet_range, "majorDimension": "ROWS"}
+            values = self._trim(rows)
+            if values:
+                value_range["values"] = values
+            value_ranges.append(value_range)
+
+        return {"spreadsheetId": spreadsheet_id, "valueRanges": value_ranges}
+
+    def _write_values(self, sheet: dict, first_row: int, first_column: int, values: List[List[str]]) -> None:
+        rows = sheet["rows"]
+        for row_offset, row_values in enumerate(values):
+            row_index = first_row - 1 + row_offset
+            while len(rows) <= row_index:
+                rows.append([])
+
+            row = rows[row_index]
+            for column_offset, value in enumerate(row_values):
+                column_index = first_column - 1 + column_offset
+                while len(row) <= column_index:
+                    row.append("")
+                row[column_index] = "" if value is None else str(value)
+
+            # Spreadsheet grid grows on writing out of it.
+            sheet["rowCount"] = max(sheet["rowCount"], row_index + 1)
+            sheet["columnCount"] = max(sheet["columnCount"], first_column - 1 + len(row_values))
+
+    def batch_update_values(self, spreadsheet_id: str, body: dict) -> dict:
+        updated_cells = 0
+        for data in body.get("data", []):
+            sheet, first_row, _, first_column, _ = self._get_bounds(spreadsheet_id, data["range"], False)
+            values = data.get("values", [])
+            self._write_values(sheet, first_row, first_column, values)
+            updated_cells += sum(len(row) for row in values)
+
+        return {"spreadsheetId": spreadsheet_id, "totalUpdatedCells": updated_cells}
+
+    def batch_clear_values(self, spreadsheet_id: str, body: dict) -> dict:
+        for sheet_range in body.get("ranges", []):
+            sheet, first_row, last_row, first_column, last_column = self._get_bounds(spreadsheet_id, sheet_range)
+            for row in sheet["rows"][first_row - 1 : last_row]:
+                for column_index in range(first_column - 1, min(last_column, len(row))):
+                    row[column_index] = ""
+
+        return {"spreadsheetId": spreadsheet_id, "clearedRanges": body.get("ranges", [])}
+
+    def append_values(self, spreadsheet_id: str, sheet_range: str, body: dict) -> dict:
+        sheet, _, _, first_column, _ = self._get_bounds(spreadsheet_id, sheet_range, False)
+        first_row = len(self._trim(sheet["rows"])) + 1
+        values = body.get("values", [])
+        self._write_values(sheet, first_row, first_column, values)
+
+        sheet_title = A1Notation.parse_range(sheet_range)[0]
+        last_column = first_column + max([len(row) for row in values] + [1]) - 1
+        updated_range = A1Notation.get_range(
+            sheet_title, first_row, first_row + max(len(values), 1) - 1, last_column, first_column
+        )
+        return {"spreadsheetId": spreadsheet_id, "updates": {"updatedRange": updated_range}}
+
+    def create_spreadsheet(self, body: dict) -> dict:
+        spreadsheet_id = f"fake-spreadsheet-{next(self._ids)}"
+        self._spreadsheets[spreadsheet_id] = {"title": body.get("properties", {}).get("title", ""), "sheets": {}}
+
+        for sheet in body.get("sheets", []) or [{"properties": {}}]:
+            properties = sheet.get("properties", {})
+            self._add_sheet(spreadsheet_id, properties.get("title") or "Sheet1", properties.get("sheetId"))
+
+        return self.get_spreadsheet(spreadsheet_id)
+
+    def get_spreadsheet(self, spreadsheet_id: str) -> dict:
+        spreadsheet = self._get_spreadsheet(spreadsheet_id)
+        sheets = [
+            {
+                "properties": {
+                    "sheetId": sheet["sheetId"],
+                    "title": sheet_title,
+                    "index": sheet["index"],
+                    "sheetType": "GRID",
+                    "gridProperties": {"rowCount": sheet["rowCount"], "columnCount": sheet["columnCount"]},
+                }
+            }
+            for sheet_title, sheet in spreadsheet["sheets"].items()
+        ]
+        return {"spreadsheetId": spreadsheet_id, "properties": {"title": spreadsheet["title"]}, "sheets": sheets}
+
+    def batch_update(self, spreadsheet_id: str, body: dict) -> dict:
+        replies = []
+        for request in body.get("requests", []):
+            if "addSheet" not in request:
+                raise self._get_error(400, f"Unsupported request: {', '.join(request.keys())}")
+
+            properties = request["addSheet"].get("properties", {})
+            sheet_title = properties.get("title") or f"Sheet{len(self._get_spreadsheet(spreadsheet_id)['sheets']) + 1}"
+            sheet = self._add_sheet(spreadsheet_id, sheet_title, properties.get("sheetId"))
+            replies.append({"addSheet": {"properties": {"sheetId": sheet["sheetId"], "title": sheet_title}}})
+
+        return {"spreadsheetId": spreadsheet_id, "replies": replies}
+
+    def create_permission(self, file_id: str, body: dict) -> dict:
+        self._get_spreadsheet(file_id)
+        return {"id": f"permission-{next(self._ids)}"}
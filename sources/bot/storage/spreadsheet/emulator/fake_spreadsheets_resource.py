@@ -0,0 +1,28 @@
+"""
+Fake Google Sheets spreadsheets resource implementation module.
+"""
+from .fake_request import FakeRequest
+from .fake_values_resource import FakeValuesResource
+
+
+class FakeSpreadsheetsResource:
+    """
+    Fake Google Sheets v4 spreadsheets resource class implementation.
+    """
+
+    def __init__(self, service):
+        self._service = service
+
+    def create(self, body: dict) -> FakeRequest:
+        return FakeRequest(self._service, "spreadsheets.create", lambda: self._service.create_spreadsheet(body))
+
+    def get(self, spreadsheetId: str, **kwargs) -> FakeRequest:
+        return FakeRequest(self._service, "spreadsheets.get", lambda: self._service.get_spreadsheet(spreadsheetId))
+
+    def batchUpdate(self, spreadsheetId: str, body: dict) -> FakeRequest:
+        return FakeRequest(
+            self._service, "spreadsheets.batchUpdate", lambda: self._service.batch_update(spreadsheetId, body)
+        )
+
+    def values(self) -> FakeValuesResource:
+        return FakeValuesResource(self._service)
@@ -0,0 +1,38 @@
+"""
+Fake Google Sheets values resource implementation module.
+"""
+from typing import List
+
+from .fake_request import FakeRequest
+
+
+class FakeValuesResource:
+    """
+    Fake Google Sheets v4 spreadsheets values resource class implementation.
+    """
+
+    def __init__(self, service):
+        self._service = service
+
+    def batchGet(self, spreadsheetId: str, ranges: List[str], **kwargs) -> FakeRequest:
+        if isinstance(ranges, str):
+            ranges = [ranges]
+
+        return FakeRequest(
+            self._service, "values.batchGet", lambda: self._service.batch_get_values(spreadsheetId, ranges)
+        )
+
+    def batchUpdate(self, spreadsheetId: str, body: dict) -> FakeRequest:
+        return FakeRequest(
+            self._service, "values.batchUpdate", lambda: self._service.batch_update_values(spreadsheetId, body)
+        )
+
+    def batchClear(self, spreadsheetId: str, body: dict) -> FakeRequest:
+        return FakeRequest(
+            self._service, "values.batchClear", lambda: self._service.batch_clear_values(spreadsheetId, body)
+        )
+
+    def append(self, spreadsheetId: str, range: str, body: dict, **kwargs) -> FakeRequest:
+        return FakeRequest(
+            self._service, "values.append", lambda: self._service.append_values(spreadsheetId, range, body)
+        )
@@ -0,0 +1,310 @@
+"""
+Spreadsheet requests scheduler implementation module.
+"""
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from googleapiclient.errors import HttpError
+
+from ...exceptions import SpreadsheetRequestCancelledException, SpreadsheetRequestException
+from ...loggers import LogInstaller
+from ...util.token_bucket import TokenBucket
+
+
+class RequestTimer:
+    """
+    Request timer class implementation measures time of one call spent on its requests by spreadsheet service.
+
+    Note: Time spent by requests in scheduler queue and retry backoff isn't service time. If timer is cancelled then
+    further requests of call aren't made.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.cancelled = threading.Event()
+        self._waited = 0.0
+        self._waiting_since = None
+        self._waiting_count = 0
+        self._lock = threading.Lock()
+
+    def start_waiting(self) -> None:
+        # Concurrent requests of one call wait together, so their overlapping waits are counted once.
+        with self._lock:
+            if self._waiting_count == 0:
+                self._waiting_since = time.monotonic()
+            self._waiting_count += 1
+
+    def stop_waiting(self) -> None:
+        with self._lock:
+            self._waiting_count -= 1
+            if self._waiting_count == 0:
+                self._waited += time.monotonic() - self._waiting_since
+                self._waiting_since = None
+
+    def get_service_time(self) -> float:
+        """
+        Gets time spent since timer start except time spent in queue and backoff.
+
+        :return: Returns time in seconds.
+        :rtype: :obj:`float`
+        """
+        with self._lock:
+            now = time.monotonic()
+            waited = self._waited + (now - self._waiting_since if self._waiting_since is not None else 0)
+        return now - self.started_at - waited
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+class RequestScheduler:
+    """
+    Spreadsheet requests scheduler class implementation keeps requests rate under Sheets API quotas.
+
+    Note: Read and write requests take tokens from their own buckets sized by per minute quotas. When tokens are out,
+    requests wait in queue, and requests of interactive lane go ahead of bulk lane ones. Requests failed by exceeded
+    quota or server error are retried with exponential backoff and full jitter, non-idempotent ones are retried only
+    on exceeded quota because such request isn't processed.
+
+    Lane is chosen by calling thread, see :meth:`lane`. Requests of asynchronous handlers are scheduled by
+    :meth:`execute_async` with the same buckets and queue, but they wait for their turn without blocking event loop.
+    Waiting of requests is excluded from service time of their call, see :meth:`timing`.
+    """
+
+    interactive_lane = 0
+    bulk_lane = 1
+
+    read = "read"
+    write = "write"
+
+    _retryable_statuses = {429, 500, 502, 503, 504}
+    _poll_interval = 0.05
+    _local = threading.local()
+    _timer: contextvars.ContextVar = contextvars.ContextVar("request_timer", default=None)
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    def __init__(
+        self,
+        read_quota: int = 60,
+        write_quota: int = 60,
+        period: float = 60,
+        max_retries: int = 5,
+        base_delay: float = 1,
+        max_delay: float = 32,
+        seed: int = None,
+    ):
+        self._buckets = {self.read: TokenBucket(read_quota, period), self.write: TokenBucket(write_quota, period)}
+        self._waiters: Dict[str, List[Tuple[int, int]]] = {self.read: [], self.write: []}
+        self._tickets = itertools.count()
+        self._condition = threading.Condition()
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._random = random.Random(seed)
+
+        # Counters of requests, waited for tokens, rejected by exceeded quota, retried and finally failed ones.
+        self.counters = Counter()
+
+    @classmethod
+    @contextlib.contextmanager
+    def lane(cls, lane: int):
+        """
+        Sets lane of requests made by current thread inside context.
+
+        :param lane: Requests lane, :attr:`interactive_lane` or :attr:`bulk_lane`
+        :type lane: :obj:`int`
+        """
+        previous_lane = cls._get_lane()
+        cls._local.lane = lane
+        try:
+            yield
+        finally:
+            cls._local.lane = previous_lane
+
+    @classmethod
+    def _get_lane(cls) -> int:
+        return getattr(cls._local, "lane", cls.interactive_lane)
+
+    @classmethod
+    @contextlib.contextmanager
+    def timing(cls, timer: RequestTimer):
+        """
+        Sets timer of requests made inside context, tasks and executor calls copying context use it too.
+
+        :param timer: Request timer
+        :type timer: :obj:`RequestTimer`
+        """
+        token = cls._timer.set(timer)
+        try:
+            yield
+        finally:
+            cls._timer.reset(token)
+
+    @classmethod
+    @contextlib.contextmanager
+    def _waiting(cls):
+        timer: RequestTimer = cls._timer.get()
+        if timer is not None:
+            if timer.cancelled.is_set():
+                raise SpreadsheetRequestCancelledException("Spreadsheet request call is timed out")
+            timer.start_waiting()
+        try:
+            yield
+        finally:
+            if timer is not None:
+                timer.stop_waiting()
+
+        if timer is not None and timer.cancelled.is_set():
+            raise SpreadsheetRequestCancelledException("Spreadsheet request call is timed out")
+
+    def _sleep(self, delay: float) -> None:
+        timer: RequestTimer = self._timer.get()
+        with self._waiting():
+            if timer is not None:
+                timer.cancelled.wait(delay)
+            else:
+                time.sleep(delay)
+
+    def _acquire(self, kind: str) -> None:
+        bucket = self._buckets[kind]
+        waiters = self._waiters[kind]
+        ticket = (self._get_lane(), next(self._tickets))
+
+        with self._waiting(), self._condition:
+            heapq.heappush(waiters, ticket)
+            queued = False
+            while True:
+                delay = None
+                if waiters[0] == ticket:
+                    delay = bucket.take()
+                    if delay == 0:
+                        heapq.heappop(waiters)
+                        self._condition.notify_all()
+                        return
+
+                if not queued:
+                    self.counters["queued"] += 1
+                    queued = True
+                # Only first waiter waits for token, others wait for their turn.
+                self._condition.wait(delay)
+
+    async def _acquire_async(self, kind: str) -> None:
+        bucket = self._buckets[kind]
+        waiters = self._waiters[kind]
+        ticket = (self._get_lane(), next(self._tickets))
+
+        with self._waiting():
+            with self._condition:
+                heapq.heappush(waiters, ticket)
+            queued = False
+            try:
+                while True:
+                    delay = None
+                    with self._condition:
+                        if waiters[0] == ticket:
+                            delay = bucket.take()
+                            if delay == 0:
+                                heapq.heappop(waiters)
+                                self._condition.notify_all()
+                                return
+
+                    if not queued:
+                        self.counters["queued"] += 1
+                        queued = True
+                    # Waiting threads notify condition only, so coroutine polls for its turn.
+                    await asyncio.sleep(self._poll_interval if delay is None else delay)
+            except BaseException:
+                with self._condition:
+                    if ticket in waiters:
+                        waiters.remove(ticket)
+                        heapq.heapify(waiters)
+                        self._condition.notify_all()
+                raise
+
+    def _get_retry_delay(
+        self, kind: str, status: int, retry_after: Optional[str], attempt: int, idempotent: bool
+    ) -> Optional[float]:
+        # Failed request isn't retried if None is returned.
+        if status == 429:
+            self.counters["throttled"] += 1
+            with self._condition:
+                self._buckets[kind].drain()
+
+        retryable = status == 429 or (idempotent and status in self._retryable_statuses)
+        if not retryable or attempt >= self._max_retries:
+            self.counters["failed"] += 1
+            return None
+
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = self._random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+        self.counters["retried"] += 1
+        self._logger.warning(f"Spreadsheet {kind} request failed with status {status}, retry in {delay:.1f}s")
+        return delay
+
+    def execute(self, request, kind: str, idempotent: bool = True) -> dict:
+        """
+        Executes Google API request when quota allows it and retries it on transient errors.
+
+        :param request: Google API request
+        :type request: :obj:`googleapiclient.http.HttpRequest`
+
+        :param kind: Request kind, :attr:`read` or :attr:`write`
+        :type kind: :obj:`str`
+
+        :param idempotent: Whether request may be retried after server error
+        :type idempotent: :obj:`bool`
+
+        :return: Returns response body.
+        :rtype: :obj:`dict`
+        """
+        for attempt in itertools.count():
+            self._acquire(kind)
+            self.counters["requests"] += 1
+            try:
+                return request.execute()
+            except HttpError as error:
+                delay = self._get_retry_delay(
+                    kind, error.resp.status, error.resp.get("retry-after"), attempt, idempotent
+                )
+                if delay is None:
+                    raise
+                self._sleep(delay)
+
+    async def execute_async(self, send: Callable[[], Awaitable[dict]], kind: str, idempotent: bool = True) -> dict:
+        """
+        Sends request of asynchronous handler when quota allows it and retries it on transient errors.
+
+        :param send: Coroutine function sending request, it is called again for every retry
+        :type send: :obj:`Callable[[], Awaitable[dict]]`
+
+        :param kind: Request kind, :attr:`read` or :attr:`write`
+        :type kind: :obj:`str`
+
+        :param idempotent: Whether request may be retried after server error
+        :type idempotent: :obj:`bool`
+
+        :return: Returns response body.
+        :rtype: :obj:`dict`
+        """
+        for attempt in itertools.count():
+            await self._acquire_async(kind)
+            self.counters["requests"] += 1
+            try:
+                return await send()
+            except SpreadsheetRequestException as error:
+                delay = self._get_retry_delay(kind, error.status, error.retry_after, attempt, idempotent)
+                if delay is None:
+                    raise
+                with self._waiting():
+                    await asyncio.sleep(delay)
@@ -0,0 +1,130 @@
+"""
+Google API services registry implementation module.
+"""
+import json
+import os
+import threading
+from typing import Dict, Tuple
+
+import googleapiclient
+from googleapiclient.discovery import build_from_document
+from oauth2client.service_account import ServiceAccountCredentials
+
+from .request_scheduler import RequestScheduler
+from .util.authorized_http_pool import AuthorizedHttpPool
+
+
+class ServiceRegistry:
+    """
+    Google API services registry class implementation.
+
+    Note: Credentials are loaded once per token file, discovery documents are read once from static copies bundled
+    with Google API client instead of fetching them, and services of one token file share authorized HTTP
+    connections pool. So handlers created for every loaded test don't repeat credentials loading and discovery.
+
+    Handlers of one token file share requests scheduler too, because API quotas are counted per service account.
+    """
+
+    scopes = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
+    pool_size = 4
+
+    _credentials: Dict[str, ServiceAccountCredentials] = {}
+    _pools: Dict[str, AuthorizedHttpPool] = {}
+    _documents: Dict[Tuple[str, str], dict] = {}
+    _services: Dict[Tuple[str, str, str], object] = {}
+    _schedulers: Dict[str, RequestScheduler] = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def get_credentials(cls, file_name: str) -> ServiceAccountCredentials:
+        """
+        Gets service account credentials loaded from token file.
+
+        :param file_name: Token file name
+        :type file_name: :obj:`str`
+
+        :return: Returns credentials.
+        :rtype: :obj:`ServiceAccountCredentials`
+        """
+        with cls._lock:
+            if file_name not in cls._credentials:
+                cls._credentials[file_name] = ServiceAccountCredentials.from_json_keyfile_name(file_name, cls.scopes)
+            return cls._credentials[file_name]
+
+    @classmethod
+    def get_http(cls, file_name: str) -> AuthorizedHttpPool:
+        """
+        Gets authorized HTTP connections pool of token file.
+
+        :param file_name: Token file name
+        :type file_name: :obj:`str`
+
+        :return: Returns connections pool.
+        :rtype: :obj:`AuthorizedHttpPool`
+        """
+        with cls._lock:
+            if file_name not in cls._pools:
+                cls._pools[file_name] = AuthorizedHttpPool(cls.get_credentials(file_name), cls.pool_size)
+            return cls._pools[file_name]
+
+    @classmethod
+    def _get_document(cls, name: str, version: str) -> dict:
+        if (name, version) not in cls._documents:
+            path = os.path.join(
+                os.path.dirname(googleapiclient.__file__), "discovery_cache", "documents", f"{name}.{version}.json"
+            )
+            with open(path, encoding="utf-8") as document_file:
+                cls._documents[(name, version)] = json.load(document_file)
+        return cls._documents[(name, version)]
+
+    @classmethod
+    def get_service(cls, file_name: str, name: str = "sheets", version: str = "v4"):
+        """
+        Gets Google API service authorized by token file.
+
+        :param file_name: Token file name
+        :type file_name: :obj:`str`
+
+        :param name: API name
+        :type name: :obj:`str`
+
+        :param version: API version
+        :type version: :obj:`str`
+
+        :return: Returns API service resource.
+        """
+        with cls._lock:
+            if (file_name, name, version) not in cls._services:
+                cls._services[(file_name, name, version)] = build_from_document(
+                    cls._get_document(name, version), http=cls.get_http(file_name)
+                )
+            return cls._services[(file_name, name, version)]
+
+    @classmethod
+    def get_scheduler(cls, file_name: str) -> RequestScheduler:
+        """
+        Gets requests scheduler of token file.
+
+        :param file_name: Token file name
+        :type file_name: :obj:`str`
+
+        :return: Returns requests scheduler.
+        :rtype: :obj:`RequestScheduler`
+        """
+        with cls._lock:
+            if file_name not in cls._schedulers:
+                cls._schedulers[file_name] = RequestScheduler()
+            return cls._schedulers[file_name]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Closes pooled connections and forgets loaded credentials and services.
+        """
+        with cls._lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._credentials.clear()
+            cls._pools.clear()
+            cls._services.clear()
+            cls._schedulers.clear()
@@ -1,36 +1,84 @@
 """
 Row spreadsheet handler implementation module.
 """
-from typing import List, Dict
-import httplib2
-import apiclient
-from oauth2client.service_account import ServiceAccountCredentials
+import threading
+import time
+from typing import List, Dict, Iterator, Tuple
+
+from ...exceptions import SpreadsheetHandlerException
+from .request_scheduler import RequestScheduler
+from .service_registry import ServiceRegistry
+from .util.a1_notation import A1Notation
+from .util.ttl_cache import TtlCache
 
 
 class SpreadsheetHandler:
     """
     Row spreadsheet handler class  implementation.
+
+    Note: Sheets properties and header rows are cached for metadata ttl seconds. They are invalidated by this
+    handler writes, so only changes made by other spreadsheet clients may be seen with delay.
+
+    Services are shared by handlers of one token file through :class:`ServiceRegistry`. Sheets and Drive services
+    may be passed instead of credentials, for example offline spreadsheet emulator.
+
+    Every request passes through :class:`RequestScheduler`, which is shared by handlers of one token file too.
+
+    Rows positions are cached by first columns to change existing rows without reading. New rows are appended by
+    spreadsheet after the last sheet row, so rows added by other clients aren't overwritten. Cached positions are
+    read again in metadata ttl seconds, or at once if appended rows land not where they are expected.
     """
 
-    def __init__(self, file_name: str, spreadsheet_id: str):
+    _sheets_properties_key = "sheets_properties"
+
+    def __init__(
+        self,
+        file_name: str,
+        spreadsheet_id: str,
+        metadata_ttl: float = 300,
+        service=None,
+        scheduler: RequestScheduler = None,
+    ):
         self._spreadsheet_id = spreadsheet_id
         self._credentials_file = file_name
         self._created_sheets = []
-
-        self._credentials = ServiceAccountCredentials.from_json_keyfile_name(
-            self._credentials_file,
-            ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"],
-        )
-        self._http_auth = self._credentials.authorize(httplib2.Http())
-        self._service = apiclient.discovery.build("sheets", "v4", http=self._http_auth)
+        self._metadata_cache = TtlCache(metadata_ttl)
+
+        # First column values to row numbers map, next free row number pointer and loading time of sheets.
+        self._row_numbers: Dict[str, Dict[str, int]] = {}
+        self._next_row_numbers: Dict[str, int] = {}
+        self._row_numbers_loaded_at: Dict[str, float] = {}
+        self._row_numbers_ttl = metadata_ttl
+        self._row_numbers_versions: Dict[str, int] = {}
+        self._row_numbers_lock = threading.RLock()
+
+        if service is None:
+            self._service = ServiceRegistry.get_service(self._credentials_file)
+            self._drive_service = None
+            self._scheduler = scheduler or ServiceRegistry.get_scheduler(self._credentials_file)
+        else:
+            self._service = service
+            self._drive_service = service
+            self._scheduler = scheduler or RequestScheduler()
 
         if len(spreadsheet_id) != 0:
             print(
                 f"Open existing spreadsheet at https://docs.google.com/spreadsheets/d/{self._spreadsheet_id}/edit#gid=0"
             )
 
-    def create_sheet(self, sheet_title: str) -> None:
-        self._service.spreadsheets().batchUpdate(
+    def create_sheet(self, sheet_title: str, header: List[str] = None) -> None:
+        """
+        Creates sheet with ability to write its first row.
+
+        Note: Created sheet is known to be empty, so its first row is written without reading sheet.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param header: Sheet first row
+        :type header: :obj:`List[str]`
+        """
+        request = self._service.spreadsheets().batchUpdate(
             spreadsheetId=self._spreadsheet_id,
             body={
                 "requests": [
@@ -43,7 +91,16 @@ class SpreadsheetHandler:
                     }
                 ]
             },
-        ).execute()
+        )
+        self._scheduler.execute(request, RequestScheduler.write, idempotent=False)
+
+        self._metadata_cache.invalidate(self._sheets_properties_key)
+
+        if header is not None:
+            with self._row_numbers_lock:
+                self._change_row_numbers_version(sheet_title)
+                self._set_row_numbers(sheet_title, [])
+                self.add_rows({sheet_title: [header]})
 
     def create_spreadsheet(self, spreadsheet_title: str, default_sheet_title=None):
         """
@@ -58,67 +115,387 @@ class SpreadsheetHandler:
 
         """
 
-        spreadsheet = (
-            self._service.spreadsheets()
-            .create(
-                body={
-                    "properties": {"title": spreadsheet_title, "locale": "ru_RU"},
-                    "sheets": [
-                        {
-                            "properties": {
-                                "sheetType": "GRID",
-                                "sheetId": 0,
-                                "title": default_sheet_title,
-                            }
+        request = self._service.spreadsheets().create(
+            body={
+                "properties": {"title": spreadsheet_title, "locale": "ru_RU"},
+                "sheets": [
+                    {
+                        "properties": {
+                            "sheetType": "GRID",
+                            "sheetId": 0,
+                            "title": default_sheet_title,
                         }
-                    ],
-                }
-            )
-            .execute()
+                    }
+                ],
+            }
         )
+        spreadsheet = self._scheduler.execute(request, RequestScheduler.write, idempotent=False)
 
         self._spreadsheet_id = spreadsheet["spreadsheetId"]
+        self._metadata_cache.clear()
 
         print(f"Created new spreadsheet at https://docs.google.com/spreadsheets/d/{self._spreadsheet_id}/edit#gid=0")
 
         self._get_permissions()
 
     def _get_permissions(self) -> None:
-        drive_service = apiclient.discovery.build("drive", "v3", http=self._http_auth)
-        drive_service.permissions().create(
+        if self._drive_service is None:
+            self._drive_service = ServiceRegistry.get_service(self._credentials_file, "drive", "v3")
+
+        request = self._drive_service.permissions().create(
             fileId=self._spreadsheet_id, body={"type": "anyone", "role": "reader"}, fields="id"
-        ).execute()
+        )
+        self._scheduler.execute(request, RequestScheduler.write)
 
-    def get_sheet_values(self, sheet_title: str, corner_from: str, corner_to: str):
-        return (
+    def batch_get_sheet_values(self, ranges: List[str]) -> dict:
+        """
+        Gets values of several ranges by one request.
+
+        :param ranges: Ranges in A1 notation
+        :type ranges: :obj:`List[str]`
+
+        :return: Returns response with value ranges in the same order.
+        :rtype: :obj:`dict`
+        """
+        request = (
             self._service.spreadsheets()
             .values()
             .batchGet(
                 spreadsheetId=self._spreadsheet_id,
-                ranges=[f"{sheet_title}!{corner_from}:{corner_to}"],
+                ranges=ranges,
                 valueRenderOption="FORMATTED_VALUE",
                 dateTimeRenderOption="FORMATTED_STRING",
             )
-            .execute()
         )
+        return self._scheduler.execute(request, RequestScheduler.read)
+
+    def get_sheet_values(self, sheet_title: str, corner_from: str, corner_to: str):
+        return self.batch_get_sheet_values([f"{A1Notation.get_sheet_reference(sheet_title)}!{corner_from}:{corner_to}"])
 
     def _get_first_column_range_values(self, spreadsheet_title: str):
-        return self.get_sheet_values(spreadsheet_title, "A1", "A1000")
+        return self.batch_get_sheet_values([A1Notation.get_column_range(spreadsheet_title)])
 
-    def _update_spreadsheet_row(self, sheet_title: str, row_number: int, values: List[str]) -> None:
-        self._service.spreadsheets().values().batchUpdate(
-            spreadsheetId=self._spreadsheet_id,
-            body={
-                "valueInputOption": "USER_ENTERED",
-                "data": [
+    def _get_sheets_properties(self) -> List[dict]:
+        sheets_properties = self._metadata_cache.get(self._sheets_properties_key)
+        if sheets_properties is None:
+            request = self._service.spreadsheets().get(
+                spreadsheetId=self._spreadsheet_id, fields="sheets.properties(sheetId,title,gridProperties)"
+            )
+            sheet_metadata = self._scheduler.execute(request, RequestScheduler.read)
+            sheets_properties = [sheet["properties"] for sheet in sheet_metadata.get("sheets", [])]
+            self._metadata_cache.put(self._sheets_properties_key, sheets_properties)
+
+        return sheets_properties
+
+    def _get_sheet_properties(self, sheet_title: str) -> dict:
+        for properties in self._get_sheets_properties():
+            if properties["title"] == sheet_title:
+                return properties
+
+        raise SpreadsheetHandlerException(f"Sheet {sheet_title} doesn't exist")
+
+    def get_sheet_id(self, sheet_title: str) -> int:
+        """
+        Gets sheet unique id from spreadsheet metadata.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns sheet id.
+        :rtype: :obj:`int`
+        """
+        return self._get_sheet_properties(sheet_title).get("sheetId", 0)
+
+    def invalidate_metadata(self) -> None:
+        """
+        Drops cached sheets properties and header rows, so they will be read from spreadsheet again.
+        """
+        self._metadata_cache.clear()
+
+    def get_grid_size(self, sheet_title: str) -> Tuple[int, int]:
+        """
+        Gets sheet grid rows and columns count from spreadsheet metadata.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns rows and columns count.
+        :rtype: :obj:`Tuple[int, int]`
+        """
+        grid_properties = self._get_sheet_properties(sheet_title).get("gridProperties", {})
+        return grid_properties.get("rowCount", 0), grid_properties.get("columnCount", 0)
+
+    def iter_sheet_rows(self, sheet_title: str, first_row: int = 1, page_size: int = 500) -> Iterator[List[str]]:
+        """
+        Streams sheet rows by pages with fixed rows count.
+
+        Note: Sheet size is taken from its grid, so all sheet columns and rows are read. Blank rows are returned as
+        [], trailing blank rows aren't returned. Only one page is kept in memory.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param first_row: First read row number
+        :type first_row: :obj:`int`
+
+        :param page_size: Rows count read by one request
+        :type page_size: :obj:`int`
+
+        :return: Returns rows iterator.
+        :rtype: :obj:`Iterator[List[str]]`
+        """
+        row_count, column_count = self.get_grid_size(sheet_title)
+        if column_count == 0:
+            return
+
+        blank_rows_count = 0
+        for page_first_row in range(first_row, row_count + 1, page_size):
+            page_last_row = min(page_first_row + page_size - 1, row_count)
+            page_range = A1Notation.get_range(sheet_title, page_first_row, page_last_row, column_count)
+            page_rows = self.batch_get_sheet_values([page_range])["valueRanges"][0].get("values", [])
+            if page_first_row == 1:
+                self._metadata_cache.put(("attributes", sheet_title), page_rows[0] if page_rows else [])
+
+            for row in page_rows:
+                if row:
+                    # Blank rows are returned only before filled ones to keep rows numbering.
+                    yield from [[] for _ in range(blank_rows_count)]
+                    blank_rows_count = 0
+                    yield row
+                else:
+                    blank_rows_count += 1
+
+            blank_rows_count += page_last_row - page_first_row + 1 - len(page_rows)
+
+    def _update_spreadsheet_rows(self, sheet_rows: Dict[str, Dict[int, List[str]]]) -> None:
+        data = []
+        for sheet_title, rows in sheet_rows.items():
+            for first_row_number, values in self._get_row_blocks(rows):
+                data.append(
                     {
-                        "range": f"{sheet_title}!A{row_number}:Z{row_number}",
+                        "range": A1Notation.get_range(
+                            sheet_title,
+                            first_row_number,
+                            first_row_number + len(values) - 1,
+                            max(max(len(row_values) for row_values in values), 1),
+                        ),
                         "majorDimension": "ROWS",
-                        "values": [values],
-                    },
-                ],
-            },
-        ).execute()
+                        "values": values,
+                    }
+                )
+
+        request = (
+            self._service.spreadsheets()
+            .values()
+            .batchUpdate(
+                spreadsheetId=self._spreadsheet_id,
+                body={
+                    "valueInputOption": "USER_ENTERED",
+                    "data": data,
+                },
+            )
+        )
+        self._scheduler.execute(request, RequestScheduler.write)
+
+        for sheet_title, rows in sheet_rows.items():
+            self._invalidate_changed_metadata(sheet_title, rows)
+
+    @staticmethod
+    def _get_row_blocks(rows: Dict[int, List[str]]) -> List[Tuple[int, List[List[str]]]]:
+        # Consecutive rows are written by one range, so bulk appending sends one range per sheet.
+        blocks = []
+        for row_number in sorted(rows.keys()):
+            if blocks and blocks[-1][0] + len(blocks[-1][1]) == row_number:
+                blocks[-1][1].append(rows[row_number])
+            else:
+                blocks.append((row_number, [rows[row_number]]))
+        return blocks
+
+    def _invalidate_changed_metadata(self, sheet_title: str, rows: Dict[int, List[str]]) -> None:
+        if 1 in rows:
+            self._metadata_cache.invalidate(("attributes", sheet_title))
+
+        # Spreadsheet grows its grid on writing out of it, so cached grid size becomes outdated.
+        sheets_properties = self._metadata_cache.get(self._sheets_properties_key, [])
+        for properties in sheets_properties:
+            if properties["title"] == sheet_title:
+                grid_properties = properties.get("gridProperties", {})
+                last_row_number = max(rows.keys())
+                last_column_number = max(len(values) for values in rows.values())
+                if last_row_number > grid_properties.get("rowCount", 0) or last_column_number > grid_properties.get(
+                    "columnCount", 0
+                ):
+                    self._metadata_cache.invalidate(self._sheets_properties_key)
+
+    def _update_spreadsheet_row(self, sheet_title: str, row_number: int, values: List[str]) -> None:
+        self._update_spreadsheet_rows({sheet_title: {row_number: values}})
+
+    def _clear_spreadsheet_row(self, sheet_title: str, row_number: int) -> None:
+        request = (
+            self._service.spreadsheets()
+            .values()
+            .batchClear(
+                spreadsheetId=self._spreadsheet_id,
+                body={"ranges": [A1Notation.get_rows_range(sheet_title, row_number, row_number)]},
+            )
+        )
+        self._scheduler.execute(request, RequestScheduler.write)
+
+        if row_number == 1:
+            self._metadata_cache.invalidate(("attributes", sheet_title))
+
+    def _set_row_numbers(self, sheet_title: str, first_column: List[List[str]], version: int = None) -> None:
+        with self._row_numbers_lock:
+            # Column read before the latest local write is older than cached row numbers.
+            if version is not None and version != self._row_numbers_versions.get(sheet_title, 0):
+                return
+
+            self._row_numbers[sheet_title] = {
+                column[0]: number for number, column in enumerate(first_column, 1) if column
+            }
+            self._next_row_numbers[sheet_title] = len(first_column) + 1
+            self._row_numbers_loaded_at[sheet_title] = time.monotonic()
+
+    def _get_row_numbers_version(self, sheet_title: str) -> int:
+        with self._row_numbers_lock:
+            return self._row_numbers_versions.get(sheet_title, 0)
+
+    def _change_row_numbers_version(self, sheet_title: str) -> None:
+        self._row_numbers_versions[sheet_title] = self._row_numbers_versions.get(sheet_title, 0) + 1
+
+    def _is_row_numbers_loaded(self, sheet_title: str) -> bool:
+        loaded_at = self._row_numbers_loaded_at.get(sheet_title)
+        return (
+            sheet_title in self._row_numbers
+            and loaded_at is not None
+            and time.monotonic() - loaded_at < self._row_numbers_ttl
+        )
+
+    def _load_row_numbers(self, sheet_titles: List[str]) -> None:
+        not_loaded_sheet_titles = [
+            sheet_title for sheet_title in sheet_titles if not self._is_row_numbers_loaded(sheet_title)
+        ]
+        if not not_loaded_sheet_titles:
+            return
+
+        ranges = [A1Notation.get_column_range(sheet_title) for sheet_title in not_loaded_sheet_titles]
+        results = self.batch_get_sheet_values(ranges)
+        for sheet_title, value_range in zip(not_loaded_sheet_titles, results["valueRanges"]):
+            self._set_row_numbers(sheet_title, value_range.get("values", []))
+
+    def invalidate_row_numbers(self, sheet_title: str = None) -> None:
+        """
+        Drops cached rows positions, so they will be read from spreadsheet before next writing.
+
+        :param sheet_title: Sheet title. If it isn't defined then all sheets positions will be dropped.
+        :type sheet_title: :obj:`str`
+        """
+        with self._row_numbers_lock:
+            sheet_titles = [sheet_title] if sheet_title else list(self._row_numbers.keys())
+            for title in sheet_titles:
+                self._row_numbers.pop(title, None)
+                self._next_row_numbers.pop(title, None)
+                self._row_numbers_loaded_at.pop(title, None)
+                self._change_row_numbers_version(title)
+
+    def _split_rows(self, sheet_title: str, rows: List[List[str]]) -> Tuple[Dict[int, List[str]], List[List[str]]]:
+        row_numbers = self._row_numbers[sheet_title]
+
+        numbered_rows = {}
+        new_rows = {}
+        for row in rows:
+            row_number = row_numbers.get(row[0])
+            if row_number is None:
+                # The last of new rows with equal first fields wins like for existing rows.
+                new_rows[row[0]] = row
+            else:
+                numbered_rows[row_number] = row
+
+        self._change_row_numbers_version(sheet_title)
+        return numbered_rows, list(new_rows.values())
+
+    def _append_spreadsheet_rows(self, sheet_title: str, rows: List[List[str]]) -> Tuple[int, int]:
+        request = (
+            self._service.spreadsheets()
+            .values()
+            .append(
+                spreadsheetId=self._spreadsheet_id,
+                range=A1Notation.get_sheet_reference(sheet_title),
+                valueInputOption="USER_ENTERED",
+                insertDataOption="INSERT_ROWS",
+                body={"majorDimension": "ROWS", "values": rows},
+            )
+        )
+        response = self._scheduler.execute(request, RequestScheduler.write, idempotent=False)
+
+        _, first_row_number, last_row_number, _, _ = A1Notation.parse_range(response["updates"]["updatedRange"])
+        return first_row_number, last_row_number
+
+    def _add_new_rows(self, sheet_title: str, rows: List[List[str]]) -> None:
+        first_row_number, _ = self._append_spreadsheet_rows(sheet_title, rows)
+
+        if first_row_number != self._next_row_numbers.get(sheet_title):
+            # Rows are added by other spreadsheet client, so cached positions are outdated.
+            self.invalidate_row_numbers(sheet_title)
+            self._metadata_cache.invalidate(self._sheets_properties_key)
+            return
+
+        numbered_rows = {}
+        for row_number, row in enumerate(rows, first_row_number):
+            self._row_numbers[sheet_title][row[0]] = row_number
+            numbered_rows[row_number] = row
+        self._next_row_numbers[sheet_title] = first_row_number + len(rows)
+        self._invalidate_changed_metadata(sheet_title, numbered_rows)
+
+    def add_rows(self, sheet_rows: Dict[str, List[List[str]]]):
+        """
+        Adds rows with fields in several sheets by one writing request and one appending request per sheet.
+
+        Note: If such rows exist then they will change. Existing rows positions are computed by cached first columns,
+        which are read once in metadata ttl seconds, new rows are appended after the last sheet row. If writing
+        fails then cached positions are dropped, so retried rows aren't appended twice.
+
+        :param sheet_rows: Sheet titles and their appendable rows
+        :type sheet_rows: :obj:`dict[str, List[List[str]]]`
+        """
+        with self._row_numbers_lock:
+            self._load_row_numbers(list(sheet_rows.keys()))
+
+            numbered_rows = {}
+            new_rows = {}
+            for sheet_title, rows in sheet_rows.items():
+                numbered_rows[sheet_title], new_rows[sheet_title] = self._split_rows(sheet_title, rows)
+
+            try:
+                numbered_rows = {sheet_title: rows for sheet_title, rows in numbered_rows.items() if rows}
+                if numbered_rows:
+                    self._update_spreadsheet_rows(numbered_rows)
+
+                for sheet_title, rows in new_rows.items():
+                    if rows:
+                        self._add_new_rows(sheet_title, rows)
+            except Exception:
+                for sheet_title in sheet_rows.keys():
+                    self.invalidate_row_numbers(sheet_title)
+                raise
+
+    def append_rows(self, sheet_title: str, rows: List[List[str]]) -> None:
+        """
+        Appends rows after the last sheet row by one request without reading sheet.
+
+        Note: Rows are always added, so appending isn't retried after server errors.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param rows: Appendable rows
+        :type rows: :obj:`List[List[str]]`
+        """
+        self._append_spreadsheet_rows(sheet_title, rows)
+
+        # Appended rows take positions which cached rows positions don't know, and grid grows.
+        self.invalidate_row_numbers(sheet_title)
+        self._metadata_cache.invalidate(self._sheets_properties_key)
 
     def add_row(self, sheet_title: str, row: List[str]):
         """
@@ -132,20 +509,7 @@ class SpreadsheetHandler:
         :param row: Spreadsheet appendable row
         :type row: :obj:`List[str]`
         """
-        first_row_element = row[0]
-        results = self._get_first_column_range_values(sheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
-        row_number = len(sheet_values) + 1
-
-        for sheet_rows in sheet_values:
-            if not sheet_rows:
-                row_number = sheet_values.index([]) + 1
-                break
-            if sheet_rows[0] == first_row_element:
-                row_number = sheet_values.index([first_row_element]) + 1
-                break
-
-        self._update_spreadsheet_row(sheet_title, row_number, row)
+        self.add_rows({sheet_title: [row]})
 
     def remove_row(self, sheet_title: str, first_row_element: str) -> bool:
         """
@@ -162,26 +526,34 @@ class SpreadsheetHandler:
         :return: Returns True on success.
         :rtype: :obj:`bool`
         """
-        results = self._get_first_column_range_values(sheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
-
-        if sheet_values.count([first_row_element]) == 0:
-            return False
-
-        row_number = sheet_values.index([first_row_element]) + 1
-
-        empty_string_list = []
-        for i in range(len(self.get_sheet_values(sheet_title, "A1", "Z1")["valueRanges"][0]["values"][0])):
-            empty_string_list.append("")
-
-        self._update_spreadsheet_row(sheet_title, row_number, empty_string_list)
-        return True
-
-    def get_first_column_values(self, sheet_title: str) -> list:
+        with self._row_numbers_lock:
+            loaded = self._is_row_numbers_loaded(sheet_title)
+            self._load_row_numbers([sheet_title])
+
+            if first_row_element not in self._row_numbers[sheet_title] and loaded:
+                # Row may be added by another spreadsheet client, so cached positions are reconciled.
+                self.invalidate_row_numbers(sheet_title)
+                self._load_row_numbers([sheet_title])
+
+            row_number = self._row_numbers[sheet_title].get(first_row_element)
+            if row_number is None:
+                return False
+
+            try:
+                self._clear_spreadsheet_row(sheet_title, row_number)
+            except Exception:
+                self.invalidate_row_numbers(sheet_title)
+                raise
+
+            del self._row_numbers[sheet_title][first_row_element]
+            self._change_row_numbers_version(sheet_title)
+            return True
+
+    def get_first_column_values(self, sheet_title: str) -> List[str]:
         """
-        Gets first column in spreadsheet.
+        Gets first column in spreadsheet except its first field.
 
-        Note: If such first column doesn't exist then None will be returned.
+        Note: If such first column doesn't exist then [] will be returned.
 
         :param sheet_title: Spreadsheet title
         :type sheet_title: :obj:`str`
@@ -189,9 +561,12 @@ class SpreadsheetHandler:
         :return: Returns first column with fields in spreadsheet.
         :rtype: :obj:`list[str]`
         """
+        version = self._get_row_numbers_version(sheet_title)
         results = self._get_first_column_range_values(sheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
-        return list(filter(lambda v: v != [], sheet_values[1:]))
+        sheet_values = results["valueRanges"][0].get("values", [])
+        self._set_row_numbers(sheet_title, sheet_values, version)
+
+        return [sheet_row[0] for sheet_row in sheet_values[1:] if sheet_row]
 
     def get_row_by_first_element(self, sheet_title: str, element: str) -> dict:
         """
@@ -208,36 +583,110 @@ class SpreadsheetHandler:
         :return: Returns row with fields.
         :rtype: :obj:`dict[str, str]`
         """
-        alphabet_start_index = 64
-        right_corner = chr(alphabet_start_index + self._get_first_row_length(sheet_title))
-        results = self.get_sheet_values(sheet_title, "A2", f"{right_corner}1000")
+        rows = self.iter_sheet_rows(sheet_title)
+        attributes = next(rows, [])
 
-        if results["valueRanges"][0].get("values"):
-            sheet_values = results["valueRanges"][0]["values"]
-        else:
-            return {}
-
-        print(sheet_values)
-        row = {}
-        i = 0
-        for sheet_row in sheet_values:
+        for sheet_row in rows:
             if sheet_row and sheet_row[0] == element:
-                for attribute in self._get_sheet_attributes(sheet_title):
-                    row[attribute] = sheet_row[i]
-                    i += 1
+                sheet_row = sheet_row + [""] * (len(attributes) - len(sheet_row))
+                return dict(zip(attributes, sheet_row))
+
+        return {}
+
+    def iter_sheet_records(self, sheet_title: str) -> Iterator[Dict[str, str]]:
+        """
+        Streams sheet rows except first one as dictionaries with first row fields as keys.
+
+        Note: Blank rows are skipped. Missing trailing fields are filled by empty strings.
+
+        :param sheet_title: Spreadsheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns rows with fields iterator.
+        :rtype: :obj:`Iterator[dict[str, str]]`
+        """
+        rows = self.iter_sheet_rows(sheet_title)
+        attributes = next(rows, [])
 
-        return row
+        for sheet_row in rows:
+            if sheet_row:
+                sheet_row = sheet_row + [""] * (len(attributes) - len(sheet_row))
+                yield dict(zip(attributes, sheet_row))
+
+    def get_sheet_records(self, sheet_title: str) -> List[Dict[str, str]]:
+        """
+        Gets all sheet rows except first one as dictionaries with first row fields as keys.
+
+        Note: Sheet is read by pages, which also reconcile cached rows positions. Missing trailing fields are
+        filled by empty strings.
+
+        :param sheet_title: Spreadsheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns rows with fields.
+        :rtype: :obj:`List[dict[str, str]]`
+        """
+        version = self._get_row_numbers_version(sheet_title)
+        first_column = []
+        records = []
+
+        rows = self.iter_sheet_rows(sheet_title)
+        attributes = next(rows, [])
+        if attributes:
+            first_column.append(attributes[:1])
+
+        for sheet_row in rows:
+            first_column.append([sheet_row[0]] if sheet_row and sheet_row[0] else [])
+            if sheet_row:
+                sheet_row = sheet_row + [""] * (len(attributes) - len(sheet_row))
+                records.append(dict(zip(attributes, sheet_row)))
+
+        self._set_row_numbers(sheet_title, first_column, version)
+        return records
+
+    def get_sheets_records(self, sheet_titles: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Gets all rows except first ones of several sheets by one request.
+
+        Note: Sheets are read entirely, so it suits small sheets like rosters. Cached rows positions are reconciled.
+        Missing trailing fields are filled by empty strings.
+
+        :param sheet_titles: Sheet titles
+        :type sheet_titles: :obj:`List[str]`
+
+        :return: Returns sheet titles and their rows with fields.
+        :rtype: :obj:`dict[str, List[dict[str, str]]]`
+        """
+        versions = {sheet_title: self._get_row_numbers_version(sheet_title) for sheet_title in sheet_titles}
+        results = self.batch_get_sheet_values([A1Notation.get_sheet_reference(title) for title in sheet_titles])
+
+        sheets_records = {}
+        for sheet_title, value_range in zip(sheet_titles, results["valueRanges"]):
+            sheet_values = value_range.get("values", [])
+            self._set_row_numbers(sheet_title, [sheet_row[:1] for sheet_row in sheet_values], versions[sheet_title])
+            if sheet_values:
+                self._metadata_cache.put(("attributes", sheet_title), sheet_values[0])
+
+            attributes = sheet_values[0] if sheet_values else []
+            sheets_records[sheet_title] = [
+                dict(zip(attributes, sheet_row + [""] * (len(attributes) - len(sheet_row))))
+                for sheet_row in sheet_values[1:]
+                if sheet_row
+            ]
+
+        return sheets_records
 
     def _get_first_row_length(self, sheet_title: str):
-        return len(self.get_sheet_values(sheet_title, "A1", "Z1")["valueRanges"][0]["values"][0])
+        return len(self._get_sheet_attributes(sheet_title))
 
     def _get_sheet_attributes(self, sheet_title: str):
-        return self.get_sheet_values(sheet_title, "A1", "Z1")["valueRanges"][0]["values"][0]
+        attributes = self._metadata_cache.get(("attributes", sheet_title))
+        if attributes is None:
+            results = self.batch_get_sheet_values([A1Notation.get_rows_range(sheet_title, 1, 1)])
+            attributes = results["valueRanges"][0].get("values", [[]])[0]
+            self._metadata_cache.put(("attributes", sheet_title), attributes)
+
+        return list(attributes)
 
     def get_spreadsheet_page_names(self):
-        sheet_metadata = self._service.spreadsheets().get(spreadsheetId=self._spreadsheet_id).execute()
-        sheets = sheet_metadata.get("sheets", "")
-        sheet_names = []
-        for sheet in sheets:
-            sheet_names.append(sheet["properties"]["title"])
-        return sheet_names
+        return [properties["title"] for properties in self._get_sheets_properties()]
@@ -0,0 +1,218 @@
+"""
+Spreadsheet local SQLite mirror implementation module.
+"""
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from .spreadsheet_handler import SpreadsheetHandler
+from .auth.roster_index import RosterIndex
+
+
+class SpreadsheetMirror(RosterIndex):
+    """
+    Spreadsheet mirror class implementation keeps sheets rows in local SQLite replica by their first field.
+
+    Note: Username, group and subgroup attributes are kept in indexed columns, so rows are found by them without
+    reading whole sheet. Replica is kept between restarts: if it is synchronized once then reads are served from it at
+    once, and it is synchronized with spreadsheet in background thread.
+    """
+
+    _indexed_attributes = {"username": "username", "Группа": "group_name", "Подгруппа": "subgroup"}
+
+    def __init__(
+        self,
+        handler: SpreadsheetHandler,
+        spreadsheet_id: str,
+        sheet_titles: List[str],
+        database_path: str,
+        sync_interval: float = 60,
+    ):
+        super().__init__(handler, sheet_titles, sync_interval)
+        self._spreadsheet_id = spreadsheet_id
+        self._connection = sqlite3.connect(database_path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mirror_rows ("
+            "spreadsheet TEXT NOT NULL, sheet TEXT NOT NULL, key TEXT NOT NULL, position INTEGER NOT NULL, "
+            "username TEXT, group_name TEXT, subgroup TEXT, record TEXT NOT NULL, "
+            "PRIMARY KEY (spreadsheet, sheet, key))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS mirror_rows_username ON mirror_rows (spreadsheet, sheet, username)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS mirror_rows_group ON mirror_rows (spreadsheet, sheet, group_name, subgroup)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mirror_syncs ("
+            "spreadsheet TEXT NOT NULL, sheet TEXT NOT NULL, synced_at REAL NOT NULL, "
+            "PRIMARY KEY (spreadsheet, sheet))"
+        )
+
+    def _is_synced(self) -> bool:
+        synced_sheets_count = self._connection.execute(
+            "SELECT COUNT(*) FROM mirror_syncs WHERE spreadsheet = ?", (self._spreadsheet_id,)
+        ).fetchone()[0]
+        return synced_sheets_count >= len(self._sheet_titles)
+
+    def _write_row(self, sheet_title: str, key: str, row: Dict[str, str], position: int = None):
+        values = [row.get(attribute) for attribute in self._indexed_attributes] + [json.dumps(row, ensure_ascii=False)]
+
+        if position is None:
+            # Changed row keeps its position, new one is added to the end like in spreadsheet.
+            cursor = self._connection.execute(
+                "UPDATE mirror_rows SET username = ?, group_name = ?, subgroup = ?, record = ? "
+                "WHERE spreadsheet = ? AND sheet = ? AND key = ?",
+                (*values, self._spreadsheet_id, sheet_title, key),
+            )
+            if cursor.rowcount:
+                return
+
+            position = self._connection.execute(
+                "SELECT COALESCE(MAX(position), 0) + 1 FROM mirror_rows WHERE spreadsheet = ? AND sheet = ?",
+                (self._spreadsheet_id, sheet_title),
+            ).fetchone()[0]
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO mirror_rows "
+            "(spreadsheet, sheet, key, position, username, group_name, subgroup, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._spreadsheet_id, sheet_title, key, position, *values),
+        )
+
+    def _delete_row(self, sheet_title: str, key: str):
+        self._connection.execute(
+            "DELETE FROM mirror_rows WHERE spreadsheet = ? AND sheet = ? AND key = ?",
+            (self._spreadsheet_id, sheet_title, key),
+        )
+
+    def _read_rows(self, sheet_title: str) -> Dict[str, Dict[str, str]]:
+        cursor = self._connection.execute(
+            "SELECT key, record FROM mirror_rows WHERE spreadsheet = ? AND sheet = ? ORDER BY position",
+            (self._spreadsheet_id, sheet_title),
+        )
+        return {key: json.loads(record) for key, record in cursor}
+
+    def _apply(self, sheet_title: str, rows: Dict[str, Dict[str, str]], loaded_at: float):
+        with self._lock:
+            mirrored_rows = self._read_rows(sheet_title)
+            changed_at = self._changed_at[sheet_title]
+
+            self._connection.execute("BEGIN")
+            try:
+                # Rows changed by this process after sheet loading are newer than loaded ones.
+                for key in mirrored_rows.keys():
+                    if key not in rows and changed_at.get(key, 0) < loaded_at:
+                        self._delete_row(sheet_title, key)
+
+                for position, (key, row) in enumerate(rows.items(), 1):
+                    if mirrored_rows.get(key) != row and changed_at.get(key, 0) < loaded_at:
+                        self._write_row(sheet_title, key, row, position)
+
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO mirror_syncs (spreadsheet, sheet, synced_at) VALUES (?, ?, ?)",
+                    (self._spreadsheet_id, sheet_title, time.time()),
+                )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            for key in [key for key, timestamp in changed_at.items() if timestamp < loaded_at]:
+                del changed_at[key]
+
+    def start(self):
+        """
+        Serves reads from synchronized replica at once or loads it, and launches background synchronization.
+        """
+        with self._lock:
+            if not self._loaded and self._is_synced():
+                self._loaded = True
+                threading.Thread(target=self._refresh_in_background, name="spreadsheet-mirror", daemon=True).start()
+
+        super().start()
+
+    def close(self):
+        """
+        Stops background synchronization and closes replica database.
+        """
+        self.stop()
+        with self._lock:
+            self._connection.close()
+
+    def invalidate(self):
+        """
+        Drops replica content, so it will be synchronized again on next access.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM mirror_rows WHERE spreadsheet = ?", (self._spreadsheet_id,))
+            self._connection.execute("DELETE FROM mirror_syncs WHERE spreadsheet = ?", (self._spreadsheet_id,))
+            for changed_at in self._changed_at.values():
+                changed_at.clear()
+            self._loaded = False
+
+    def _get_row(self, sheet_title: str, key: str) -> Dict[str, str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT record FROM mirror_rows WHERE spreadsheet = ? AND sheet = ? AND key = ?",
+                (self._spreadsheet_id, sheet_title, key),
+            ).fetchone()
+            return json.loads(row[0]) if row else {}
+
+    def _get_keys(self, sheet_title: str) -> List[str]:
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT key FROM mirror_rows WHERE spreadsheet = ? AND sheet = ? ORDER BY position",
+                (self._spreadsheet_id, sheet_title),
+            )
+            return [key for key, in cursor]
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        rows = {sheet_title: {} for sheet_title in self._sheet_titles}
+        with self._lock:
+            # Keys are sent by chunks to keep query parameters count under SQLite limit.
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start : chunk_start + 500]
+                cursor = self._connection.execute(
+                    f"SELECT sheet, key, record FROM mirror_rows WHERE spreadsheet = ? "
+                    f"AND key IN ({', '.join('?' * len(chunk))})",
+                    (self._spreadsheet_id, *chunk),
+                )
+                for sheet_title, key, record in cursor:
+                    if sheet_title in rows:
+                        rows[sheet_title][key] = json.loads(record)
+
+        return rows
+
+    def _find(self, sheet_title: str, attributes: Dict[str, str]) -> List[Dict[str, str]]:
+        conditions = ["spreadsheet = ?", "sheet = ?"]
+        parameters = [self._spreadsheet_id, sheet_title]
+        for attribute, value in attributes.items():
+            if attribute in self._indexed_attributes:
+                conditions.append(f"{self._indexed_attributes[attribute]} = ?")
+                parameters.append(value)
+
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT record FROM mirror_rows WHERE {' AND '.join(conditions)} ORDER BY position", parameters
+            )
+            rows = [json.loads(record) for record, in cursor]
+
+        # Not indexed attributes are checked after reading.
+        return [row for row in rows if all(row.get(attribute) == value for attribute, value in attributes.items())]
+
+    def put(self, sheet_title: str, row: Dict[str, str], pending: bool = False):
+        key = RosterIndex._get_key(row)
+        if key:
+            with self._lock:
+                self._write_row(sheet_title, key, row)
+                self._changed_at[sheet_title][key] = self._get_changed_at(pending)
+
+    def remove(self, sheet_title: str, key: str):
+        with self._lock:
+            self._delete_row(sheet_title, key)
+            self._changed_at[sheet_title][key] = time.monotonic()
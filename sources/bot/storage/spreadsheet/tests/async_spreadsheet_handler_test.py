@@ -0,0 +1,106 @@
+import unittest
+
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from ..emulator.fake_sheets_service import FakeSheetsService
+from ....exceptions import SpreadsheetRequestException
+
+
+class TestEmulatedAsyncSpreadsheetHandler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [
+                    ["username", "ФИО", "Группа", "Подгруппа"],
+                    ["student1", "name1", "group1", "1"],
+                    [],
+                    ["student3", "name3", "group1", "2"],
+                ]
+            }
+        )
+        self.handler = AsyncSpreadsheetHandler("", self.spreadsheet_id, service=self.service)
+
+    async def asyncTearDown(self):
+        await self.handler.close()
+
+    async def test_add_rows_append_new_rows(self):
+        await self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+        await self.handler.add_row("Студенты", ["student5", "name5", "group2", "2"])
+        await self.handler.add_row("Студенты", ["student1", "name1", "group3", "1"])
+
+        self.assertEqual(
+            self.service.get_values(self.spreadsheet_id, "Студенты"),
+            [
+                ["username", "ФИО", "Группа", "Подгруппа"],
+                ["student1", "name1", "group3", "1"],
+                [],
+                ["student3", "name3", "group1", "2"],
+                ["student4", "name4", "group2", "1"],
+                ["student5", "name5", "group2", "2"],
+            ],
+        )
+        self.assertEqual(self.service.requests_count["values.batchGet"], 1)
+        self.assertEqual(self.service.requests_count["values.append"], 2)
+        self.assertEqual(self.service.requests_count["values.batchUpdate"], 1)
+
+    async def test_add_rows_keep_rows_added_by_others(self):
+        await self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+        self.service.append_values(self.spreadsheet_id, "Студенты", {"values": [["student6", "name6", "group2", "1"]]})
+        await self.handler.add_row("Студенты", ["student5", "name5", "group2", "2"])
+        await self.handler.add_row("Студенты", ["student6", "name6", "group3", "2"])
+
+        self.assertEqual(
+            self.service.get_values(self.spreadsheet_id, "Студенты")[4:],
+            [
+                ["student4", "name4", "group2", "1"],
+                ["student6", "name6", "group3", "2"],
+                ["student5", "name5", "group2", "2"],
+            ],
+        )
+
+    async def test_drop_row_positions_on_failed_write(self):
+        await self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+        self.service.fail_next(status=400)
+        with self.assertRaises(SpreadsheetRequestException):
+            await self.handler.add_row("Студенты", ["student5", "name5", "group2", "2"])
+        self.service.append_values(self.spreadsheet_id, "Студенты", {"values": [["student5", "name5", "group2", "2"]]})
+
+        await self.handler.add_row("Студенты", ["student5", "name5", "group3", "1"])
+
+        self.assertEqual(
+            self.service.get_values(self.spreadsheet_id, "Студенты")[4:],
+            [["student4", "name4", "group2", "1"], ["student5", "name5", "group3", "1"]],
+        )
+
+    async def test_remove_row(self):
+        self.assertTrue(await self.handler.remove_row("Студенты", "student3"))
+        self.assertFalse(await self.handler.remove_row("Студенты", "student3"))
+        await self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+
+        self.assertEqual(await self.handler.get_first_column_values("Студенты"), ["student1", "student4"])
+
+    async def test_create_sheet_with_header(self):
+        await self.handler.get_spreadsheet_page_names()
+        await self.handler.create_sheet("Преподаватели", ["username", "ФИО"])
+        await self.handler.add_row("Преподаватели", ["teacher1", "name1"])
+
+        self.assertEqual(
+            await self.handler.get_sheet_records("Преподаватели"), [{"username": "teacher1", "ФИО": "name1"}]
+        )
+        self.assertEqual(await self.handler.get_spreadsheet_page_names(), ["Студенты", "Преподаватели"])
+        self.assertEqual(self.service.requests_count["spreadsheets.get"], 1)
+        self.assertEqual(self.service.requests_count["values.batchGet"], 1)
+
+    async def test_share_spreadsheet_handler(self):
+        other_id = self.service.add_spreadsheet({"test": [["Вопрос", "Ответ"]]})
+
+        handler = self.handler.with_spreadsheet(other_id)
+        self.assertEqual(await handler.get_spreadsheet_page_names(), ["test"])
+
+        self.assertIs(self.handler.with_spreadsheet(other_id), handler)
+        self.assertEqual(await self.handler.with_spreadsheet(other_id).get_spreadsheet_page_names(), ["test"])
+        self.assertEqual(self.service.requests_count["spreadsheets.get"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
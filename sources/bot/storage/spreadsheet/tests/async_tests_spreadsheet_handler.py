@@ -0,0 +1,60 @@
+import asyncio
+
+from .base_async_tests_spreadsheet_handler import BaseAsyncTestsSpreadsheetHandler
+from .tests_spreadsheet_handler import TestsSpreadsheetHandler
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from ....exceptions import SpreadsheetHandlerException, SpreadsheetRequestException
+from ..util.a1_notation import A1Notation
+from ..util.test_to_json_file import JsonTestFileUtil
+
+
+class AsyncTestsSpreadsheetHandler(BaseAsyncTestsSpreadsheetHandler):
+    def __init__(self, credentials_file_name: str, service=None):
+        self._credentials_file_name = credentials_file_name
+        self._credentials_handler = AsyncSpreadsheetHandler(credentials_file_name, "", service=service)
+        self._result_sheets_lock = None
+
+    async def load_test_by_link(self, url: str):
+        # Tests may be loaded concurrently, so loaded spreadsheet isn't kept by handler.
+        url_details = url.split("/")
+        spreadsheet_id = url_details[url_details.index("d") + 1]
+        handler = self._credentials_handler.with_spreadsheet(spreadsheet_id)
+        # Test sheets may be changed since the previous loading.
+        handler.invalidate_metadata()
+        return await self._get_test(handler, spreadsheet_id)
+
+    async def _get_test(self, handler: AsyncSpreadsheetHandler, spreadsheet_id: str) -> tuple:
+        try:
+            test_name = (await handler.get_spreadsheet_page_names())[0]
+            sheet_data = await handler.batch_get_sheet_values([A1Notation.get_sheet_reference(test_name)])
+        except SpreadsheetRequestException:
+            return "", []
+
+        survey = TestsSpreadsheetHandler._parse_survey(sheet_data["valueRanges"][0].get("values", []))
+        TestsSpreadsheetHandler._check_survey(test_name, survey)
+
+        JsonTestFileUtil.save_test(test_name, survey, spreadsheet_id)
+        return test_name, survey
+
+    async def add_result_to_worksheet(self, test_name, user_data, result_list, spreadsheet_id: str = None) -> None:
+        # Result is written to spreadsheet of its test, even if other test is loaded later.
+        spreadsheet_id = spreadsheet_id or JsonTestFileUtil.get_test_spreadsheet_id(test_name)
+        if not spreadsheet_id:
+            raise SpreadsheetHandlerException(f"Spreadsheet of test {test_name} is unknown")
+        handler = self._credentials_handler.with_spreadsheet(spreadsheet_id)
+        sheet_title = test_name + "_result"
+
+        if self._result_sheets_lock is None:
+            self._result_sheets_lock = asyncio.Lock()
+        # Result sheet of test is created once, even if several results of test are written concurrently.
+        async with self._result_sheets_lock:
+            if sheet_title not in await handler.get_spreadsheet_page_names():
+                await handler.create_sheet(sheet_title, TestsSpreadsheetHandler._get_result_top_row(result_list))
+
+        await handler.add_row(sheet_title, TestsSpreadsheetHandler._get_result_row(user_data, result_list))
+
+    async def close(self):
+        await self._credentials_handler.close()
+
+    def accept_storage(self, storage):
+        storage.visit_tests_handler(self)
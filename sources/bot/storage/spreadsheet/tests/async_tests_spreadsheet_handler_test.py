@@ -0,0 +1,69 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from ..emulator.fake_sheets_service import FakeSheetsService
+from .async_tests_spreadsheet_handler import AsyncTestsSpreadsheetHandler
+from ..util.test_to_json_file import JsonTestFileUtil
+
+
+class TestEmulatedAsyncTestsSpreadsheetHandler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Loaded tests are saved to surveys directory of working directory.
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs("surveys")
+
+        self.service = FakeSheetsService()
+        self.spreadsheet_ids = [
+            self.service.add_spreadsheet({name: [["Вопрос", "Ответ"], ["question", "answer"]]})
+            for name in ("test1", "test2")
+        ]
+        self.handler = AsyncTestsSpreadsheetHandler("", service=self.service)
+
+    async def asyncTearDown(self):
+        await self.handler.close()
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+
+    async def _load(self, spreadsheet_id: str):
+        return await self.handler.load_test_by_link(f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit")
+
+    async def test_load_tests_concurrently(self):
+        self.service.latency = 0.01
+        names = [test_name for test_name, _ in await asyncio.gather(*map(self._load, self.spreadsheet_ids))]
+
+        self.assertEqual(names, ["test1", "test2"])
+        for test_name, spreadsheet_id in zip(names, self.spreadsheet_ids):
+            self.assertEqual(JsonTestFileUtil.get_test_spreadsheet_id(test_name), spreadsheet_id)
+
+    async def test_write_results(self):
+        await self._load(self.spreadsheet_ids[0])
+        await self._load(self.spreadsheet_ids[1])
+        self.service.requests_count.clear()
+
+        await asyncio.gather(
+            *[
+                self.handler.add_result_to_worksheet(
+                    "test1", f"student{number}", [{"Вопрос": "question", "is_correct": number % 2 == 0}]
+                )
+                for number in range(10)
+            ]
+        )
+
+        rows = self.service.get_values(self.spreadsheet_ids[0], "test1_result")
+        self.assertEqual(rows[0], ["Студент", "Время", "question", "Результат"])
+        self.assertEqual(len(rows), 11)
+        self.assertEqual(self.service.requests_count["spreadsheets.get"], 0)
+        self.assertEqual(self.service.requests_count["spreadsheets.batchUpdate"], 1)
+        self.assertEqual(self.service.requests_count["values.batchGet"], 0)
+        sheets = self.service.get_spreadsheet(self.spreadsheet_ids[1])["sheets"]
+        self.assertNotIn("test1_result", [sheet["properties"]["title"] for sheet in sheets])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+from abc import ABCMeta, abstractmethod
+
+from ....exceptions import SpreadsheetHandlerException
+from ..base_spreadsheet_handler import BaseSpreadsheetHandler
+
+
+class BaseAsyncTestsSpreadsheetHandler(BaseSpreadsheetHandler):
+    __metaclass__ = ABCMeta
+
+    # todo: Formalise interface
+    async def create_spreadsheet(self, spreadsheet_title: str = None, row_count: int = None, column_count: int = None):
+        pass
+
+    def accept_storage(self, storage):
+        storage.visit_tests_handler(self)
+
+    @abstractmethod
+    async def load_test_by_link(self, url: str) -> tuple:
+        raise SpreadsheetHandlerException("Not implemented method")
+
+    @abstractmethod
+    async def add_result_to_worksheet(self, test_name, user_data, result_list, spreadsheet_id: str = None) -> None:
+        raise SpreadsheetHandlerException("Not implemented method")
@@ -19,5 +19,5 @@ class BaseTestsSpreadsheetHandler(BaseSpreadsheetHandler):
         raise SpreadsheetHandlerException("Not implemented method")
 
     @abstractmethod
-    def add_result_to_worksheet(self, test_name, user_data, result_list) -> None:
+    def add_result_to_worksheet(self, test_name, user_data, result_list, spreadsheet_id: str = None) -> None:
         raise SpreadsheetHandlerException("Not implemented method")
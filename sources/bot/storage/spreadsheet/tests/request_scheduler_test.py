@@ -0,0 +1,55 @@
+import time
+import unittest
+
+from ....exceptions import SpreadsheetRequestException
+from ..request_scheduler import RequestScheduler
+
+
+class Request:
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.count = 0
+
+    def execute(self) -> dict:
+        self.count += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"count": self.count}
+
+    async def send(self) -> dict:
+        return self.execute()
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_share_quota_with_async_requests(self):
+        scheduler = RequestScheduler(write_quota=2, period=1)
+        scheduler.execute(Request(), RequestScheduler.write)
+        scheduler.execute(Request(), RequestScheduler.write)
+
+        started_at = time.monotonic()
+        await scheduler.execute_async(Request().send, RequestScheduler.write)
+
+        self.assertGreater(time.monotonic() - started_at, 0.4)
+        self.assertEqual(scheduler.counters["requests"], 3)
+        self.assertEqual(scheduler.counters["queued"], 1)
+
+    async def test_retry_async_request(self):
+        scheduler = RequestScheduler(read_quota=100, period=1, base_delay=0.01, seed=0)
+        request = Request(SpreadsheetRequestException(429, "quota", "0"), SpreadsheetRequestException(503, "error"))
+
+        self.assertEqual(await scheduler.execute_async(request.send, RequestScheduler.read), {"count": 3})
+        self.assertEqual(scheduler.counters["throttled"], 1)
+        self.assertEqual(scheduler.counters["retried"], 2)
+
+    async def test_not_retry_not_idempotent_async_request(self):
+        scheduler = RequestScheduler()
+        request = Request(SpreadsheetRequestException(503, "error"))
+
+        with self.assertRaises(SpreadsheetRequestException):
+            await scheduler.execute_async(request.send, RequestScheduler.write, idempotent=False)
+        self.assertEqual(request.count, 1)
+        self.assertEqual(scheduler.counters["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
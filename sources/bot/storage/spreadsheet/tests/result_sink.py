@@ -0,0 +1,70 @@
+"""
+Tests results sink implementation module.
+"""
+import threading
+from typing import List, Set
+
+from ..spreadsheet_handler import SpreadsheetHandler
+from ..write_behind_queue import WriteBehindQueue
+
+
+class ResultSink:
+    """
+    Tests results sink class implementation collects finished attempts of tests of one spreadsheet.
+
+    Note: Result sheet of test is created with header once, and its existence is kept, so spreadsheet sheets aren't
+    requested for every attempt. Attempts are buffered per result sheet and written by one request in flush
+    interval, consecutive rows of one sheet are written as one range.
+    """
+
+    def __init__(self, handler: SpreadsheetHandler, flush_interval: float = 2, max_rows: int = 500):
+        self.handler = handler
+        self._writer = WriteBehindQueue(handler, flush_interval, max_rows)
+        self._result_sheets: Set[str] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_result_sheet_title(test_name: str) -> str:
+        return test_name + "_result"
+
+    def _ensure_result_sheet(self, test_name: str, header: List[str]) -> str:
+        sheet_title = self.get_result_sheet_title(test_name)
+
+        with self._lock:
+            if self._result_sheets is None:
+                self._result_sheets = set(self.handler.get_spreadsheet_page_names())
+
+            if sheet_title not in self._result_sheets:
+                self.handler.create_sheet(sheet_title, header)
+                self._result_sheets.add(sheet_title)
+
+        return sheet_title
+
+    def add(self, test_name: str, header: List[str], row: List[str]) -> None:
+        """
+        Enqueues finished test attempt.
+
+        Note: Attempt of the same student replaces previous one.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :param header: Result sheet first row, which is written if result sheet doesn't exist
+        :type header: :obj:`List[str]`
+
+        :param row: Result row
+        :type row: :obj:`List[str]`
+        """
+        self._writer.add_row(self._ensure_result_sheet(test_name, header), row)
+
+    def flush(self) -> None:
+        """
+        Writes buffered attempts.
+        """
+        self._writer.flush()
+
+    def close(self) -> None:
+        """
+        Writes buffered attempts and stops sink timer.
+        """
+        self._writer.close()
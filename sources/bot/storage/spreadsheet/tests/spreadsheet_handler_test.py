@@ -0,0 +1,120 @@
+import unittest
+
+from googleapiclient.errors import HttpError
+
+from ..emulator.fake_sheets_service import FakeSheetsService
+from ..request_scheduler import RequestScheduler
+from ..spreadsheet_handler import SpreadsheetHandler
+
+
+class TestEmulatedSpreadsheetHandler(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [
+                    ["username", "ФИО", "Группа", "Подгруппа"],
+                    ["student1", "name1", "group1", "1"],
+                    [],
+                    ["student3", "name3", "group1", "2"],
+                ]
+            }
+        )
+        self.scheduler = RequestScheduler(period=1, base_delay=0, max_retries=2)
+        self.handler = SpreadsheetHandler("", self.spreadsheet_id, service=self.service, scheduler=self.scheduler)
+
+    def test_get_row_by_first_element(self):
+        student = self.handler.get_row_by_first_element("Студенты", "student3")
+
+        self.assertEqual(student, {"username": "student3", "ФИО": "name3", "Группа": "group1", "Подгруппа": "2"})
+        self.assertEqual(self.handler.get_row_by_first_element("Студенты", "student2"), {})
+
+    def test_add_rows_append_new_rows(self):
+        self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+        self.handler.add_row("Студенты", ["student5", "name5", "group2", "2"])
+        self.handler.add_row("Студенты", ["student1", "name1", "group3", "1"])
+
+        self.assertEqual(
+            self.service.get_values(self.spreadsheet_id, "Студенты"),
+            [
+                ["username", "ФИО", "Группа", "Подгруппа"],
+                ["student1", "name1", "group3", "1"],
+                [],
+                ["student3", "name3", "group1", "2"],
+                ["student4", "name4", "group2", "1"],
+                ["student5", "name5", "group2", "2"],
+            ],
+        )
+        self.assertEqual(self.service.requests_count["values.batchGet"], 1)
+        self.assertEqual(self.service.requests_count["values.append"], 2)
+
+    def test_add_rows_keep_rows_added_by_others(self):
+        self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+        self.service.append_values(self.spreadsheet_id, "Студенты", {"values": [["student6", "name6", "group2", "1"]]})
+        self.handler.add_row("Студенты", ["student5", "name5", "group2", "2"])
+        self.handler.add_row("Студенты", ["student6", "name6", "group3", "2"])
+
+        self.assertEqual(
+            self.service.get_values(self.spreadsheet_id, "Студенты")[4:],
+            [
+                ["student4", "name4", "group2", "1"],
+                ["student6", "name6", "group3", "2"],
+                ["student5", "name5", "group2", "2"],
+            ],
+        )
+
+    def test_remove_row(self):
+        self.assertTrue(self.handler.remove_row("Студенты", "student1"))
+        self.assertFalse(self.handler.remove_row("Студенты", "student1"))
+
+        self.assertEqual(self.handler.get_first_column_values("Студенты"), ["student3"])
+
+    def test_read_sheet_out_of_default_grid(self):
+        rows = [[f"column{number}" for number in range(30)]]
+        rows += [[f"student{number}"] + [str(number)] * 29 for number in range(1, 1200)]
+        spreadsheet_id = self.service.add_spreadsheet({"Студенты": rows})
+        handler = SpreadsheetHandler("", spreadsheet_id, service=self.service)
+
+        records = handler.get_sheet_records("Студенты")
+
+        self.assertEqual(len(records), 1199)
+        self.assertEqual(records[-1]["column29"], "1199")
+        self.assertEqual(list(handler.iter_sheet_rows("Студенты", page_size=100)), rows)
+
+    def test_create_sheet(self):
+        self.handler.create_sheet("Преподаватели")
+        self.handler.add_row("Преподаватели", ["username", "ФИО"])
+
+        self.assertEqual(self.handler.get_spreadsheet_page_names(), ["Студенты", "Преподаватели"])
+        self.assertEqual(self.handler.get_sheet_records("Преподаватели"), [])
+
+    def test_retry_transient_errors(self):
+        self.service.fail_next(status=429)
+        self.service.fail_next(status=503)
+
+        self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+
+        self.assertEqual(self.handler.get_row_by_first_element("Студенты", "student4").get("ФИО"), "name4")
+        self.assertEqual(self.scheduler.counters["throttled"], 1)
+        self.assertEqual(self.scheduler.counters["retried"], 2)
+
+    def test_raise_persistent_errors(self):
+        self.service.fail_next(count=3, status=503)
+
+        with self.assertRaises(HttpError) as context:
+            self.handler.add_row("Студенты", ["student4", "name4", "group2", "1"])
+
+        self.assertEqual(context.exception.resp.status, 503)
+        self.assertEqual(self.scheduler.counters["failed"], 1)
+
+    def test_not_retry_not_idempotent_requests_on_server_errors(self):
+        self.service.fail_next(status=500)
+
+        with self.assertRaises(HttpError):
+            self.handler.create_sheet("Преподаватели")
+
+        self.assertEqual(self.service.requests_count["spreadsheets.batchUpdate"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
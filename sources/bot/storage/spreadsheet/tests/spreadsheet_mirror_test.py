@@ -0,0 +1,83 @@
+import os
+import tempfile
+import time
+import unittest
+
+from ..auth.auth_spreadsheet_handler import AuthSpreadsheetHandler
+from ..emulator.fake_sheets_service import FakeSheetsService
+from ..request_scheduler import RequestScheduler
+from ..spreadsheet_handler import SpreadsheetHandler
+from ..spreadsheet_mirror import SpreadsheetMirror
+
+
+class TestSpreadsheetMirror(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror_path = os.path.join(self.directory.name, "mirror.db")
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [["username", "ФИО", "Группа", "Подгруппа"], ["student1", "name1", "group1", "1"]],
+                "Преподаватели": [["username", "ФИО"]],
+            }
+        )
+        self.mirrors = []
+
+    def tearDown(self):
+        for mirror in self.mirrors:
+            mirror.close()
+        self.directory.cleanup()
+
+    def create_mirror(self) -> SpreadsheetMirror:
+        handler = SpreadsheetHandler("", self.spreadsheet_id, service=self.service, scheduler=RequestScheduler())
+        mirror = SpreadsheetMirror(handler, self.spreadsheet_id, ["Студенты", "Преподаватели"], self.mirror_path)
+        self.mirrors.append(mirror)
+        return mirror
+
+    def test_keep_mirror_consistent_after_write(self):
+        handler = AuthSpreadsheetHandler(self.spreadsheet_id, "", self.mirror_path, service=self.service)
+        try:
+            handler.add_student("student2", name="name2", group="group1", subgroup="2")
+            self.assertEqual(handler.get_student_by_username("student2")["name"], "name2")
+
+            handler.flush()
+            self.assertEqual(self.service.get_values(self.spreadsheet_id, "Студенты")[-1][0], "student2")
+        finally:
+            handler.close()
+
+        mirror = self.create_mirror()
+        mirror.refresh()
+        self.assertEqual(mirror.keys("Студенты"), ["student1", "student2"])
+        self.assertEqual(
+            [row["username"] for row in mirror.find("Студенты", {"Группа": "group1"})], ["student1", "student2"]
+        )
+
+    def test_apply_spreadsheet_changes_on_refresh(self):
+        mirror = self.create_mirror()
+        mirror.start()
+        self.service.append_values(self.spreadsheet_id, "Студенты", {"values": [["student2", "name2", "group2", "1"]]})
+        self.service.batch_update_values(
+            self.spreadsheet_id, {"data": [{"range": "Студенты!B2", "values": [["name3"]]}]}
+        )
+        mirror.refresh()
+
+        self.assertEqual(mirror.get("Студенты", "student1")["ФИО"], "name3")
+        self.assertEqual(mirror.find("Студенты", {"Группа": "group2"})[0]["username"], "student2")
+
+    def test_serve_synchronized_mirror_after_restart(self):
+        mirror = self.create_mirror()
+        mirror.refresh()
+        mirror.close()
+        self.mirrors.remove(mirror)
+
+        self.service.latency = 0.5
+        mirror = self.create_mirror()
+        started_at = time.monotonic()
+        mirror.start()
+
+        self.assertEqual(mirror.get("Студенты", "student1")["ФИО"], "name1")
+        self.assertLess(time.monotonic() - started_at, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
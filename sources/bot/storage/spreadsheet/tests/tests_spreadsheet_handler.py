@@ -1,40 +1,69 @@
+import threading
 from datetime import datetime
+from typing import Dict
 
-import apiclient
-import httplib2
 from googleapiclient.errors import HttpError
-from oauth2client.service_account import ServiceAccountCredentials
 
 from .base_tests_spreadsheet_handler import BaseTestsSpreadsheetHandler
+from .result_sink import ResultSink
 from ..spreadsheet_handler import SpreadsheetHandler
 from ..util.test_to_json_file import JsonTestFileUtil
+from ....exceptions import SpreadsheetHandlerException, UnpublishableTestException
+from ....modules.chains.survey.callback_codec import SurveyCallbackCodec
 
 
 class TestsSpreadsheetHandler(BaseTestsSpreadsheetHandler):
-    def __init__(self, credentials_file_name: str):
+    def __init__(self, credentials_file_name: str, service=None):
         self._credentials_file_name = credentials_file_name
-        self._handler = SpreadsheetHandler("", credentials_file_name)
-        self._http_auth = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_file_name,
-            ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"],
-        ).authorize(httplib2.Http())
-        self._service = apiclient.discovery.build("sheets", "v4", http=self._http_auth)
+        self._service = service
+
+        # Results sinks by spreadsheets ids and spreadsheets ids by loaded tests names.
+        self._sinks: Dict[str, ResultSink] = {}
+        self._test_spreadsheets: Dict[str, str] = {}
+        self._lock = threading.Lock()
 
     def load_test_by_link(self, url: str):
+        # Tests may be loaded concurrently, so loaded spreadsheet isn't kept by handler.
         url_details = url.split("/")
         spreadsheet_id = url_details[url_details.index("d") + 1]
-        self._handler = SpreadsheetHandler(spreadsheet_id, self._credentials_file_name)
-        return self._get_test()
-
-    def _get_test(self) -> tuple[str, list[dict]]:
+        handler = self._get_sink(spreadsheet_id).handler
+        # Test sheets may be changed since the previous loading.
+        handler.invalidate_metadata()
+        return self._get_test(handler, spreadsheet_id)
+
+    def _get_sink(self, spreadsheet_id: str) -> ResultSink:
+        with self._lock:
+            if spreadsheet_id not in self._sinks:
+                # Handler reuses credentials and service of token file, so it is cheap to create it for every test.
+                handler = SpreadsheetHandler(self._credentials_file_name, spreadsheet_id, service=self._service)
+                self._sinks[spreadsheet_id] = ResultSink(handler)
+            return self._sinks[spreadsheet_id]
+
+    def _get_test(self, handler: SpreadsheetHandler, spreadsheet_id: str) -> tuple[str, list[dict]]:
         try:
-            test_name = self._handler.get_spreadsheet_page_names()[0]
-            sheet_data = self._handler.get_sheet_values(test_name, "A1", "Z1000")
+            test_name = handler.get_spreadsheet_page_names()[0]
+            raw_data = list(handler.iter_sheet_rows(test_name))
         except HttpError:
             return "", []
 
-        raw_data = sheet_data["valueRanges"][0]["values"]
+        survey = self._parse_survey(raw_data)
+        self._check_survey(test_name, survey)
+        with self._lock:
+            self._test_spreadsheets[test_name] = spreadsheet_id
+
+        JsonTestFileUtil.save_test(test_name, survey, spreadsheet_id)
+        return test_name, survey
+
+    @staticmethod
+    def _check_survey(test_name: str, survey: list) -> None:
+        # Test, which callbacks can't be encoded, isn't saved, so students never get it.
+        try:
+            SurveyCallbackCodec.check_test(test_name, len(survey))
+        except ValueError as error:
+            raise UnpublishableTestException(f"Test {test_name} can't be sent to students: {error}") from error
 
+    @staticmethod
+    def _parse_survey(raw_data: list) -> list:
         survey = []
         keys = []
 
@@ -54,18 +83,32 @@ class TestsSpreadsheetHandler(BaseTestsSpreadsheetHandler):
             if len(el) < 1:
                 survey.remove(el)
 
-        JsonTestFileUtil.save_test(test_name, survey)
-        return test_name, survey
-
-    def add_result_to_worksheet(self, test_name, user_data, result_list) -> None:
-        if test_name + "_result" not in self._handler.get_spreadsheet_page_names():
-            self._handler.create_sheet(test_name + "_result")
-            top_row = ["Студент", "Время"]
-            for q in result_list:
-                top_row.append(q["Вопрос"])
-            top_row.append("Результат")
-            self._handler.add_row(test_name + "_result", top_row)
-
+        return survey
+
+    def _get_test_spreadsheet_id(self, test_name: str) -> str:
+        spreadsheet_id = self._test_spreadsheets.get(test_name)
+        if spreadsheet_id is None:
+            # Test may be loaded before restart.
+            spreadsheet_id = JsonTestFileUtil.get_test_spreadsheet_id(test_name)
+        if not spreadsheet_id:
+            raise SpreadsheetHandlerException(f"Spreadsheet of test {test_name} is unknown")
+        return spreadsheet_id
+
+    def add_result_to_worksheet(self, test_name, user_data, result_list, spreadsheet_id: str = None) -> None:
+        # Result is written to spreadsheet of its test, even if other test is loaded later.
+        sink = self._get_sink(spreadsheet_id or self._get_test_spreadsheet_id(test_name))
+        sink.add(test_name, self._get_result_top_row(result_list), self._get_result_row(user_data, result_list))
+
+    @staticmethod
+    def _get_result_top_row(result_list) -> list:
+        top_row = ["Студент", "Время"]
+        for q in result_list:
+            top_row.append(q["Вопрос"])
+        top_row.append("Результат")
+        return top_row
+
+    @staticmethod
+    def _get_result_row(user_data, result_list) -> list:
         correct_answers = 0
         boolean_answer_list = []
 
@@ -82,8 +125,15 @@ class TestsSpreadsheetHandler(BaseTestsSpreadsheetHandler):
             row.append(ans)
 
         row.append(f"{correct_answers}/{len(result_list)}")
+        return row
+
+    def flush(self):
+        for sink in list(self._sinks.values()):
+            sink.flush()
 
-        self._handler.add_row(test_name + "_result", row)
+    def close(self):
+        for sink in list(self._sinks.values()):
+            sink.close()
 
     def accept_storage(self, storage):
         storage.visit_tests_handler(self)
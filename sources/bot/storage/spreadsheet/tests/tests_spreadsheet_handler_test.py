@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ....exceptions import UnpublishableTestException
+from ..emulator.fake_sheets_service import FakeSheetsService
+from .tests_spreadsheet_handler import TestsSpreadsheetHandler
+from ..util.test_to_json_file import JsonTestFileUtil
+
+
+class TestEmulatedTestsSpreadsheetHandler(unittest.TestCase):
+    def setUp(self):
+        # Loaded tests are saved to surveys directory of working directory.
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs("surveys")
+
+        self.service = FakeSheetsService()
+        self.spreadsheet_ids = [
+            self.service.add_spreadsheet({name: [["Вопрос", "Ответ"], ["question", "answer"]]})
+            for name in ("test1", "test2")
+        ]
+        self.handler = TestsSpreadsheetHandler("", service=self.service)
+
+    def tearDown(self):
+        self.handler.close()
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+
+    def _load(self, spreadsheet_id: str):
+        return self.handler.load_test_by_link(f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit")
+
+    def test_cache_loaded_test(self):
+        test_name, survey = self._load(self.spreadsheet_ids[0])
+        os.remove(os.path.join("surveys", f"{test_name}.json"))
+
+        self.assertIs(JsonTestFileUtil.get_test_from_file(test_name), survey)
+
+    def test_not_save_unpublishable_test(self):
+        spreadsheet_id = self.service.add_spreadsheet(
+            {"test3": [["Вопрос", "Ответ"]] + [["question", "answer"]] * 4096}
+        )
+
+        with self.assertRaises(UnpublishableTestException):
+            self._load(spreadsheet_id)
+        self.assertNotIn("test3", JsonTestFileUtil.get_test_names())
+        self.assertEqual(JsonTestFileUtil.get_test_spreadsheet_id("test3"), "")
+
+    def test_batch_results(self):
+        self.assertEqual(self._load(self.spreadsheet_ids[0])[0], "test1")
+        self.service.requests_count.clear()
+
+        for number in range(200):
+            self.handler.add_result_to_worksheet(
+                "test1", f"student{number}", [{"Вопрос": "question", "is_correct": number % 2 == 0}]
+            )
+        self.handler.flush()
+
+        rows = self.service.get_values(self.spreadsheet_ids[0], "test1_result")
+        self.assertEqual(rows[0], ["Студент", "Время", "question", "Результат"])
+        self.assertEqual(len(rows), 201)
+        self.assertEqual(self.service.requests_count["spreadsheets.get"], 0)
+        self.assertEqual(self.service.requests_count["spreadsheets.batchUpdate"], 1)
+        self.assertEqual(self.service.requests_count["values.batchGet"], 0)
+        self.assertLessEqual(self.service.requests_count["values.batchUpdate"], 2)
+
+    def test_route_results_to_test_spreadsheet(self):
+        self._load(self.spreadsheet_ids[0])
+        self._load(self.spreadsheet_ids[1])
+
+        self.handler.add_result_to_worksheet("test1", "student1", [{"Вопрос": "question", "is_correct": True}])
+        self.handler.flush()
+
+        self.assertEqual(len(self.service.get_values(self.spreadsheet_ids[0], "test1_result")), 2)
+        sheets = self.service.get_spreadsheet(self.spreadsheet_ids[1])["sheets"]
+        self.assertNotIn("test1_result", [sheet["properties"]["title"] for sheet in sheets])
+
+    def test_load_tests_concurrently(self):
+        self.service.latency = 0.01
+        with ThreadPoolExecutor(max_workers=len(self.spreadsheet_ids)) as pool:
+            names = [test_name for test_name, _ in pool.map(self._load, self.spreadsheet_ids)]
+
+        self.assertEqual(names, ["test1", "test2"])
+        for test_name, spreadsheet_id in zip(names, self.spreadsheet_ids):
+            self.assertEqual(JsonTestFileUtil.get_test_spreadsheet_id(test_name), spreadsheet_id)
+
+    def test_route_results_after_restart(self):
+        self._load(self.spreadsheet_ids[0])
+        self._load(self.spreadsheet_ids[1])
+        self.handler.close()
+
+        self.handler = TestsSpreadsheetHandler("", service=self.service)
+        self.handler.add_result_to_worksheet("test1", "student1", [{"Вопрос": "question", "is_correct": True}])
+        self.handler.add_result_to_worksheet(
+            "test2", "student1", [{"Вопрос": "question", "is_correct": True}], self.spreadsheet_ids[0]
+        )
+        self.handler.flush()
+
+        self.assertEqual(len(self.service.get_values(self.spreadsheet_ids[0], "test1_result")), 2)
+        self.assertEqual(len(self.service.get_values(self.spreadsheet_ids[0], "test2_result")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
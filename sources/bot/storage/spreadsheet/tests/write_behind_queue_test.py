@@ -0,0 +1,113 @@
+import threading
+import unittest
+
+from ..emulator.fake_sheets_service import FakeSheetsService
+from ..request_scheduler import RequestScheduler
+from ..spreadsheet_handler import SpreadsheetHandler
+from ..write_behind_queue import WriteBehindQueue
+
+
+class ManualTimer:
+    """
+    Timer fired by test instead of time.
+    """
+
+    def __init__(self, interval: float, function):
+        self.function = function
+        self.daemon = False
+        self.started = False
+        self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class BlockingHandler:
+    """
+    Spreadsheet handler wrapper, which holds rows writing until it is released.
+    """
+
+    def __init__(self, handler: SpreadsheetHandler):
+        self.handler = handler
+        self.writing = threading.Event()
+        self.released = threading.Event()
+        self.released.set()
+
+    def add_rows(self, sheet_rows):
+        self.writing.set()
+        self.released.wait()
+        self.handler.add_rows(sheet_rows)
+
+
+class TestWriteBehindQueue(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet({"Студенты": [["username", "ФИО"]]})
+        scheduler = RequestScheduler(period=1, base_delay=0, max_retries=0)
+        self.handler = BlockingHandler(
+            SpreadsheetHandler("", self.spreadsheet_id, service=self.service, scheduler=scheduler)
+        )
+        self.written = []
+        self.timers = []
+        self.queue = WriteBehindQueue(
+            self.handler, flush_interval=0.1, max_rows=2, on_written=self.written.append, timer_factory=self._timer
+        )
+
+    def tearDown(self):
+        self.queue.close()
+
+    def _timer(self, interval: float, function) -> ManualTimer:
+        timer = ManualTimer(interval, function)
+        self.timers.append(timer)
+        return timer
+
+    def fire_timers(self):
+        timers, self.timers = self.timers, []
+        for timer in timers:
+            if timer.started and not timer.cancelled:
+                timer.function()
+
+    def get_rows(self):
+        return self.service.get_values(self.spreadsheet_id, "Студенты")[1:]
+
+    def test_flush_by_timer(self):
+        self.queue.add_row("Студенты", ["student1", "name1"])
+        self.assertEqual(self.get_rows(), [])
+
+        self.fire_timers()
+        self.assertEqual(self.get_rows(), [["student1", "name1"]])
+        self.assertEqual(self.written, [{"Студенты": ["student1"]}])
+
+    def test_enqueue_while_writing(self):
+        self.handler.released.clear()
+        self.queue.add_row("Студенты", ["student1", "name1"])
+        writer = threading.Thread(target=self.queue.flush)
+        writer.start()
+        self.handler.writing.wait()
+
+        enqueuer = threading.Thread(target=self.queue.add_row, args=("Студенты", ["student2", "name2"]))
+        enqueuer.start()
+        enqueuer.join(timeout=1)
+        self.assertFalse(enqueuer.is_alive())
+
+        self.handler.released.set()
+        writer.join()
+        self.queue.flush()
+        self.assertEqual(self.written, [{"Студенты": ["student1"]}, {"Студенты": ["student2"]}])
+
+    def test_accept_row_on_failed_full_queue_flush(self):
+        self.service.fail_next(1, 400)
+        self.queue.add_row("Студенты", ["student1", "name1"])
+        self.queue.add_row("Студенты", ["student2", "name2"])
+        self.assertEqual(self.get_rows(), [])
+
+        self.fire_timers()
+        self.assertEqual(self.get_rows(), [["student1", "name1"], ["student2", "name2"]])
+        self.assertEqual(self.written, [{"Студенты": ["student1", "student2"]}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Spreadsheet A1 notation util implementation module.
+"""
+import re
+from typing import Tuple
+
+
+class A1Notation:
+    """
+    A1 notation util class builds spreadsheet ranges for any rows and columns count.
+    """
+
+    @staticmethod
+    def get_column_letter(column_number: int) -> str:
+        """
+        Gets column letters by its number.
+
+        Note: Columns are numbered from 1, so 1 is A, 26 is Z, 27 is AA and so on.
+
+        :param column_number: Column number
+        :type column_number: :obj:`int`
+
+        :return: Returns column letters.
+        :rtype: :obj:`str`
+        """
+        if column_number < 1:
+            raise ValueError(f"Invalid column number {column_number}")
+
+        letters = ""
+        while column_number > 0:
+            column_number, remainder = divmod(column_number - 1, 26)
+            letters = chr(ord("A") + remainder) + letters
+
+        return letters
+
+    @staticmethod
+    def get_column_number(column_letter: str) -> int:
+        """
+        Gets column number by its letters.
+
+        :param column_letter: Column letters
+        :type column_letter: :obj:`str`
+
+        :return: Returns column number starting from 1.
+        :rtype: :obj:`int`
+        """
+        if not column_letter.isalpha():
+            raise ValueError(f"Invalid column letters {column_letter}")
+
+        column_number = 0
+        for letter in column_letter.upper():
+            column_number = column_number * 26 + ord(letter) - ord("A") + 1
+
+        return column_number
+
+    @staticmethod
+    def get_sheet_reference(sheet_title: str) -> str:
+        """
+        Gets quoted sheet title to use it in ranges.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :return: Returns sheet reference.
+        :rtype: :obj:`str`
+        """
+        escaped_title = sheet_title.replace("'", "''")
+        return f"'{escaped_title}'"
+
+    @staticmethod
+    def get_range(sheet_title: str, first_row: int, last_row: int, last_column: int, first_column: int = 1) -> str:
+        """
+        Gets sheet cells range in A1 notation.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param first_row: First range row number
+        :type first_row: :obj:`int`
+
+        :param last_row: Last range row number
+        :type last_row: :obj:`int`
+
+        :param last_column: Last range column number
+        :type last_column: :obj:`int`
+
+        :param first_column: First range column number
+        :type first_column: :obj:`int`
+
+        :return: Returns range.
+        :rtype: :obj:`str`
+        """
+        first_letter = A1Notation.get_column_letter(first_column)
+        last_letter = A1Notation.get_column_letter(last_column)
+        return f"{A1Notation.get_sheet_reference(sheet_title)}!{first_letter}{first_row}:{last_letter}{last_row}"
+
+    @staticmethod
+    def get_rows_range(sheet_title: str, first_row: int, last_row: int) -> str:
+        """
+        Gets sheet rows range with all their columns in A1 notation.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param first_row: First range row number
+        :type first_row: :obj:`int`
+
+        :param last_row: Last range row number
+        :type last_row: :obj:`int`
+
+        :return: Returns range.
+        :rtype: :obj:`str`
+        """
+        return f"{A1Notation.get_sheet_reference(sheet_title)}!{first_row}:{last_row}"
+
+    @staticmethod
+    def get_column_range(sheet_title: str, column_number: int = 1) -> str:
+        """
+        Gets whole sheet column range in A1 notation.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param column_number: Column number
+        :type column_number: :obj:`int`
+
+        :return: Returns range.
+        :rtype: :obj:`str`
+        """
+        letter = A1Notation.get_column_letter(column_number)
+        return f"{A1Notation.get_sheet_reference(sheet_title)}!{letter}:{letter}"
+
+    @staticmethod
+    def parse_range(sheet_range: str) -> Tuple[str, int, int, int, int]:
+        """
+        Parses range in A1 notation.
+
+        Note: Range bounds, which aren't defined, are returned as None, so whole sheet range is (title, None, None,
+        None, None) and whole column range is (title, None, None, column, column).
+
+        :param sheet_range: Range in A1 notation
+        :type sheet_range: :obj:`str`
+
+        :return: Returns sheet title, first and last row numbers, first and last column numbers.
+        :rtype: :obj:`Tuple[str, int, int, int, int]`
+        """
+        match = re.fullmatch(r"(?:'((?:[^']|'')*)'|([^!']+))(?:!(.+))?", sheet_range)
+        if match is None:
+            raise ValueError(f"Invalid range {sheet_range}")
+
+        sheet_title = match.group(1).replace("''", "'") if match.group(1) is not None else match.group(2)
+        if match.group(3) is None:
+            return sheet_title, None, None, None, None
+
+        corners = match.group(3).split(":")
+        if len(corners) > 2:
+            raise ValueError(f"Invalid range {sheet_range}")
+
+        bounds = []
+        for corner in corners:
+            corner_match = re.fullmatch(r"([A-Za-z]*)(\d*)", corner)
+            if corner_match is None or corner == "":
+                raise ValueError(f"Invalid range {sheet_range}")
+
+            column_letter, row_number = corner_match.groups()
+            bounds.append(
+                (
+                    int(row_number) if row_number else None,
+                    A1Notation.get_column_number(column_letter) if column_letter else None,
+                )
+            )
+
+        (first_row, first_column), (last_row, last_column) = bounds[0], bounds[-1]
+        return sheet_title, first_row, last_row, first_column, last_column
@@ -0,0 +1,62 @@
+"""
+Authorized HTTP connections pool implementation module.
+"""
+import queue
+import threading
+from typing import List
+
+import httplib2
+from oauth2client.service_account import ServiceAccountCredentials
+
+
+class AuthorizedHttpPool:
+    """
+    Authorized HTTP connections pool class implementation.
+
+    Note: :class:`httplib2.Http` isn't thread safe, so every request borrows free connection from pool and returns it
+    after response is read. Connections are created lazily up to pool size and are kept alive between requests, so
+    service shared by handlers and their background threads reuses TLS connections.
+    """
+
+    def __init__(self, credentials: ServiceAccountCredentials, size: int = 4, timeout: float = None):
+        self._credentials = credentials
+        self._size = size
+        self._timeout = timeout
+        self._connections: List[httplib2.Http] = []
+        self._free_connections = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> httplib2.Http:
+        try:
+            return self._free_connections.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._connections) < self._size:
+                connection = self._credentials.authorize(httplib2.Http(timeout=self._timeout))
+                self._connections.append(connection)
+                return connection
+
+        return self._free_connections.get()
+
+    def request(self, *args, **kwargs):
+        """
+        Makes request by free pooled connection.
+
+        :return: Returns response and its content.
+        :rtype: :obj:`tuple[httplib2.Response, bytes]`
+        """
+        connection = self._acquire()
+        try:
+            return connection.request(*args, **kwargs)
+        finally:
+            self._free_connections.put(connection)
+
+    def close(self):
+        """
+        Closes opened connections.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
@@ -0,0 +1,125 @@
+"""
+Surveys cache implementation module.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class SurveyCache:
+    """
+    Surveys cache class implementation keeps parsed surveys files by tests names with bounded size.
+
+    Note: Survey is cached with modification time of its file as version. Version is checked not more often than
+    once in check interval, so cached survey is given without disk reading. If file is changed then survey is
+    loaded again. If max size is reached then least recently used survey is dropped.
+    """
+
+    def __init__(self, directory: str = "surveys", max_size: int = 64, check_interval: float = 30):
+        self._directory = directory
+        self._max_size = max_size
+        self._check_interval = check_interval
+        # Entries are lists of survey file version, time of its check and survey.
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_path(self, test_name: str) -> str:
+        return os.path.join(self._directory, f"{test_name}.json")
+
+    def get_names(self) -> List[str]:
+        """
+        Gets names of tests, which have survey files.
+
+        :return: Returns tests names.
+        :rtype: :obj:`List[str]`
+        """
+        try:
+            file_names = os.listdir(self._directory)
+        except OSError:
+            return []
+        return [file_name[: -len(".json")] for file_name in file_names if file_name.endswith(".json")]
+
+    def _get_version(self, test_name: str) -> int:
+        return os.stat(self.get_path(test_name)).st_mtime_ns
+
+    def put(self, test_name: str, survey: List[dict], version: Optional[int] = None) -> None:
+        """
+        Puts survey by test name.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :param survey: Survey questions
+        :type survey: :obj:`List[dict]`
+
+        :param version: Survey file version. If it isn't defined then current file version is taken.
+        :type version: :obj:`Optional[int]`
+        """
+        if version is None:
+            version = self._get_version(test_name)
+
+        with self._lock:
+            self._entries[test_name] = [version, time.monotonic(), survey]
+            self._entries.move_to_end(test_name)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, test_name: str) -> List[dict]:
+        """
+        Gets survey by test name, survey file is read if survey isn't cached or its file is changed.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :return: Returns survey questions.
+        :rtype: :obj:`List[dict]`
+        """
+        return self.get_versioned(test_name)[1]
+
+    def get_versioned(self, test_name: str) -> Tuple[int, List[dict]]:
+        """
+        Gets survey by test name with version of its file, survey is given like by :meth:`get`.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+
+        :return: Returns survey file version and survey questions.
+        :rtype: :obj:`Tuple[int, List[dict]]`
+        """
+        with self._lock:
+            entry = self._entries.get(test_name)
+            if entry is not None and time.monotonic() - entry[1] < self._check_interval:
+                self._entries.move_to_end(test_name)
+                return entry[0], entry[2]
+
+        version = self._get_version(test_name)
+        if entry is not None and entry[0] == version:
+            with self._lock:
+                entry[1] = time.monotonic()
+            return version, entry[2]
+
+        with open(self.get_path(test_name), encoding="utf-8") as json_file:
+            survey = json.load(json_file)
+        self.put(test_name, survey, version)
+        return version, survey
+
+    def invalidate(self, test_name: str) -> None:
+        """
+        Drops cached survey by test name.
+
+        :param test_name: Test name
+        :type test_name: :obj:`str`
+        """
+        with self._lock:
+            self._entries.pop(test_name, None)
+
+    def clear(self) -> None:
+        """
+        Drops all cached surveys.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -2,18 +2,53 @@ import json
 import os
 import sys
 
+from .survey_cache import SurveyCache
+
 
 class JsonTestFileUtil:
-    @staticmethod
-    def save_test(test_name: str, test: list[dict]) -> None:
+    # Surveys are read on every student answer, so they are kept in memory by tests names.
+    _cache = SurveyCache()
+    # Tests spreadsheets are kept in subdirectory of surveys, so they aren't taken for tests.
+    _spreadsheets_directory = "spreadsheets"
+
+    @classmethod
+    def save_test(cls, test_name: str, test: list[dict], spreadsheet_id: str = "") -> None:
         if not test_name == "":
             current_path = os.path.dirname(sys.argv[0])  # needs to be configured in config.ini
             path = f"{current_path}\\surveys"
             os.makedirs(path, exist_ok=True)
-            with open(f"surveys/{test_name}.json", "w", encoding="utf-8") as f:
+            with open(cls._cache.get_path(test_name), "w", encoding="utf-8") as f:
                 json.dump(test, f, ensure_ascii=False, indent=4)
+            cls._cache.put(test_name, test)
+
+            # Test spreadsheet is kept next to test, so results are written to it after restart too.
+            if spreadsheet_id:
+                spreadsheet_path = cls._get_spreadsheet_path(test_name)
+                os.makedirs(os.path.dirname(spreadsheet_path), exist_ok=True)
+                with open(spreadsheet_path, "w", encoding="utf-8") as f:
+                    json.dump({"spreadsheet_id": spreadsheet_id}, f)
+
+    @classmethod
+    def _get_spreadsheet_path(cls, test_name: str) -> str:
+        test_path = cls._cache.get_path(test_name)
+        return os.path.join(os.path.dirname(test_path), cls._spreadsheets_directory, os.path.basename(test_path))
+
+    @classmethod
+    def get_test_spreadsheet_id(cls, test_name: str) -> str:
+        try:
+            with open(cls._get_spreadsheet_path(test_name), encoding="utf-8") as f:
+                return json.load(f).get("spreadsheet_id", "")
+        except (OSError, ValueError):
+            return ""
+
+    @classmethod
+    def get_test_names(cls) -> list[str]:
+        return cls._cache.get_names()
+
+    @classmethod
+    def get_test_from_file(cls, survey_sheet_name: str):
+        return cls._cache.get(survey_sheet_name)
 
-    @staticmethod
-    def get_test_from_file(survey_sheet_name: str):
-        with open(f"surveys/{survey_sheet_name}.json", encoding="utf-8") as json_file:
-            return json.load(json_file)
+    @classmethod
+    def get_versioned_test_from_file(cls, survey_sheet_name: str):
+        return cls._cache.get_versioned(survey_sheet_name)
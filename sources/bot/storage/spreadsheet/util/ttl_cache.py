@@ -0,0 +1,82 @@
+"""
+Time-to-live cache implementation module.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TtlCache:
+    """
+    Time-to-live cache class implementation with bounded size.
+
+    Note: Entries are expired in ttl seconds after putting. If max size is reached then least recently used entry
+    is dropped.
+    """
+
+    def __init__(self, ttl: float = 300, max_size: int = 128):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets not expired cached value by key.
+
+        :param key: Cache key
+        :type key: :obj:`Hashable`
+
+        :param default: Value returned if there is no such key or it is expired
+        :type default: :obj:`Any`
+
+        :return: Returns cached value.
+        :rtype: :obj:`Any`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Puts value by key.
+
+        :param key: Cache key
+        :type key: :obj:`Hashable`
+
+        :param value: Cached value
+        :type value: :obj:`Any`
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drops cached value by key.
+
+        :param key: Cache key
+        :type key: :obj:`Hashable`
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drops all cached values.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,110 @@
+"""
+Asynchronous student works submissions log implementation module.
+"""
+import asyncio
+from typing import Dict, List
+
+from ..util.a1_notation import A1Notation
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from .works_log import WorksLog
+
+
+class AsyncWorksLog(WorksLog):
+    """
+    Asynchronous works log class implementation appends pending submissions in event loop task.
+
+    Note: Log keeps submissions like :class:`WorksLog` does, only sheet reading and appending are awaited.
+    """
+
+    def __init__(self, handler: AsyncSpreadsheetHandler, sheet_title: str = "works_log", flush_interval: float = 0.5):
+        super().__init__(handler, sheet_title, flush_interval)
+        self._load_lock = None
+        self._flush_lock = None
+
+    async def _load(self):
+        if self._loaded:
+            return
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            rows = []
+            if self._sheet_title in await self._handler.get_spreadsheet_page_names():
+                results = await self._handler.batch_get_sheet_values(
+                    [A1Notation.get_sheet_reference(self._sheet_title)]
+                )
+                rows = results["valueRanges"][0].get("values", [])
+            else:
+                await self._handler.create_sheet(self._sheet_title)
+
+            with self._lock:
+                self._read(iter(rows))
+                self._loaded = True
+
+    async def add(
+        self, username: str, name: str, group: str, subgroup: str, work: str, key: str = None
+    ) -> Dict[str, str]:
+        await self._load()
+        with self._lock:
+            return self._add_record(username, name, group, subgroup, work, key)
+
+    async def get_student_history(self, username: str) -> List[Dict[str, str]]:
+        await self._load()
+        with self._lock:
+            return self._get_student_history(username)
+
+    async def get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        await self._load()
+        with self._lock:
+            return self._get_group_history(group, subgroup)
+
+    def _schedule_flush(self):
+        if self._timer is None:
+            self._timer = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self._flush_interval)
+        # Flush doesn't cancel task, which runs it.
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as error:
+            self._logger.error(f"Unable to append pending works: {error}")
+            with self._lock:
+                self._schedule_flush()
+
+    async def flush(self):
+        """
+        Appends pending submissions by one request.
+
+        Note: Flushes are serialized to keep submissions order. If appending fails then submissions are returned
+        to log.
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            with self._lock:
+                rows = self._take_pending()
+                if not rows:
+                    return
+
+            try:
+                await self._handler.append_rows(self._sheet_title, rows)
+            except BaseException:
+                with self._lock:
+                    self._return_pending(rows)
+                raise
+
+            with self._lock:
+                self._has_header = True
+
+    async def close(self):
+        """
+        Appends pending submissions and stops log task.
+        """
+        await self.flush()
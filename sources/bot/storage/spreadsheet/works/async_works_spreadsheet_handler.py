@@ -0,0 +1,80 @@
+from typing import Dict, List
+
+from ....exceptions import InvalidSpreadsheetAttributeException
+from ..async_spreadsheet_handler import AsyncSpreadsheetHandler
+from ..auth.async_roster_index import AsyncRosterIndex
+from .async_works_log import AsyncWorksLog
+from .base_async_works_spreadsheet_handler import BaseAsyncWorksSpreadsheetHandler
+from .works_spreadsheet_handler import WorksSpreadsheetHandler
+
+
+class AsyncWorksSpreadsheetHandler(BaseAsyncWorksSpreadsheetHandler):
+    def __init__(self, spreadsheet_id: str, file_name: str, service=None):
+        self._attributes = {
+            "works": ["username", "ФИО", "Группа", "Подгруппа", "Лабораторная работа"],
+        }
+        self._handler = AsyncSpreadsheetHandler(file_name, spreadsheet_id, service=service)
+        self._works_sheet_title = list(self._attributes.keys())[0]
+        self._works = AsyncRosterIndex(self._handler, [self._works_sheet_title])
+        self._log = AsyncWorksLog(self._handler)
+
+    async def create_spreadsheet(self, spreadsheet_title="Информация о лабораторных работах") -> None:
+        await self._handler.create_spreadsheet(spreadsheet_title, self._works_sheet_title)
+        await self._handler.add_row(self._works_sheet_title, self._attributes.get("works"))
+        self._works.invalidate()
+
+    async def add_student_work(self, username: str, works_data: str, idempotency_key: str = None, **kwargs) -> None:
+        name = kwargs.get("name")
+        group = kwargs.get("group")
+        subgroup = kwargs.get("subgroup")
+        work = works_data
+
+        if not name:
+            raise InvalidSpreadsheetAttributeException("Invalid name value")
+        elif not group:
+            raise InvalidSpreadsheetAttributeException("Invalid group value")
+        elif not subgroup:
+            raise InvalidSpreadsheetAttributeException("Invalid subgroup value")
+        elif not work:
+            raise InvalidSpreadsheetAttributeException("Invalid work value")
+        else:
+            # Works sheet keeps the last student work, works log keeps all of them.
+            row = [username, name, group, subgroup, work]
+            await self._handler.add_row(self._works_sheet_title, row)
+            self._works.put(self._works_sheet_title, dict(zip(self._attributes.get("works"), row)))
+            await self._log.add(username, name, group, subgroup, work, idempotency_key)
+
+    async def remove_student(self, username: str) -> bool:
+        removed = await self._handler.remove_row(self._works_sheet_title, username)
+        self._works.remove(self._works_sheet_title, username)
+        return removed
+
+    async def get_student_work(self, username: str) -> dict:
+        return WorksSpreadsheetHandler._get_work(await self._works.get(self._works_sheet_title, username))
+
+    async def get_group_works(self, group: str, subgroup: str = None) -> List[dict]:
+        attributes = {"Группа": group}
+        if subgroup:
+            attributes["Подгруппа"] = subgroup
+
+        works = await self._works.find(self._works_sheet_title, attributes)
+        return [WorksSpreadsheetHandler._get_work(data) for data in works]
+
+    async def get_student_history(self, username: str) -> List[Dict[str, str]]:
+        history = await self._log.get_student_history(username)
+        return [WorksSpreadsheetHandler._get_submission(data) for data in history]
+
+    async def get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        history = await self._log.get_group_history(group, subgroup)
+        return [WorksSpreadsheetHandler._get_submission(data) for data in history]
+
+    async def flush(self):
+        await self._log.flush()
+
+    async def close(self):
+        self._works.stop()
+        await self._log.close()
+        await self._handler.close()
+
+    def accept_storage(self, storage):
+        storage.visit_works_handler(self)
@@ -0,0 +1,32 @@
+from abc import ABCMeta, abstractmethod
+from typing import Dict, List
+
+from ..base_spreadsheet_handler import BaseSpreadsheetHandler
+
+
+class BaseAsyncWorksSpreadsheetHandler(BaseSpreadsheetHandler):
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    async def add_student_work(self, username: str, works_data: str, idempotency_key: str = None, **kwargs) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_student(self, username: str) -> bool:
+        return False
+
+    @abstractmethod
+    async def get_student_work(self, username: str) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_group_works(self, group: str, subgroup: str = None) -> List[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_student_history(self, username: str) -> List[Dict[str, str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        raise NotImplementedError
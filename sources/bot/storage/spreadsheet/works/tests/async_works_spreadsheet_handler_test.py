@@ -0,0 +1,54 @@
+import unittest
+
+from ...emulator.fake_sheets_service import FakeSheetsService
+from ..async_works_spreadsheet_handler import AsyncWorksSpreadsheetHandler
+
+
+class TestEmulatedAsyncWorksSpreadsheetHandler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {"works": [["username", "ФИО", "Группа", "Подгруппа", "Лабораторная работа"]]}
+        )
+        self.handler = AsyncWorksSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+
+    async def asyncTearDown(self):
+        await self.handler.close()
+
+    async def test_log_student_works(self):
+        await self.handler.add_student_work("student1", "link1", name="name1", group="group1", subgroup="1")
+        await self.handler.add_student_work("student2", "link2", name="name2", group="group1", subgroup="2")
+        await self.handler.add_student_work("student1", "link3", name="name1", group="group1", subgroup="1")
+        await self.handler.flush()
+
+        history = await self.handler.get_student_history("student1")
+        self.assertEqual([(work["number"], work["work"]) for work in history], [("1", "link1"), ("2", "link3")])
+        self.assertEqual((await self.handler.get_student_work("student1"))["work"], "link3")
+        self.assertEqual(len(await self.handler.get_group_works("group1")), 2)
+        self.assertEqual(len(await self.handler.get_group_works("group1", "2")), 1)
+        self.assertEqual(len(await self.handler.get_group_history("group1")), 3)
+
+        rows = self.service.get_values(self.spreadsheet_id, "works")
+        self.assertEqual(
+            rows[1:], [["student1", "name1", "group1", "1", "link3"], ["student2", "name2", "group1", "2", "link2"]]
+        )
+        rows = self.service.get_values(self.spreadsheet_id, "works_log")
+        self.assertEqual([row[5] for row in rows[1:]], ["link1", "link2", "link3"])
+
+    async def test_read_existing_log(self):
+        await self.handler.add_student_work("student1", "link1", "key1", name="name1", group="group1", subgroup="1")
+        await self.handler.close()
+
+        self.handler = AsyncWorksSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+        await self.handler.add_student_work("student1", "link1", "key1", name="name1", group="group1", subgroup="1")
+        await self.handler.add_student_work("student1", "link2", name="name1", group="group1", subgroup="1")
+        await self.handler.flush()
+
+        history = await self.handler.get_student_history("student1")
+        self.assertEqual([(work["number"], work["work"]) for work in history], [("1", "link1"), ("2", "link2")])
+        self.assertEqual((await self.handler.get_student_work("student1"))["work"], "link2")
+        self.assertEqual(len(self.service.get_values(self.spreadsheet_id, "works_log")), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
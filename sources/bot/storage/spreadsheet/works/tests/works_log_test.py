@@ -0,0 +1,118 @@
+import threading
+import unittest
+
+from ...emulator.fake_sheets_service import FakeSheetsService
+from ...request_scheduler import RequestScheduler
+from ...spreadsheet_handler import SpreadsheetHandler
+from ..works_log import WorksLog
+
+
+class TestWorksLog(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet({"works": [["username"]]})
+        self.logs = []
+
+    def tearDown(self):
+        for log in self.logs:
+            log.close()
+
+    def create_log(self) -> WorksLog:
+        handler = SpreadsheetHandler("", self.spreadsheet_id, service=self.service, scheduler=RequestScheduler())
+        log = WorksLog(handler, flush_interval=10)
+        self.logs.append(log)
+        return log
+
+    def get_logged_rows(self):
+        return self.service.get_values(self.spreadsheet_id, "works_log")[1:]
+
+    def test_log_resubmission(self):
+        log = self.create_log()
+        log.add("student1", "name1", "group1", "1", "link1", "key1")
+        record = log.add("student1", "name1", "group1", "1", "link1", "key2")
+        log.flush()
+
+        self.assertEqual(record["Номер сдачи"], "2")
+        self.assertEqual(
+            [(row[4], row[5], row[7]) for row in self.get_logged_rows()],
+            [("1", "link1", "key1"), ("2", "link1", "key2")],
+        )
+
+    def test_skip_logged_key(self):
+        log = self.create_log()
+        first_record = log.add("student1", "name1", "group1", "1", "link1", "key1")
+        log.add("student1", "name1", "group1", "1", "link2", "key2")
+
+        self.assertIs(log.add("student1", "name1", "group1", "1", "link1", "key1"), first_record)
+        log.flush()
+        self.assertEqual(len(self.get_logged_rows()), 2)
+
+    def test_log_submissions_without_keys(self):
+        log = self.create_log()
+        log.add("student1", "name1", "group1", "1", "link1")
+        log.add("student1", "name1", "group1", "1", "link1")
+        log.flush()
+
+        self.assertEqual([row[4] for row in self.get_logged_rows()], ["1", "2"])
+
+    def test_index_existing_log(self):
+        log = self.create_log()
+        log.add("student1", "name1", "group1", "1", "link1", "key1")
+        log.add("student2", "name2", "group1", "2", "link2", "key2")
+        log.close()
+        self.logs.remove(log)
+
+        log = self.create_log()
+        self.assertEqual([record["username"] for record in log.get_group_history("group1")], ["student1", "student2"])
+        self.assertEqual([record["username"] for record in log.get_group_history("group1", "2")], ["student2"])
+        self.assertEqual(log.add("student1", "name1", "group1", "1", "link1", "key1")["Номер сдачи"], "1")
+        self.assertEqual(log.add("student1", "name1", "group1", "1", "link3", "key3")["Номер сдачи"], "2")
+
+    def test_read_log_without_keys_column(self):
+        header = WorksLog.attributes[:-1]
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {"works_log": [header, ["student1", "name1", "group1", "1", "1", "link1", "2022-01-01 00:00:00"]]}
+        )
+        log = self.create_log()
+
+        self.assertEqual(log.add("student1", "name1", "group1", "1", "link1", "key1")["Номер сдачи"], "2")
+
+    def test_append_header_after_failed_flush(self):
+        log = self.create_log()
+        log.add("student1", "name1", "group1", "1", "link1", "key1")
+        self.service.fail_next(1, 400)
+        with self.assertRaises(Exception):
+            log.flush()
+        self.assertEqual(self.service.get_values(self.spreadsheet_id, "works_log"), [])
+
+        log.flush()
+        rows = self.service.get_values(self.spreadsheet_id, "works_log")
+        self.assertEqual(rows[0], WorksLog.attributes)
+        self.assertEqual([row[7] for row in rows[1:]], ["key1"])
+
+    def test_log_while_flushing(self):
+        log = self.create_log()
+        log.add("student1", "name1", "group1", "1", "link1", "key1")
+
+        appending, released = threading.Event(), threading.Event()
+        append_rows = log._handler.append_rows
+
+        def append_rows_on_release(sheet_title, sheet_rows):
+            appending.set()
+            released.wait()
+            append_rows(sheet_title, sheet_rows)
+
+        log._handler.append_rows = append_rows_on_release
+        flusher = threading.Thread(target=log.flush)
+        flusher.start()
+        appending.wait()
+
+        self.assertEqual(log.add("student1", "name1", "group1", "1", "link2", "key2")["Номер сдачи"], "2")
+        released.set()
+        flusher.join()
+        log.flush()
+        self.assertEqual([row[7] for row in self.get_logged_rows()], ["key1", "key2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from ...emulator.fake_sheets_service import FakeSheetsService
+from ..works_spreadsheet_handler import WorksSpreadsheetHandler
+
+
+class TestEmulatedWorksSpreadsheetHandler(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeSheetsService()
+        self.spreadsheet_id = self.service.add_spreadsheet(
+            {"works": [["username", "ФИО", "Группа", "Подгруппа", "Лабораторная работа"]]}
+        )
+        self.handler = WorksSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+
+    def tearDown(self):
+        self.handler.close()
+
+    def test_log_student_works(self):
+        self.handler.add_student_work("student1", "link1", name="name1", group="group1", subgroup="1")
+        self.handler.add_student_work("student2", "link2", name="name2", group="group1", subgroup="2")
+        self.handler.add_student_work("student1", "link3", name="name1", group="group1", subgroup="1")
+        self.handler.add_student_work("student1", "link3", name="name1", group="group1", subgroup="1")
+        self.handler.flush()
+
+        history = self.handler.get_student_history("student1")
+        self.assertEqual(
+            [(work["number"], work["work"]) for work in history], [("1", "link1"), ("2", "link3"), ("3", "link3")]
+        )
+        self.assertEqual(self.handler.get_student_work("student1")["work"], "link3")
+        self.assertEqual(len(self.handler.get_group_history("group1")), 4)
+        self.assertEqual(len(self.handler.get_group_history("group1", "2")), 1)
+
+        rows = self.service.get_values(self.spreadsheet_id, "works_log")
+        self.assertEqual([row[5] for row in rows[1:]], ["link1", "link2", "link3", "link3"])
+        # Works log header with submissions, and new rows of works sheet.
+        self.assertEqual(self.service.requests_count["values.append"], 2)
+
+    def test_read_existing_log(self):
+        self.handler.add_student_work("student1", "link1", name="name1", group="group1", subgroup="1")
+        self.handler.close()
+
+        self.handler = WorksSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+        self.handler.add_student_work("student1", "link2", name="name1", group="group1", subgroup="1")
+
+        self.assertEqual([work["number"] for work in self.handler.get_student_history("student1")], ["1", "2"])
+
+    def test_skip_logged_write_after_restart(self):
+        work = {"name": "name1", "group": "group1", "subgroup": "1"}
+        self.handler.add_student_work("student1", "link1", idempotency_key="key1", **work)
+        self.handler.close()
+
+        self.handler = WorksSpreadsheetHandler(self.spreadsheet_id, "", service=self.service)
+        self.handler.add_student_work("student1", "link2", idempotency_key="key2", **work)
+        self.handler.add_student_work("student1", "link1", idempotency_key="key1", **work)
+        self.handler.flush()
+
+        rows = self.service.get_values(self.spreadsheet_id, "works_log")
+        self.assertEqual([(row[5], row[7]) for row in rows[1:]], [("link1", "key1"), ("link2", "key2")])
+
+
+if __name__ == "__main__":
+    unittest.main()
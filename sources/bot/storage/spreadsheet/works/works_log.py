@@ -0,0 +1,221 @@
+"""
+Student works submissions log implementation module.
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List
+
+from ....loggers import LogInstaller
+from ..spreadsheet_handler import SpreadsheetHandler
+
+
+class WorksLog:
+    """
+    Works log class implementation keeps every student work submission in append-only sheet.
+
+    Note: Submissions are appended without reading sheet by batches in flush interval after the first pending one.
+    Log is read once on first access, then submissions histories are kept in memory by students and groups, so
+    they are queried without sheet reading. Every submission is logged, even if it repeats the previous one.
+    Submission may be logged with idempotency key of its write, which is kept in log too, and submission with logged
+    key isn't logged again even after restart, so replayed writes don't duplicate submissions.
+
+    Bot doesn't ask students for laboratory work numbers, so submissions are numbered by their order among student
+    submissions in "Номер сдачи" column. Sheet is created without header, which is appended by the first flush with
+    pending submissions, so header failed to append is appended again by the next one.
+    """
+
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    attributes = ["username", "ФИО", "Группа", "Подгруппа", "Номер сдачи", "Лабораторная работа", "Время", "Ключ"]
+
+    def __init__(self, handler: SpreadsheetHandler, sheet_title: str = "works_log", flush_interval: float = 0.5):
+        self._handler = handler
+        self._sheet_title = sheet_title
+        self._flush_interval = flush_interval
+
+        self._loaded = False
+        self._has_header = False
+        self._students: Dict[str, List[Dict[str, str]]] = {}
+        self._groups: Dict[str, List[Dict[str, str]]] = {}
+        self._keys: Dict[str, Dict[str, str]] = {}
+        self._pending: List[List[str]] = []
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._timer = None
+
+    def _load(self):
+        if self._loaded:
+            return
+
+        if self._sheet_title in self._handler.get_spreadsheet_page_names():
+            self._read(self._handler.iter_sheet_rows(self._sheet_title))
+        else:
+            self._handler.create_sheet(self._sheet_title)
+        self._loaded = True
+
+    def _read(self, rows: Iterator[List[str]]):
+        attributes = next(rows, [])
+        self._has_header = bool(attributes)
+
+        for sheet_row in rows:
+            if sheet_row:
+                sheet_row = sheet_row + [""] * (len(attributes) - len(sheet_row))
+                self._index(dict(zip(attributes, sheet_row)))
+
+    def _index(self, record: Dict[str, str]):
+        self._students.setdefault(record["username"], []).append(record)
+        self._groups.setdefault(record["Группа"], []).append(record)
+        # Log created before keys were logged has no keys column.
+        if record.get("Ключ"):
+            self._keys[record["Ключ"]] = record
+
+    def add(self, username: str, name: str, group: str, subgroup: str, work: str, key: str = None) -> Dict[str, str]:
+        """
+        Logs student work submission.
+
+        :param username: Student username
+        :type username: :obj:`str`
+
+        :param name: Student name
+        :type name: :obj:`str`
+
+        :param group: Student group
+        :type group: :obj:`str`
+
+        :param subgroup: Student subgroup
+        :type subgroup: :obj:`str`
+
+        :param work: Work link
+        :type work: :obj:`str`
+
+        :param key: Submission write idempotency key
+        :type key: :obj:`str`
+
+        :return: Returns logged submission with its number among student submissions and time.
+        :rtype: :obj:`Dict[str, str]`
+        """
+        with self._lock:
+            self._load()
+            return self._add_record(username, name, group, subgroup, work, key)
+
+    def _add_record(
+        self, username: str, name: str, group: str, subgroup: str, work: str, key: str = None
+    ) -> Dict[str, str]:
+        if key in self._keys:
+            return self._keys[key]
+
+        history = self._students.get(username, [])
+        number = str(len(history) + 1)
+        row = [
+            username,
+            name,
+            group,
+            subgroup,
+            number,
+            work,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            key or "",
+        ]
+        record = dict(zip(self.attributes, row))
+        self._index(record)
+
+        self._pending.append(row)
+        self._schedule_flush()
+
+        return record
+
+    def _schedule_flush(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self._flush_interval, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def get_student_history(self, username: str) -> List[Dict[str, str]]:
+        """
+        Gets student work submissions in their order.
+
+        :param username: Student username
+        :type username: :obj:`str`
+
+        :return: Returns student submissions.
+        :rtype: :obj:`List[Dict[str, str]]`
+        """
+        with self._lock:
+            self._load()
+            return self._get_student_history(username)
+
+    def _get_student_history(self, username: str) -> List[Dict[str, str]]:
+        return list(self._students.get(username, []))
+
+    def get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        """
+        Gets group or subgroup students work submissions in their order.
+
+        :param group: Students group
+        :type group: :obj:`str`
+
+        :param subgroup: Students subgroup. If it isn't defined then all group submissions are given.
+        :type subgroup: :obj:`str`
+
+        :return: Returns students submissions.
+        :rtype: :obj:`List[Dict[str, str]]`
+        """
+        with self._lock:
+            self._load()
+            return self._get_group_history(group, subgroup)
+
+    def _get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        history = self._groups.get(group, [])
+        return [record for record in history if subgroup is None or record["Подгруппа"] == subgroup]
+
+    def _flush_in_background(self):
+        try:
+            self.flush()
+        except Exception as error:
+            self._logger.error(f"Unable to append pending works: {error}")
+            with self._lock:
+                self._schedule_flush()
+
+    def _take_pending(self) -> List[List[str]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if pending and not self._has_header:
+            return [self.attributes] + pending
+        return pending
+
+    def _return_pending(self, rows: List[List[str]]):
+        if not self._has_header:
+            rows = rows[1:]
+        self._pending = rows + self._pending
+
+    def flush(self):
+        """
+        Appends pending submissions by one request.
+
+        Note: Submissions are appended without log lock, so they are logged during appending, and flushes are
+        serialized to keep submissions order. If appending fails then submissions are returned to log.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows = self._take_pending()
+                if not rows:
+                    return
+
+            try:
+                self._handler.append_rows(self._sheet_title, rows)
+            except Exception:
+                with self._lock:
+                    self._return_pending(rows)
+                raise
+
+            with self._lock:
+                self._has_header = True
+
+    def close(self):
+        """
+        Appends pending submissions and stops log timer.
+        """
+        self.flush()
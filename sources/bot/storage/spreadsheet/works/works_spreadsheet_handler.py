@@ -1,21 +1,35 @@
+from typing import Dict, List
+
 from ....exceptions import InvalidSpreadsheetAttributeException
+from ..auth.roster_index import RosterIndex
 from ..spreadsheet_handler import SpreadsheetHandler
+from ..spreadsheet_mirror import SpreadsheetMirror
+from ..write_behind_queue import WriteBehindQueue
 from .base_works_spreadsheet_handler import BaseWorksSpreadsheetHandler
+from .works_log import WorksLog
 
 
 class WorksSpreadsheetHandler(BaseWorksSpreadsheetHandler):
-    def __init__(self, spreadsheet_id: str, file_name: str):
+    def __init__(self, spreadsheet_id: str, file_name: str, mirror_path: str = None, service=None):
         self._attributes = {
             "works": ["username", "ФИО", "Группа", "Подгруппа", "Лабораторная работа"],
         }
-        self._handler = SpreadsheetHandler(file_name, spreadsheet_id)
+        self._handler = SpreadsheetHandler(file_name, spreadsheet_id, service=service)
         self._works_sheet_title = list(self._attributes.keys())[0]
+        self._log = WorksLog(self._handler)
+
+        if mirror_path:
+            self._works = SpreadsheetMirror(self._handler, spreadsheet_id, [self._works_sheet_title], mirror_path)
+        else:
+            self._works = RosterIndex(self._handler, [self._works_sheet_title])
+        self._writer = WriteBehindQueue(self._handler, on_written=self._works.mark_written)
 
     def create_spreadsheet(self, spreadsheet_title="Информация о лабораторных работах") -> None:
         self._handler.create_spreadsheet(spreadsheet_title)
         self._handler.add_row(spreadsheet_title, self._attributes.get("works"))
+        self._works.invalidate()
 
-    def add_student_work(self, username: str, works_data: str, **kwargs) -> None:
+    def add_student_work(self, username: str, works_data: str, idempotency_key: str = None, **kwargs) -> None:
         name = kwargs.get("name")
         group = kwargs.get("group")
         subgroup = kwargs.get("subgroup")
@@ -30,10 +44,68 @@ class WorksSpreadsheetHandler(BaseWorksSpreadsheetHandler):
         elif not work:
             raise InvalidSpreadsheetAttributeException("Invalid work value")
         else:
-            self._handler.add_row(self._works_sheet_title, [username, name, group, work])
+            # Works sheet keeps the last student work, works log keeps all of them.
+            row = [username, name, group, subgroup, work]
+            self._works.put(self._works_sheet_title, dict(zip(self._attributes.get("works"), row)), pending=True)
+            self._writer.add_row(self._works_sheet_title, row)
+            self._log.add(username, name, group, subgroup, work, idempotency_key)
 
     def remove_student(self, username: str) -> bool:
-        return self._handler.remove_row(self._works_sheet_title, username)
+        removed = self._writer.remove_row(self._works_sheet_title, username)
+        self._works.remove(self._works_sheet_title, username)
+        return removed
+
+    @staticmethod
+    def _get_work(data: dict) -> dict:
+        work = {}
+
+        if data:
+            work.update(
+                username=data.get("username"),
+                name=data.get("ФИО"),
+                group=data.get("Группа"),
+                subgroup=data.get("Подгруппа"),
+                work=data.get("Лабораторная работа"),
+            )
+
+        return work
+
+    def get_student_work(self, username: str) -> dict:
+        return self._get_work(self._works.get(self._works_sheet_title, username))
+
+    def get_group_works(self, group: str, subgroup: str = None) -> List[dict]:
+        attributes = {"Группа": group}
+        if subgroup:
+            attributes["Подгруппа"] = subgroup
+
+        return [self._get_work(data) for data in self._works.find(self._works_sheet_title, attributes)]
+
+    @staticmethod
+    def _get_submission(data: dict) -> dict:
+        return {
+            "username": data.get("username"),
+            "name": data.get("ФИО"),
+            "group": data.get("Группа"),
+            "subgroup": data.get("Подгруппа"),
+            "number": data.get("Номер сдачи"),
+            "work": data.get("Лабораторная работа"),
+            "time": data.get("Время"),
+        }
+
+    def get_student_history(self, username: str) -> List[Dict[str, str]]:
+        return [self._get_submission(data) for data in self._log.get_student_history(username)]
+
+    def get_group_history(self, group: str, subgroup: str = None) -> List[Dict[str, str]]:
+        return [self._get_submission(data) for data in self._log.get_group_history(group, subgroup)]
+
+    def flush(self):
+        self._writer.flush()
+        self._log.flush()
+
+    def close(self):
+        self._works.close()
+        self._writer.close()
+        self._log.close()
 
     def accept_storage(self, storage):
         storage.visit_works_handler(self)
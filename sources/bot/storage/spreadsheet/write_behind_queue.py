@@ -0,0 +1,160 @@
+"""
+Spreadsheet rows write-behind queue implementation module.
+"""
+import threading
+from typing import Callable, Dict, List
+
+from ...loggers import LogInstaller
+from .request_scheduler import RequestScheduler
+from .spreadsheet_handler import SpreadsheetHandler
+
+
+class WriteBehindQueue:
+    """
+    Write-behind queue class implementation collects rows upserts and writes them by batches.
+
+    Note: Pending rows with equal first fields in one sheet are coalesced, so only the last one is written.
+    Rows are flushed in flush interval after first pending row or as soon as max rows count is reached. Pending rows
+    are taken under queue lock and written without it, so enqueueing isn't blocked by writing, and writings are
+    serialized by their own lock. Enqueued row is always accepted: if flushing of full queue fails, then row stays
+    pending and is written by the next flush.
+    """
+
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+
+    def __init__(
+        self,
+        handler: SpreadsheetHandler,
+        flush_interval: float = 0.5,
+        max_rows: int = 100,
+        on_written: Callable[[Dict[str, List[str]]], None] = None,
+        timer_factory: Callable[[float, Callable[[], None]], threading.Timer] = threading.Timer,
+    ):
+        self._handler = handler
+        self._flush_interval = flush_interval
+        self._max_rows = max_rows
+        self._on_written = on_written
+        self._timer_factory = timer_factory
+
+        self._pending: Dict[str, Dict[str, List[str]]] = {}
+        self._pending_count = 0
+        self._lock = threading.RLock()
+        self._flush_lock = threading.RLock()
+        self._timer = None
+
+    def add_row(self, sheet_title: str, row: List[str]):
+        """
+        Enqueues row upsert.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param row: Spreadsheet appendable row
+        :type row: :obj:`List[str]`
+        """
+        with self._lock:
+            sheet_rows = self._pending.setdefault(sheet_title, {})
+            if row[0] not in sheet_rows:
+                self._pending_count += 1
+            sheet_rows[row[0]] = row
+
+            is_full = self._pending_count >= self._max_rows
+            if not is_full and self._timer is None:
+                self._start_timer()
+
+        if is_full:
+            try:
+                self.flush()
+            except Exception as error:
+                # Row is already enqueued and failed rows are flushed again by timer.
+                self._logger.error(f"Unable to flush full queue: {error}")
+
+    def _start_timer(self):
+        self._timer = self._timer_factory(self._flush_interval, self._flush_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def remove_row(self, sheet_title: str, first_row_element: str) -> bool:
+        """
+        Removes row from spreadsheet after pending rows writing.
+
+        Note: Pending upsert of such row is discarded.
+
+        :param sheet_title: Sheet title
+        :type sheet_title: :obj:`str`
+
+        :param first_row_element: First field in removable row
+        :type first_row_element: :obj:`str`
+
+        :return: Returns True on success.
+        :rtype: :obj:`bool`
+        """
+        with self._flush_lock:
+            with self._lock:
+                sheet_rows = self._pending.get(sheet_title, {})
+                if sheet_rows.pop(first_row_element, None) is not None:
+                    self._pending_count -= 1
+
+            self.flush()
+            return self._handler.remove_row(sheet_title, first_row_element)
+
+    def _flush_in_background(self):
+        try:
+            # Background writes give way to interactive requests.
+            with RequestScheduler.lane(RequestScheduler.bulk_lane):
+                self.flush()
+        except Exception as error:
+            self._logger.error(f"Unable to flush pending rows: {error}")
+
+    def flush(self):
+        """
+        Writes all pending rows by one reading and one writing request.
+
+        Note: If writing fails then rows are returned to queue and flushed again in flush interval.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+                pending = {sheet_title: rows for sheet_title, rows in self._pending.items() if rows}
+                self._pending = {}
+                self._pending_count = 0
+
+            if not pending:
+                return
+
+            try:
+                self._handler.add_rows({sheet_title: list(rows.values()) for sheet_title, rows in pending.items()})
+            except Exception:
+                self._restore(pending)
+                raise
+
+            if self._on_written is not None:
+                with self._lock:
+                    # Rows enqueued again during writing are still pending.
+                    written = {
+                        sheet_title: [key for key in rows if key not in self._pending.get(sheet_title, {})]
+                        for sheet_title, rows in pending.items()
+                    }
+                self._on_written(written)
+
+    def _restore(self, pending: Dict[str, Dict[str, List[str]]]):
+        with self._lock:
+            for sheet_title, rows in pending.items():
+                sheet_rows = self._pending.setdefault(sheet_title, {})
+                # Rows enqueued during writing are newer than returned ones.
+                for key, row in rows.items():
+                    if key not in sheet_rows:
+                        sheet_rows[key] = row
+                        self._pending_count += 1
+
+            if self._timer is None:
+                self._start_timer()
+
+    def close(self):
+        """
+        Writes pending rows and stops queue timer.
+        """
+        self.flush()
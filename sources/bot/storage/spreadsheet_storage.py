@@ -1,25 +1,82 @@
 """
 Spreadsheet storage implementation module.
 """
-import copy
-from typing import Dict
+import asyncio
+import contextvars
+import functools
+import inspect
+from typing import Dict, List, Tuple
 
+import httplib2
+
+from ..exceptions import SpreadsheetUnavailableException, UnpublishableTestException
+from ..loggers import LogInstaller
 from .base_spreadsheet_storage import BaseSpreadsheetStorage
+from .circuit_breaker import CircuitBreaker
+from .outbox import Outbox
 from .spreadsheet.auth.base_auth_spreadsheet_handler import BaseAuthSpreadsheetHandler
+from .spreadsheet.request_scheduler import RequestScheduler, RequestTimer
 from .spreadsheet.tests.base_tests_spreadsheet_handler import BaseTestsSpreadsheetHandler
 from .spreadsheet.works.base_works_spreadsheet_handler import BaseWorksSpreadsheetHandler
+from .spreadsheet.util.ttl_cache import TtlCache
+from .snapshot import Snapshot
 
 
 class SpreadsheetStorage(BaseSpreadsheetStorage):
     """
     Spreadsheet storage class implementation.
+
+    Note: Usernames not found in authorization spreadsheet are remembered as absent for absent usernames ttl
+    seconds, so waiting for registration users don't cause lookups on every data getting.
+
+    Data updates write to spreadsheets only changed keys. Every key change gets new version, and each version is
+    written at most once, so repeated or outdated updates don't produce spreadsheet requests.
+
+    User data is given as read-only snapshots instead of copies, so its nested values are never changed in place.
+
+    Registrations, works and tests results are acknowledged as soon as they are durable in outbox journal. Outbox
+    is replayed to spreadsheets by batches in background, and every batch is acknowledged after handlers flush.
+    Journaled writes are given their outbox idempotency keys, so writes appending rows don't duplicate them when
+    they are replayed again after crash. Writes failed not by unavailability are moved to outbox dead letters.
+
+    Spreadsheet handlers are called through circuit breaker. While spreadsheet service is unavailable, users and
+    tests are served from the last known ones, and outbox replaying is paused until breaker lets calls pass again.
+    The last known users are kept for known users ttl seconds, and only the most recently seen of them are kept.
     """
 
-    def __init__(self):
+    _logger = LogInstaller.get_default_logger(__name__, LogInstaller.INFO)
+    _journaled_writes = ("_register_user", "_register_work", "_write_answers")
+    _replay_batch_size = 100
+
+    def __init__(
+        self,
+        absent_usernames_ttl: float = 30,
+        absent_usernames_max_count: int = 1024,
+        breaker: CircuitBreaker = None,
+        call_timeout: float = 20,
+        outbox_path: str = None,
+        known_users_ttl: float = 24 * 60 * 60,
+        known_users_max_count: int = 4096,
+    ):
         super().__init__()
         self._auth_handler = None
         self._works_handler = None
         self._tests_handler = None
+        self._absent_usernames = TtlCache(absent_usernames_ttl, absent_usernames_max_count)
+        self._versions: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._written_versions: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+        self._breaker = breaker or CircuitBreaker()
+        self._call_timeout = call_timeout
+        self._outbox = Outbox(outbox_path)
+        self._replay_lock = None
+        self._replay_task = None
+        self._closed = False
+
+        # The last known users by usernames, tests by links and students usernames.
+        self._known_users = TtlCache(known_users_ttl, known_users_max_count)
+        self._known_tests: Dict[str, Tuple[str, list]] = {}
+        self._known_students: List[str] = []
 
     def resolve_address(self, chat, user):
         chat_id, user_id = map(str, self.check_address(chat=chat, user=user))
@@ -34,8 +91,170 @@ class SpreadsheetStorage(BaseSpreadsheetStorage):
     async def wait_closed(self):
         pass
 
+    async def _replay_now(self):
+        # Running replay is waited, so outbox isn't replayed concurrently.
+        if self._replay_lock is None:
+            self._replay_lock = asyncio.Lock()
+
+        async with self._replay_lock:
+            await self._replay_outbox()
+
+    async def flush(self):
+        await self._replay_now()
+
+        for handler in (self._auth_handler, self._works_handler, self._tests_handler):
+            if handler is not None:
+                await self._run(handler.flush)
+
     async def close(self):
+        if self._closed:
+            return
+
+        # Not replayed writes are kept in outbox until next start.
+        self._closed = True
+        await self._replay_now()
+
+        for handler in (self._auth_handler, self._works_handler, self._tests_handler):
+            if handler is not None:
+                await self._run(handler.close)
+        self._outbox.close()
+
         self.data.clear()
+        self._versions.clear()
+        self._written_versions.clear()
+
+    @staticmethod
+    async def _run(method, *args, **kwargs):
+        """
+        Calls spreadsheet handler method without blocking event loop.
+
+        Note: Coroutine methods of asynchronous handlers are awaited, blocking methods of synchronous handlers are
+        run in default executor with context of caller.
+
+        :param method: Spreadsheet handler method
+        :type method: :obj:`Callable`
+
+        :return: Returns method result.
+        :rtype: :obj:`Any`
+        """
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+
+        loop = asyncio.get_event_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, method, *args, **kwargs))
+
+    @staticmethod
+    def _is_unavailability(error: Exception) -> bool:
+        if isinstance(error, (asyncio.TimeoutError, OSError, httplib2.HttpLib2Error)):
+            return True
+
+        # Google API client errors keep status in response, asynchronous handler errors keep it in themselves.
+        status = getattr(getattr(error, "resp", None), "status", None) or getattr(error, "status", None)
+        return isinstance(status, int) and (status == 429 or status >= 500)
+
+    async def _call(self, method, *args, **kwargs):
+        """
+        Calls spreadsheet handler method through circuit breaker without blocking event loop.
+
+        Note: Call is waited until its service time exceeds call timeout seconds, time spent by its requests in
+        scheduler queue and retry backoff isn't counted, so throttling doesn't look like slow service. Timed out call
+        is cancelled, so it doesn't make further requests.
+
+        :param method: Spreadsheet handler method
+        :type method: :obj:`Callable`
+
+        :raises SpreadsheetUnavailableException: If breaker is open, or call failed by spreadsheet service
+            unavailability or timeout.
+
+        :return: Returns method result.
+        :rtype: :obj:`Any`
+        """
+        if not self._breaker.allow():
+            raise SpreadsheetUnavailableException("Spreadsheet service is unavailable")
+
+        timer = RequestTimer()
+        with RequestScheduler.timing(timer):
+            call = asyncio.ensure_future(self._run(method, *args, **kwargs))
+        try:
+            result = await self._wait_call(call, timer)
+        except asyncio.CancelledError:
+            # Cancelled trial call shows nothing about service, so another trial call is let.
+            self._breaker.record_cancelled()
+            raise
+        except Exception as error:
+            if not self._is_unavailability(error):
+                self._breaker.record_success(timer.get_service_time())
+                raise
+
+            self._breaker.record_failure()
+            raise SpreadsheetUnavailableException(f"Spreadsheet service is unavailable: {error!r}") from error
+
+        self._breaker.record_success(timer.get_service_time())
+        self._schedule_replay()
+
+        return result
+
+    async def _wait_call(self, call: asyncio.Future, timer: RequestTimer):
+        try:
+            while True:
+                timeout = self._call_timeout - timer.get_service_time()
+                if timeout <= 0:
+                    raise asyncio.TimeoutError()
+
+                done, _ = await asyncio.wait({call}, timeout=timeout)
+                if done:
+                    return call.result()
+        except BaseException:
+            timer.cancel()
+            call.cancel()
+            raise
+
+    def get_dead_writes(self) -> List[Tuple[str, str, list, str]]:
+        """
+        Gets journaled writes, which failed not by spreadsheet service unavailability and weren't made.
+
+        :return: Returns writes idempotency keys, operation names, arguments and errors.
+        :rtype: :obj:`List[Tuple[str, str, list, str]]`
+        """
+        return self._outbox.get_dead_letters()
+
+    def _schedule_replay(self):
+        if len(self._outbox) and not self._closed and (self._replay_task is None or self._replay_task.done()):
+            self._replay_task = asyncio.ensure_future(self._replay_now())
+
+    async def _replay_outbox(self):
+        """
+        Makes outbox writes in their order by batches until outbox is empty or spreadsheet service is unavailable.
+
+        Note: Batch is acknowledged after spreadsheet handlers flush their pending rows. Writes are upserts or are
+        deduplicated by their idempotency keys, so writes made but not acknowledged before crash are made again
+        harmlessly. Write which fails not by unavailability would fail forever, so it is moved to dead letters.
+        """
+        try:
+            while len(self._outbox):
+                made_keys = []
+                for key, operation, args in self._outbox.get_pending(self._replay_batch_size):
+                    try:
+                        await getattr(self, operation)(*args, idempotency_key=key)
+                    except SpreadsheetUnavailableException:
+                        raise
+                    except Exception as error:
+                        await self._run(self._outbox.bury, key, repr(error))
+                        self._logger.error(
+                            f"Unable to replay {operation} write {key}, it is moved to dead letters "
+                            f"({len(self._outbox.get_dead_letters())} in total): {error!r}"
+                        )
+                        continue
+                    made_keys.append(key)
+
+                for handler in (self._auth_handler, self._works_handler, self._tests_handler):
+                    if handler is not None:
+                        await self._call(handler.flush)
+                await self._run(self._outbox.ack, made_keys)
+        except SpreadsheetUnavailableException as error:
+            self._logger.warning(f"Outbox replaying is paused with {len(self._outbox)} writes: {error}")
+            asyncio.get_event_loop().call_later(self._breaker.reset_timeout, self._schedule_replay)
 
     async def get_data(self, *, chat=None, user=None, default=None) -> Dict:
         chat, user = self.resolve_address(chat=chat, user=user)
@@ -45,23 +264,28 @@ class SpreadsheetStorage(BaseSpreadsheetStorage):
     async def _get_table_data(self, user_data):
         await self._upload_register_data(user_data)
 
-        return copy.deepcopy(user_data)
+        return {key: Snapshot.freeze(value) for key, value in user_data.items()}
 
     async def _upload_register_data(self, user_data):
         auth_handler: BaseAuthSpreadsheetHandler = self._auth_handler
         username = user_data.get("username")
         auth_data = user_data.get("auth")
 
-        if auth_data == {}:
-            student = auth_handler.get_student_by_username(username)
-            teacher = auth_handler.get_teacher_by_username(username)
-
-            if student != {}:
-                user_data["auth"] = student
-                user_data["type"] = "student"
-            elif teacher != {}:
-                user_data["auth"] = teacher
-                user_data["type"] = "teacher"
+        if auth_data == {} and not self._absent_usernames.get(username, False):
+            try:
+                user_type, user = await self._call(auth_handler.find_user, username)
+            except SpreadsheetUnavailableException:
+                # Unknown user isn't remembered as absent, because roster isn't seen.
+                user_type, user = self._known_users.get(username, (None, {}))
+                if user_type is None:
+                    return
+
+            if user_type is not None:
+                self._known_users.put(username, (user_type, user))
+                user_data["auth"] = user
+                user_data["type"] = user_type
+            else:
+                self._absent_usernames.put(username, True)
 
     async def update_data(self, *, chat=None, user=None, data=None, **kwargs):
         if data is None:
@@ -69,67 +293,157 @@ class SpreadsheetStorage(BaseSpreadsheetStorage):
 
         chat, user = self.resolve_address(chat=chat, user=user)
         user_data = self.data[chat][user]["data"]
-        user_data.update(data, **kwargs)
+        changes = {key: Snapshot.unwrap(value) for key, value in dict(data, **kwargs).items()}
+        changed_keys = [key for key, value in changes.items() if user_data.get(key) != value]
+        user_data.update(changes)
 
         if user_data.get("type") is None:
             user_data["type"] = "student"
         if user_data.get("username") is None and kwargs.get("username"):
             user_data["username"] = kwargs.get("username")
 
-        await self._update_table(user_data)
+        versions = self._versions.setdefault((chat, user), {})
+        for key in changed_keys:
+            versions[key] = versions.get(key, 0) + 1
+
+        await self._update_table((chat, user), user_data, {key: versions[key] for key in changed_keys})
 
-    async def _update_table(self, user_data):
+    async def _update_table(self, address: Tuple[str, str], user_data, changed_versions: Dict[str, int]):
         username = user_data.get("username")
         user_type = user_data.get("type")
         auth_data = user_data.get("auth")
         works_data = user_data.get("works")
         tests_data = user_data.get("tests")
 
-        if auth_data is not None:
+        if "auth" in changed_versions and auth_data is not None:
             if auth_data.get("name") and auth_data.get("group") and auth_data.get("subgroup"):
-                await self._register_user(username, user_type, auth_data)
-        if works_data is not None:
+                await self._write_once(
+                    address, "auth", changed_versions["auth"], self._register_user, username, user_type, auth_data
+                )
+        if "works" in changed_versions and works_data is not None:
             if auth_data.get("name") and auth_data.get("group") and auth_data.get("subgroup"):
-                await self._register_work(username, works_data, auth_data)
+                await self._write_once(
+                    address, "works", changed_versions["works"], self._register_work, username, works_data, auth_data
+                )
 
-        if tests_data is not None:
+        if "tests" in changed_versions and tests_data is not None:
             if user_type == "teacher" and tests_data.get("test_link"):
-                await self._receive_test(tests_data, tests_data.get("test_link"))
+                await self._write_once(
+                    address,
+                    "tests",
+                    changed_versions["tests"],
+                    self._receive_test,
+                    user_data,
+                    tests_data.get("test_link"),
+                )
             if user_type == "student" and tests_data.get("is_finished"):
-                await self._write_answers(tests_data, auth_data)
-
-    async def _write_answers(self, tests_data, auth_data):
+                # Only written fields are journaled, so loaded test questions aren't kept in outbox.
+                await self._write_once(
+                    address,
+                    "tests",
+                    changed_versions["tests"],
+                    self._write_answers,
+                    {key: tests_data.get(key) for key in ("test_name", "answers", "spreadsheet_id")},
+                    {"name": auth_data.get("name")},
+                )
+
+    async def _write_once(self, address: Tuple[str, str], key: str, version: int, write, *args):
+        """
+        Writes user data key version to spreadsheet if it isn't written and isn't outdated yet.
+
+        Note: Journaled writes are appended to outbox and are made by its replaying.
+
+        :param address: Chat and user ids
+        :type address: :obj:`Tuple[str, str]`
+
+        :param key: User data key
+        :type key: :obj:`str`
+
+        :param version: User data key version
+        :type version: :obj:`int`
+
+        :param write: Spreadsheet writing coroutine function
+        :type write: :obj:`Callable`
+        """
+        written_versions = self._written_versions.setdefault(address, {})
+        written_version = written_versions.get(key, 0)
+
+        # Newer version is written by later update, so outdated data isn't sent to spreadsheet.
+        if written_version >= version or self._versions.get(address, {}).get(key, 0) > version:
+            return
+
+        written_versions[key] = version
+        try:
+            if write.__name__ in self._journaled_writes:
+                await self._run(self._outbox.put, write.__name__, list(args))
+                self._schedule_replay()
+            else:
+                await write(*args)
+        except Exception:
+            if written_versions.get(key) == version:
+                written_versions[key] = written_version
+            raise
+
+    async def _write_answers(self, tests_data, auth_data, idempotency_key: str = None):
         tests_handler: BaseTestsSpreadsheetHandler = self._tests_handler
-        tests_handler.add_result_to_worksheet(tests_data["test_name"], auth_data["name"], tests_data["answers"])
-
-    async def _receive_test(self, tests_data, test_link: str):
+        await self._call(
+            tests_handler.add_result_to_worksheet,
+            tests_data["test_name"],
+            auth_data["name"],
+            tests_data["answers"],
+            tests_data.get("spreadsheet_id"),
+        )
+
+    async def _receive_test(self, user_data, test_link: str):
         tests_handler: BaseTestsSpreadsheetHandler = self._tests_handler
         auth_handler: BaseAuthSpreadsheetHandler = self._auth_handler
-        test_name, test = tests_handler.load_test_by_link(test_link)
+        tests_data = user_data["tests"]
+        try:
+            test_name, test = await self._call(tests_handler.load_test_by_link, test_link)
+            self._known_tests[test_link] = (test_name, test)
+        except SpreadsheetUnavailableException:
+            # Unknown test is given empty like test which can't be loaded.
+            test_name, test = self._known_tests.get(test_link, ("", []))
+        except UnpublishableTestException as error:
+            self._logger.warning(str(error))
+            if user_data.get("tests") is tests_data:
+                user_data["tests"] = dict(tests_data, test=[], test_name="", students=[], error=str(error))
+            return
+
         if tests_data.get("test") is None:
-            tests_data["test"] = test
-            tests_data["test_name"] = test_name
             # needs to be changed to ids instead of usernames
-            tests_data["students"] = auth_handler.get_student_usernames()
-
-    async def _register_work(self, username, works_data, auth_data):
+            try:
+                students = await self._call(auth_handler.get_student_usernames)
+                self._known_students = students
+            except SpreadsheetUnavailableException:
+                students = self._known_students
+            if user_data.get("tests") is tests_data:
+                user_data["tests"] = dict(tests_data, test=test, test_name=test_name, students=students)
+
+    async def _register_work(self, username, works_data, auth_data, idempotency_key: str = None):
         works_handler: BaseWorksSpreadsheetHandler = self._works_handler
-        works_handler.add_student_work(username, works_data, **auth_data)
+        await self._call(
+            works_handler.add_student_work, username, works_data, idempotency_key=idempotency_key, **auth_data
+        )
 
-    async def _register_user(self, username, user_type, auth_data):
+    async def _register_user(self, username, user_type, auth_data, idempotency_key: str = None):
         auth_handler: BaseAuthSpreadsheetHandler = self._auth_handler
+        self._absent_usernames.invalidate(username)
+        self._known_users.put(username, (user_type, auth_data))
 
         if user_type == "student":
-            if auth_handler.get_student_by_username(username) == {}:
-                auth_handler.add_student(username, **auth_data)
+            if await self._call(auth_handler.get_student_by_username, username) == {}:
+                await self._call(auth_handler.add_student, username, **auth_data)
         elif user_type == "teacher":
-            if auth_handler.get_teacher_by_username(username) == {}:
-                auth_handler.add_student(username, **auth_data)
+            if await self._call(auth_handler.get_teacher_by_username, username) == {}:
+                await self._call(auth_handler.add_teacher, username, **auth_data)
 
     def _cleanup(self, chat, user):
         chat, user = self.resolve_address(chat=chat, user=user)
         if self.data[chat][user] == {"state": None, "data": {"type": None, "auth": {}}, "bucket": {}}:
             del self.data[chat][user]
+            self._versions.pop((chat, user), None)
+            self._written_versions.pop((chat, user), None)
         if not self.data[chat]:
             del self.data[chat]
 
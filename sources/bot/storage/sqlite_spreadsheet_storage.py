@@ -0,0 +1,117 @@
+"""
+SQLite persistent spreadsheet storage implementation module.
+"""
+import json
+import sqlite3
+
+from .snapshot import Snapshot
+from .spreadsheet_storage import SpreadsheetStorage
+
+
+class SqliteSpreadsheetStorage(SpreadsheetStorage):
+    """
+    Spreadsheet storage class implementation, which keeps users states, data and buckets in SQLite database.
+
+    Note: Database is opened in WAL mode. Users records are read lazily on their first access after restart and are
+    written on every their change, so started registrations, tests and found users survive restart without
+    spreadsheet lookups.
+    """
+
+    def __init__(self, database_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self._database_path = database_path
+        self._connection = sqlite3.connect(database_path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "chat TEXT NOT NULL, user TEXT NOT NULL, state TEXT, data TEXT NOT NULL, bucket TEXT NOT NULL, "
+            "PRIMARY KEY (chat, user))"
+        )
+
+    def resolve_address(self, chat, user):
+        chat_id, user_id = map(str, self.check_address(chat=chat, user=user))
+
+        if user_id not in self.data.get(chat_id, {}):
+            record = self._load_record(chat_id, user_id)
+            if record is not None:
+                self.data.setdefault(chat_id, {})[user_id] = record
+
+        return super().resolve_address(chat_id, user_id)
+
+    def _load_record(self, chat: str, user: str):
+        row = self._connection.execute(
+            "SELECT state, data, bucket FROM records WHERE chat = ? AND user = ?", (chat, user)
+        ).fetchone()
+        if row is None:
+            return None
+
+        state, data, bucket = row
+        return {"state": state, "data": json.loads(data), "bucket": json.loads(bucket)}
+
+    def _save_record(self, chat, user):
+        """
+        Writes user record to database or removes it if record was cleaned up.
+
+        :param chat: Chat id
+        :type chat: :obj:`str`
+
+        :param user: User id
+        :type user: :obj:`str`
+        """
+        chat, user = map(str, self.check_address(chat=chat, user=user))
+        record = self.data.get(chat, {}).get(user)
+
+        if record is None:
+            self._connection.execute("DELETE FROM records WHERE chat = ? AND user = ?", (chat, user))
+        else:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO records (chat, user, state, data, bucket) VALUES (?, ?, ?, ?, ?)",
+                (
+                    chat,
+                    user,
+                    record["state"],
+                    json.dumps(record["data"], ensure_ascii=False, default=Snapshot.unwrap),
+                    json.dumps(record["bucket"], ensure_ascii=False, default=Snapshot.unwrap),
+                ),
+            )
+
+    async def close(self):
+        await super().close()
+        self._connection.close()
+
+    async def get_data(self, *, chat=None, user=None, default=None):
+        chat, user = self.resolve_address(chat=chat, user=user)
+        auth_data = self.data[chat][user]["data"].get("auth")
+
+        data = await super().get_data(chat=chat, user=user, default=default)
+        if self.data[chat][user]["data"].get("auth") is not auth_data:
+            self._save_record(chat, user)
+
+        return data
+
+    async def update_data(self, *, chat=None, user=None, data=None, **kwargs):
+        try:
+            await super().update_data(chat=chat, user=user, data=data, **kwargs)
+        finally:
+            self._save_record(chat, user)
+
+    async def set_state(self, *, chat=None, user=None, state=None):
+        await super().set_state(chat=chat, user=user, state=state)
+        self._save_record(chat, user)
+
+    async def set_data(self, *, chat=None, user=None, data=None):
+        await super().set_data(chat=chat, user=user, data=data)
+        self._save_record(chat, user)
+
+    async def set_bucket(self, *, chat=None, user=None, bucket=None):
+        await super().set_bucket(chat=chat, user=user, bucket=bucket)
+        self._save_record(chat, user)
+
+    async def update_bucket(self, *, chat=None, user=None, bucket=None, **kwargs):
+        await super().update_bucket(chat=chat, user=user, bucket=bucket, **kwargs)
+        self._save_record(chat, user)
+
+    async def reset_state(self, *, chat=None, user=None, with_data=True):
+        await super().reset_state(chat=chat, user=user, with_data=with_data)
+        self._save_record(chat, user)
@@ -0,0 +1,67 @@
+import time
+import unittest
+
+from ..circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=2, latency_threshold=1, reset_timeout=0.1)
+
+    def open_breaker(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+    def test_open_after_failures(self):
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.closed)
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.open)
+        self.assertFalse(self.breaker.allow())
+
+    def test_open_after_slow_calls(self):
+        self.breaker.record_success(2)
+        self.breaker.record_success(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.open)
+
+    def test_reset_failures_by_success(self):
+        self.breaker.record_failure()
+        self.breaker.record_success(0)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.closed)
+
+    def test_close_after_trial_success(self):
+        self.open_breaker()
+        time.sleep(0.15)
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.half_open)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success(0)
+        self.assertEqual(self.breaker.state, CircuitBreaker.closed)
+        self.assertTrue(self.breaker.allow())
+
+    def test_let_trial_after_cancelled_trial(self):
+        self.open_breaker()
+        time.sleep(0.15)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_cancelled()
+        self.assertTrue(self.breaker.allow())
+
+    def test_open_after_trial_failure(self):
+        self.open_breaker()
+        time.sleep(0.15)
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.open)
+        self.assertFalse(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from ..snapshot import Snapshot
+from .storage_test import TestStorage
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_freeze_nested_values(self):
+        value = {"answers": [{"Вопрос": "question", "is_correct": True}]}
+        snapshot = Snapshot.freeze(value)
+
+        with self.assertRaises(TypeError):
+            snapshot["answers"] = []
+        with self.assertRaises(TypeError):
+            snapshot["answers"][0]["is_correct"] = False
+
+        self.assertEqual(snapshot, value)
+        self.assertIs(Snapshot.unwrap(snapshot["answers"]), value["answers"])
+
+    def test_unwrap_nested_views(self):
+        value = {"tests": {"answers": [{"Вопрос": "question"}]}, "auth": {"name": "name1"}}
+        snapshot = Snapshot.freeze(value)
+
+        unwrapped = Snapshot.unwrap(dict(snapshot, works=[snapshot["tests"]]))
+        self.assertIs(unwrapped["tests"], value["tests"])
+        self.assertIs(unwrapped["works"][0], value["tests"])
+        self.assertIs(Snapshot.unwrap(value), value)
+
+
+class TestStorageSnapshots(TestStorage):
+    async def test_keep_snapshot_after_update(self):
+        storage = self.create_storage()
+        await storage.update_data(chat=1, user=1, username="student1", tests={"answers": [], "is_finished": False})
+
+        data = await storage.get_data(chat=1, user=1)
+        answers = list(data["tests"]["answers"]) + [{"Вопрос": "question", "is_correct": True}]
+        await storage.update_data(chat=1, user=1, tests=dict(data["tests"], answers=answers))
+
+        self.assertEqual(data["tests"]["answers"], [])
+        self.assertEqual((await storage.get_data(chat=1, user=1))["tests"]["answers"], answers)
+
+    async def test_store_copied_snapshot_values(self):
+        storage = self.create_storage()
+        await storage.update_data(chat=1, user=1, username="student1", tests={"answers": [], "is_finished": False})
+
+        data = await storage.get_data(chat=1, user=1)
+        await storage.update_data(chat=1, user=1, tests=dict(data["tests"], is_finished=True))
+
+        tests = storage.data["1"]["1"]["data"]["tests"]
+        self.assertIs(type(tests["answers"]), list)
+
+
+if __name__ == "__main__":
+    unittest.main()
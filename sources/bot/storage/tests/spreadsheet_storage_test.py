@@ -0,0 +1,235 @@
+import asyncio
+import time
+import unittest
+
+from ...exceptions import SpreadsheetUnavailableException
+from ..circuit_breaker import CircuitBreaker
+from ..spreadsheet.auth.async_auth_spreadsheet_handler import AsyncAuthSpreadsheetHandler
+from ..spreadsheet.request_scheduler import RequestScheduler
+from ..spreadsheet.tests.async_tests_spreadsheet_handler import AsyncTestsSpreadsheetHandler
+from ..spreadsheet.works.async_works_spreadsheet_handler import AsyncWorksSpreadsheetHandler
+from ..spreadsheet_storage import SpreadsheetStorage
+from .storage_test import TestStorage
+
+
+class Request:
+    def __init__(self):
+        self.count = 0
+
+    def execute(self) -> dict:
+        self.count += 1
+        return {}
+
+    async def send(self) -> dict:
+        return self.execute()
+
+
+class TestSpreadsheetStorage(TestStorage):
+    auth = {"name": "name2", "group": "group1", "subgroup": "1"}
+
+    async def test_write_only_changed_keys(self):
+        storage = self.create_storage()
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth)
+        await storage.update_data(chat=1, user=1, works="link1")
+        await storage.flush()
+
+        requests_count = sum(self.service.requests_count.values())
+        await storage.update_data(chat=1, user=1, username="student2", auth=dict(self.auth), works="link1", step=1)
+        await storage.flush()
+
+        self.assertEqual(sum(self.service.requests_count.values()), requests_count)
+        self.assertEqual(
+            [row[0] for row in self.service.get_values(self.auth_id, "Студенты")], ["username", "student1", "student2"]
+        )
+        self.assertEqual(len(self.service.get_values(self.works_id, "works")), 2)
+
+    async def test_write_by_async_handlers(self):
+        storage = SpreadsheetStorage()
+        AsyncAuthSpreadsheetHandler(self.auth_id, "", service=self.service).accept_storage(storage)
+        AsyncWorksSpreadsheetHandler(self.works_id, "", service=self.service).accept_storage(storage)
+        AsyncTestsSpreadsheetHandler("", service=self.service).accept_storage(storage)
+        self.storages.append(storage)
+
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth)
+        await storage.update_data(chat=1, user=1, works="link1")
+        await storage.flush()
+
+        self.assertEqual(
+            [row[0] for row in self.service.get_values(self.auth_id, "Студенты")], ["username", "student1", "student2"]
+        )
+        self.assertEqual(self.service.get_values(self.works_id, "works")[-1][-1], "link1")
+        self.assertEqual(len(self.service.get_values(self.works_id, "works_log")), 2)
+
+    async def test_replay_outbox_after_restart(self):
+        outbox_path = self.get_path("outbox.jsonl")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        storage = self.create_storage(breaker=breaker, outbox_path=outbox_path)
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        await storage.update_data(chat=1, user=1, works="link1")
+
+        # Storage isn't closed, as if process crashed.
+        self.storages.remove(storage)
+        storage = self.create_storage(outbox_path=outbox_path)
+        await storage.flush()
+
+        self.assertEqual(self.service.get_values(self.auth_id, "Студенты")[-1][:2], ["student2", "name2"])
+        self.assertEqual(self.service.get_values(self.works_id, "works")[-1][-1], "link1")
+        self.assertEqual(len(self.service.get_values(self.works_id, "works_log")), 2)
+
+    async def test_not_duplicate_replayed_writes(self):
+        outbox_path = self.get_path("outbox.jsonl")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        storage = self.create_storage(breaker=breaker, outbox_path=outbox_path)
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        await storage.update_data(chat=1, user=1, works="link1")
+        with open(outbox_path, encoding="utf-8") as outbox_file:
+            journal = outbox_file.read()
+
+        breaker.record_success(0)
+        await storage.flush()
+        await storage.update_data(chat=1, user=1, works="link2")
+        await self.close_storage(storage)
+
+        # Writes were made, but crash happened before their acknowledgement.
+        with open(outbox_path, "w", encoding="utf-8") as outbox_file:
+            outbox_file.write(journal)
+        storage = self.create_storage(outbox_path=outbox_path)
+        await storage.flush()
+
+        rows = self.service.get_values(self.works_id, "works_log")
+        self.assertEqual([row[5] for row in rows[1:]], ["link1", "link2"])
+
+    async def test_write_answers_to_test_spreadsheet_after_restart(self):
+        outbox_path = self.get_path("outbox.jsonl")
+        test_id = self.service.add_spreadsheet({"test1": [["Вопрос", "Ответ"], ["question", "answer"]]})
+        storage = self.create_storage(outbox_path=outbox_path)
+        storage._tests_handler.load_test_by_link(f"https://docs.google.com/spreadsheets/d/{test_id}/edit")
+        await self.close_storage(storage)
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        storage = self.create_storage(breaker=breaker, outbox_path=outbox_path)
+        tests = {
+            "test_name": "test1",
+            "spreadsheet_id": test_id,
+            "answers": [{"Вопрос": "question", "is_correct": True}],
+        }
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        await storage.update_data(chat=1, user=1, tests=dict(tests, is_finished=True, test=[{"Вопрос": "question"}]))
+        self.assertEqual(storage._outbox.get_pending(10)[-1][1:], ("_write_answers", [tests, {"name": "name2"}]))
+        self.storages.remove(storage)
+
+        storage = self.create_storage(outbox_path=outbox_path)
+        await storage.flush()
+
+        self.assertEqual(self.service.get_values(test_id, "test1_result")[-1][0], "name2")
+
+    async def test_reject_unpublishable_test(self):
+        test_id = self.service.add_spreadsheet({"test1": [["Вопрос", "Ответ"]] + [["question", "answer"]] * 4096})
+        storage = self.create_storage()
+        await storage.update_data(chat=1, user=1, username="teacher1", type="teacher")
+        await storage.update_data(
+            chat=1, user=1, tests={"test_link": f"https://docs.google.com/spreadsheets/d/{test_id}/edit"}
+        )
+
+        tests = (await storage.get_data(chat=1, user=1))["tests"]
+        self.assertIn("error", tests)
+        self.assertEqual((tests["test_name"], tests["test"], tests["students"]), ("", [], []))
+
+    async def test_move_failed_writes_to_dead_letters(self):
+        outbox_path = self.get_path("outbox.jsonl")
+        storage = self.create_storage(outbox_path=outbox_path)
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        storage._outbox.put("_register_work", ["student2", "", self.auth])
+        await storage.flush()
+        await self.close_storage(storage)
+
+        storage = self.create_storage(outbox_path=outbox_path)
+        self.assertEqual(len(storage._outbox), 0)
+        self.assertEqual(
+            [write[1:3] for write in storage.get_dead_writes()], [("_register_work", ["student2", "", self.auth])]
+        )
+        self.assertEqual(self.service.get_values(self.auth_id, "Студенты")[-1][0], "student2")
+
+    async def test_close_once(self):
+        outbox_path = self.get_path("outbox.jsonl")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        storage = self.create_storage(breaker=breaker, outbox_path=outbox_path, mirror_path=self.get_path("mirror.db"))
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        await storage.close()
+        # Closed handlers aren't called again, even if spreadsheet service is available.
+        breaker.record_success(0)
+        await self.close_storage(storage)
+
+        self.assertEqual(storage.get_dead_writes(), [])
+        storage = self.create_storage(outbox_path=outbox_path)
+        self.assertEqual(len(storage._outbox), 1)
+
+    async def test_wait_replay_on_close(self):
+        storage = self.create_storage()
+        self.service.latency = 0.1
+        await storage.update_data(chat=1, user=1, username="student2", auth=self.auth, type="student")
+        await asyncio.sleep(0)
+        self.assertTrue(storage._replay_lock.locked())
+
+        await self.close_storage(storage)
+        self.assertEqual(self.service.get_values(self.auth_id, "Студенты")[-1][0], "student2")
+
+
+class TestSpreadsheetStorageCalls(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=1)
+        self.storage = SpreadsheetStorage(breaker=self.breaker, call_timeout=0.2)
+        self.request = Request()
+
+    async def test_not_count_queue_time(self):
+        scheduler = RequestScheduler(read_quota=1, period=0.5)
+        for _ in range(3):
+            await self.storage._call(scheduler.execute, self.request, RequestScheduler.read)
+
+        self.assertEqual(self.request.count, 3)
+        self.assertEqual(scheduler.counters["queued"], 2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.closed)
+
+    async def test_not_count_async_queue_time(self):
+        scheduler = RequestScheduler(read_quota=1, period=0.5)
+        for _ in range(3):
+            await self.storage._call(scheduler.execute_async, self.request.send, RequestScheduler.read)
+
+        self.assertEqual(self.request.count, 3)
+        self.assertEqual(self.breaker.state, CircuitBreaker.closed)
+
+    async def test_cancel_timed_out_call(self):
+        scheduler = RequestScheduler()
+
+        def write():
+            time.sleep(0.3)
+            scheduler.execute(self.request, RequestScheduler.write)
+
+        with self.assertRaises(SpreadsheetUnavailableException):
+            await self.storage._call(write)
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(self.request.count, 0)
+        self.assertEqual(self.breaker.state, CircuitBreaker.open)
+
+    async def test_let_trial_after_cancelled_call(self):
+        self.breaker.reset_timeout = 0
+        self.breaker.record_failure()
+        call = asyncio.ensure_future(self.storage._call(asyncio.sleep, 1))
+        await asyncio.sleep(0.05)
+        self.assertFalse(self.breaker.allow())
+
+        call.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await call
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.half_open)
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
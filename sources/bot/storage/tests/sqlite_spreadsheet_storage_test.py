@@ -0,0 +1,33 @@
+import unittest
+
+from ..sqlite_spreadsheet_storage import SqliteSpreadsheetStorage
+from .storage_test import TestStorage
+
+
+class TestSqliteSpreadsheetStorage(TestStorage):
+    async def test_restore_session_after_restart(self):
+        database_path = self.get_path("storage.db")
+        storage = self.create_storage(SqliteSpreadsheetStorage, database_path=database_path)
+        await storage.set_state(chat=1, user=1, state="registration")
+        await storage.update_data(chat=1, user=1, username="student1", tests={"answers": [1, 2]})
+        await self.close_storage(storage)
+
+        storage = self.create_storage(SqliteSpreadsheetStorage, database_path=database_path)
+        self.assertEqual(await storage.get_state(chat=1, user=1), "registration")
+        data = await storage.get_data(chat=1, user=1)
+        self.assertEqual(data["username"], "student1")
+        self.assertEqual(data["tests"], {"answers": [1, 2]})
+
+    async def test_forget_session_after_reset(self):
+        database_path = self.get_path("storage.db")
+        storage = self.create_storage(SqliteSpreadsheetStorage, database_path=database_path)
+        await storage.set_state(chat=1, user=1, state="registration")
+        await storage.reset_state(chat=1, user=1)
+        await self.close_storage(storage)
+
+        storage = self.create_storage(SqliteSpreadsheetStorage, database_path=database_path)
+        self.assertIsNone(await storage.get_state(chat=1, user=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from ..spreadsheet.auth.auth_spreadsheet_handler import AuthSpreadsheetHandler
+from ..spreadsheet.emulator.fake_sheets_service import FakeSheetsService
+from ..spreadsheet.tests.tests_spreadsheet_handler import TestsSpreadsheetHandler
+from ..spreadsheet.works.works_spreadsheet_handler import WorksSpreadsheetHandler
+from ..spreadsheet_storage import SpreadsheetStorage
+
+
+class TestStorage(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Loaded tests are saved to surveys directory of working directory.
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs("surveys")
+
+        self.service = FakeSheetsService()
+        self.auth_id = self.service.add_spreadsheet(
+            {
+                "Студенты": [["username", "ФИО", "Группа", "Подгруппа"], ["student1", "name1", "group1", "1"]],
+                "Преподаватели": [["username", "ФИО"], ["teacher1", "name1"]],
+            }
+        )
+        self.works_id = self.service.add_spreadsheet(
+            {"works": [["username", "ФИО", "Группа", "Подгруппа", "Лабораторная работа"]]}
+        )
+        self.storages = []
+
+    async def asyncTearDown(self):
+        for storage in self.storages:
+            await storage.close()
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+
+    def get_path(self, file_name: str) -> str:
+        return os.path.join(self.directory.name, file_name)
+
+    def create_storage(self, storage_class=SpreadsheetStorage, mirror_path: str = None, **kwargs):
+        storage = storage_class(**kwargs)
+        AuthSpreadsheetHandler(self.auth_id, "", mirror_path, service=self.service).accept_storage(storage)
+        WorksSpreadsheetHandler(self.works_id, "", mirror_path, service=self.service).accept_storage(storage)
+        TestsSpreadsheetHandler("", service=self.service).accept_storage(storage)
+        self.storages.append(storage)
+        return storage
+
+    async def close_storage(self, storage):
+        self.storages.remove(storage)
+        await storage.close()
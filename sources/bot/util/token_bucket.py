@@ -0,0 +1,44 @@
+"""
+Token bucket implementation module.
+"""
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket class implementation limits requests rate by quota per period.
+
+    Note: Bucket is full at start, so quota may be spent by burst, and then it is refilled evenly. Bucket isn't thread
+    safe, its owner guards it.
+    """
+
+    def __init__(self, quota: int, period: float = 60):
+        self._capacity = quota
+        self._rate = quota / period
+        self._tokens = float(quota)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def take(self) -> float:
+        """
+        Takes token if it is available.
+
+        :return: Returns 0 if token is taken, otherwise seconds to wait for next token.
+        :rtype: :obj:`float`
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self._rate
+
+    def drain(self) -> None:
+        """
+        Spends all available tokens, for example when service reports exceeded quota.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0)
@@ -0,0 +1,76 @@
+"""
+Roster module to import students and teachers to authorization spreadsheet from CSV file and to export them.
+
+Usage: `python3 -m sources.roster import students students.csv` or `python3 -m sources.roster export teachers -`.
+CSV files have header with sheet fields: username, ФИО, Группа and Подгруппа for students, username and ФИО for
+teachers.
+"""
+import argparse
+import contextlib
+import csv
+import os
+import sys
+
+from .bot.storage.spreadsheet.auth.auth_spreadsheet_handler import AuthSpreadsheetHandler
+from .tools.config.config import Config
+
+
+def _open(path: str, mode: str):
+    if path == "-":
+        return open((sys.stdin if "r" in mode else sys.stdout).fileno(), mode, encoding="utf-8", closefd=False)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def import_roster(handler: AuthSpreadsheetHandler, people: str, path: str, batch_size: int) -> None:
+    with _open(path, "r") as csv_file:
+        records = csv.DictReader(csv_file)
+        if people == "students":
+            counts = handler.import_students(records, batch_size)
+        else:
+            counts = handler.import_teachers(records, batch_size)
+
+    print(f"Written: {counts[0]}, unchanged: {counts[1]}, invalid: {counts[2]}", file=sys.stderr)
+
+
+def export_roster(handler: AuthSpreadsheetHandler, people: str, path: str) -> None:
+    if people == "students":
+        fields, records = handler.get_student_fields(), handler.export_students()
+    else:
+        fields, records = handler.get_teacher_fields(), handler.export_teachers()
+
+    with _open(path, "w") as csv_file:
+        writer = None
+        for record in records:
+            if writer is None:
+                writer = csv.DictWriter(csv_file, fieldnames=list(record.keys()))
+                writer.writeheader()
+            writer.writerow(record)
+
+        # Empty roster is exported with header, so exported file may be imported back.
+        if writer is None:
+            csv.DictWriter(csv_file, fieldnames=fields).writeheader()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Imports roster from CSV file or exports it to CSV file.")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("people", choices=["students", "teachers"])
+    parser.add_argument("path", help="CSV file path, '-' for standard input or output")
+    parser.add_argument("--batch-size", type=int, default=500, help="rows count written by one request")
+    arguments = parser.parse_args()
+
+    settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.ini")
+    config = Config(settings_file)
+
+    # Standard output may be exported CSV file, so handler messages are sent to standard error.
+    with contextlib.redirect_stdout(sys.stderr):
+        auth_handler = AuthSpreadsheetHandler(
+            config.get_spreadsheet_option("auth_id"), config.get_spreadsheet_option("auth_token")
+        )
+    try:
+        if arguments.command == "import":
+            import_roster(auth_handler, arguments.people, arguments.path, arguments.batch_size)
+        else:
+            export_roster(auth_handler, arguments.people, arguments.path)
+    finally:
+        auth_handler.close()
@@ -35,14 +35,32 @@ class BaseConfig:
         """
         raise NotImplementedError
 
-    def get_spreadsheet_option(self, option: str) -> str:
+    def get_spreadsheet_option(self, option: str, fallback: str = None) -> str:
         """
         Gets spreadsheet options value.
 
         :param option: Config option
         :type option: :obj:`str`
 
+        :param fallback: Value returned if option isn't defined
+        :type fallback: :obj:`str`
+
         :return: Returns spreadsheet option value.
         :rtype: :obj:`str`
         """
         raise NotImplementedError
+
+    def get_storage_option(self, option: str, fallback: str = None) -> str:
+        """
+        Gets storage options value.
+
+        :param option: Config option
+        :type option: :obj:`str`
+
+        :param fallback: Value returned if option isn't defined
+        :type fallback: :obj:`str`
+
+        :return: Returns storage option value.
+        :rtype: :obj:`str`
+        """
+        raise NotImplementedError
@@ -21,5 +21,12 @@ class Config(BaseConfig):
     def get_chat_option(self, option: str) -> str:
         return self.config["Chat"][option]
 
-    def get_spreadsheet_option(self, option: str) -> str:
+    def get_spreadsheet_option(self, option: str, fallback: str = None) -> str:
+        if fallback is not None:
+            return self.config["Spreadsheet"].get(option, fallback)
         return self.config["Spreadsheet"][option]
+
+    def get_storage_option(self, option: str, fallback: str = None) -> str:
+        if fallback is not None:
+            return self.config.get("Storage", option, fallback=fallback)
+        return self.config["Storage"][option]
@@ -6,6 +6,7 @@ from ...bot.modules.factory.handlers_factory import HandlersFactory
 from ...bot.modules.factory.standard_handlers_factory import StandardHandlersFactory
 from ...bot.proctoring_bot import ProctoringBot
 from ...bot.storage.base_spreadsheet_storage import BaseSpreadsheetStorage
+from ...bot.storage.factory.async_spreadsheet_storage_factory import AsyncSpreadsheetStorageFactory
 from ...bot.storage.factory.spreadsheet_storage_factory import SpreadsheetStorageFactory
 from .base_bot_configurator import BaseBotConfigurator
 from ..config.base_config import BaseConfig
@@ -19,9 +20,18 @@ class BotConfigurator(BaseBotConfigurator):
     def __init__(self, config: BaseConfig):
         self._config = config
 
+    def _create_storage_factory(self) -> SpreadsheetStorageFactory:
+        if self._config.get_spreadsheet_option("client", "sync") == "async":
+            return AsyncSpreadsheetStorageFactory()
+        return SpreadsheetStorageFactory()
+
     def _create_storage(self) -> BaseSpreadsheetStorage:
-        storage_factory = SpreadsheetStorageFactory()
-        storage = storage_factory.create_storage()
+        storage_factory = self._create_storage_factory()
+        outbox_path = self._config.get_storage_option("outbox_path", "") or None
+        if self._config.get_storage_option("type", "memory") == "sqlite":
+            storage = storage_factory.create_storage(self._config.get_storage_option("path"), outbox_path)
+        else:
+            storage = storage_factory.create_storage(outbox_path=outbox_path)
 
         storage.visit_auth_handler(self._config_auth_handler(storage_factory))
         storage.visit_works_handler(self._config_works_handler(storage_factory))
@@ -32,14 +42,16 @@ class BotConfigurator(BaseBotConfigurator):
     def _config_auth_handler(self, storage_factory: SpreadsheetStorageFactory):
         spreadsheet_id = self._config.get_spreadsheet_option("auth_id")
         token = self._config.get_spreadsheet_option("auth_token")
+        mirror_path = self._config.get_storage_option("mirror_path", "")
 
-        return storage_factory.init_auth_handler(spreadsheet_id, token)
+        return storage_factory.init_auth_handler(spreadsheet_id, token, mirror_path or None)
 
     def _config_works_handler(self, storage_factory: SpreadsheetStorageFactory):
         spreadsheet_id = self._config.get_spreadsheet_option("works_id")
         token = self._config.get_spreadsheet_option("works_token")
+        mirror_path = self._config.get_storage_option("mirror_path", "")
 
-        return storage_factory.init_works_handler(spreadsheet_id, token)
+        return storage_factory.init_works_handler(spreadsheet_id, token, mirror_path or None)
 
     def _config_tests_handler(self, storage_factory: SpreadsheetStorageFactory):
         token = self._config.get_spreadsheet_option("tests_token")